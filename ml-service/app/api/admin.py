@@ -0,0 +1,68 @@
+from fastapi import APIRouter, Body, Header, HTTPException
+from starlette.concurrency import run_in_threadpool
+from typing import Any, Dict, Optional
+import hmac
+import logging
+import os
+
+from app.services.skill_taxonomy import (
+    TaxonomyError,
+    get_taxonomy,
+    reload_taxonomy,
+    replace_taxonomy
+)
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+# Admin endpoints are disabled unless a token is configured
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+
+def _check_token(token: Optional[str]) -> None:
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled (ADMIN_TOKEN not set)")
+    if not token or not hmac.compare_digest(token, ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+@router.get("/taxonomy")
+async def taxonomy_info(x_admin_token: Optional[str] = Header(default=None)):
+    _check_token(x_admin_token)
+    return get_taxonomy().info()
+
+
+@router.post("/taxonomy/reload")
+async def taxonomy_reload(
+    taxonomy: Optional[Dict[str, Any]] = Body(default=None),
+    x_admin_token: Optional[str] = Header(default=None)
+):
+    """
+    Reload the skill taxonomy without restarting.
+
+    Expects:
+        - X-Admin-Token header matching ADMIN_TOKEN
+        - Optional body: a complete taxonomy document. It replaces the
+          taxonomy file; without a body the file is re-read.
+
+    Returns:
+        - previous_version / version, skill and alias counts
+    """
+    _check_token(x_admin_token)
+    previous = get_taxonomy().version
+
+    try:
+        # matchers are compiled off the event loop; requests keep using the old ones meanwhile
+        if taxonomy is None:
+            loaded = await run_in_threadpool(reload_taxonomy)
+        else:
+            loaded = await run_in_threadpool(replace_taxonomy, taxonomy)
+    except TaxonomyError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except (KeyError, TypeError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid taxonomy: {str(e)}")
+    except OSError as e:
+        logger.exception("Skill taxonomy reload failed")
+        raise HTTPException(status_code=500, detail=f"Error reloading taxonomy: {str(e)}")
+
+    return {"previous_version": previous, **loaded.info()}
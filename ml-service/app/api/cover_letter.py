@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 import logging
@@ -6,6 +7,7 @@ import json
 
 from app.services.cover_letter_generator import CoverLetterGenerator
 from app.services.job_matcher import match_job_with_resume
+from app.services.job_profile import get_job_profile
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -32,6 +34,8 @@ class CoverLetterRequest(BaseModel):
     candidate_name: Optional[str] = Field(default="")
     temperature: Optional[float] = Field(default=0.7)
     max_tokens: Optional[int] = Field(default=1000)
+    # handle from /resume/job-profile; supplies job_info["job_description"]
+    job_profile_id: Optional[str] = Field(default=None)
 
 class CoverLetterResponse(BaseModel):
     company_name: str
@@ -63,15 +67,28 @@ async def generate_cover_letter(request: CoverLetterRequest):
                     detail=f"resume_analysis missing required field: {field}"
                 )
 
+        # A compiled job profile stands in for the job description text
+        job_profile = None
+        job_info = request.job_info
+        if request.job_profile_id:
+            # a profile from an older taxonomy is recompiled (spaCy + encoding)
+            job_profile = await run_in_threadpool(get_job_profile, request.job_profile_id)
+            if job_profile is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail="job_profile_id not found or expired; compile it again with /resume/job-profile"
+                )
+            job_info = {**job_info, "job_description": job_profile.job_description}
+
         # Validate job_info
         for field in ["company_name", "job_title", "job_description"]:
-            if not request.job_info.get(field):
+            if not job_info.get(field):
                 raise HTTPException(
                     status_code=400,
                     detail=f"job_info missing required field: {field}"
                 )
 
-        tone = request.job_info.get("tone", "formal")
+        tone = job_info.get("tone", "formal")
         if tone not in ["formal", "confident", "friendly"]:
             raise HTTPException(
                 status_code=400,
@@ -80,13 +97,13 @@ async def generate_cover_letter(request: CoverLetterRequest):
 
         logger.info(
             "Generating cover letter for %s - %s",
-            request.job_info["company_name"],
-            request.job_info["job_title"]
+            job_info["company_name"],
+            job_info["job_title"]
         )
 
         result = cover_letter_generator.generate_cover_letter(
             resume_analysis=request.resume_analysis,
-            job_info=request.job_info,
+            job_info=job_info,
             candidate_name=request.candidate_name,
         )
 
@@ -98,7 +115,7 @@ async def generate_cover_letter(request: CoverLetterRequest):
         if temp != 0.7 or max_tok != 1000:
             result = cover_letter_generator.generate_cover_letter(
                 resume_analysis=request.resume_analysis,
-                job_info=request.job_info,
+                job_info=job_info,
                 candidate_name=request.candidate_name,
             )
             # Note: In production, you'd modify the LLM client to accept these params
@@ -108,7 +125,8 @@ async def generate_cover_letter(request: CoverLetterRequest):
         try:
             job_match_result = match_job_with_resume(
                 resume_analysis=request.resume_analysis,
-                job_description=request.job_info["job_description"]
+                job_description=job_info["job_description"],
+                job_profile=job_profile
             )
             missing_skills = job_match_result.get("missing_skills", [])
         except Exception:
@@ -120,13 +138,15 @@ async def generate_cover_letter(request: CoverLetterRequest):
         structured_cover_letter = _ensure_json_structure(result)
 
         return {
-            "company_name": request.job_info["company_name"],
-            "job_title": request.job_info["job_title"],
+            "company_name": job_info["company_name"],
+            "job_title": job_info["job_title"],
             "tone": tone,
             "cover_letter": structured_cover_letter,
             "missing_skills": missing_skills
         }
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except ConnectionError as e:
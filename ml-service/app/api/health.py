@@ -1,4 +1,9 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.services.resume_parser import EXTRACTION_MODE
+from app.services.extraction_sandbox import sandbox_stats
+from app.services.spacy_model import is_ready, model_status
 
 #Create a router
 
@@ -9,3 +14,22 @@ async def health_check():
         "status": "ok",
         "service": "ml-service"
     }
+
+
+@router.get("/extraction")
+async def extraction_health():
+    return {
+        "mode": EXTRACTION_MODE,
+        "sandbox": sandbox_stats()
+    }
+
+
+@router.get("/ready")
+async def readiness_check():
+    # 503 until the spaCy model is loaded (or if it failed to load); with
+    # warmup disabled it is ready until a lazy load fails
+    body = {
+        "ready": is_ready(),
+        "spacy": model_status()
+    }
+    return JSONResponse(body, status_code=200 if body["ready"] else 503)
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, HTTPException, Response
+
+from app.services.analysis_cache import analysis_cache
+from app.services.extraction_cache import extraction_cache
+from app.services.metrics import (
+    CONTENT_TYPE,
+    METRICS_ENABLED,
+    register_cache,
+    render_metrics
+)
+from app.services.readability import syllable_cache_stats
+
+router = APIRouter()
+
+register_cache("extraction", extraction_cache.memory.stats)
+register_cache("extraction_disk", lambda: extraction_cache.stats()["disk"])
+register_cache("analysis", analysis_cache.memory.stats)
+register_cache("syllables", syllable_cache_stats)
+
+
+@router.get("/metrics")
+async def metrics():
+    """Prometheus text exposition of stage latencies, in-flight calls and cache hit ratios."""
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics are disabled (METRICS_ENABLED not set)")
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
@@ -1,79 +1,324 @@
 from fastapi import APIRouter,UploadFile,File,HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
+import os
+import time
 
-from app.services.resume_parser import extract_textpdf, extract_textdocs
-from app.services.resume_analyzer import get_analysis
-from app.services.ats_scorer import compute_ats_score
+from app.services.analysis_cache import analysis_cache
+from app.services.extraction_cache import extraction_cache, cached_extract
+from app.services.extraction_sandbox import ExtractionTimeout, ExtractionCrashed, SandboxBusy
+from app.services.upload_guard import (
+    SpooledUpload,
+    UploadRejected,
+    admit_upload,
+    check_declared_type,
+    spool_upload
+)
+from app.services.batch_analyzer import (
+    ANALYZE_BATCH_MAX_ITEMS,
+    ANALYZE_BATCH_WORKERS,
+    analyze_chunk,
+    get_analyze_pool,
+    iter_chunks
+)
+from app.services.incremental_analyzer import analyze_and_store, reanalyze
+from app.services.section_segmenter import SECTION_HEADERS
+from app.services.skill_taxonomy import get_taxonomy
+from app.services.readability import syllable_cache_stats
 from app.services.job_matcher import match_job_with_resume
+from app.services.job_profile import (
+    compile_job_profile,
+    describe_job_profile,
+    get_job_profile,
+    job_profile_store,
+    store_job_profile
+)
+from app.services.spacy_model import SpacyModelUnavailable
 
 router = APIRouter()
 
+# Worker pool for batch extraction; parsers run off the event loop
+BATCH_EXTRACT_WORKERS = int(os.getenv("BATCH_EXTRACT_WORKERS", "4"))
+BATCH_MAX_FILES = int(os.getenv("BATCH_MAX_FILES", "500"))
+
+batch_executor = ThreadPoolExecutor(
+    max_workers=BATCH_EXTRACT_WORKERS,
+    thread_name_prefix="batch-extract"
+)
+
 class ResumeAnalyzeRequest(BaseModel):
     content: str
+    # pre-segmented sections from /extract-text, skips header detection
+    sections: Optional[Dict[str, str]] = None
+
+class BatchAnalyzeRequest(BaseModel):
+    resumes: List[ResumeAnalyzeRequest]
+
+class IncrementalAnalyzeRequest(BaseModel):
+    analysis_id: str
+    changed_sections: Dict[str, str]
 
 class JobMatchRequest(BaseModel):
     resume_analysis: dict
+    job_description: Optional[str] = None
+    # handle from /job-profile, used instead of job_description
+    job_profile_id: Optional[str] = None
+
+class JobProfileRequest(BaseModel):
     job_description: str
 
 @router.post("/extract-text")
 async def extract_text(file: UploadFile = File(...)):
 
     try:
-        if not file.filename:
-            raise HTTPException(status_code=400, detail="Unable to access the filename")
-        
-        extension = file.filename.split(".")[-1].lower()
+        # admission checks run before anything is parsed
+        extension = check_declared_type(file.filename, file.content_type)
 
-        #read
-        content = await file.read()
-
-        if extension=='pdf':
-            text = extract_textpdf(content)
-        elif extension == "docx":
-            text = extract_textdocs(content)
-        else:
-            raise HTTPException(status_code=422, detail="Unsupported file format. Please upload PDF or DOCX.")
-        
-        if file.content_type not in (
-            "application/pdf",
-            "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-        ):
-            raise HTTPException(status_code=422, detail="Invalid file type")
+        # flushing, spilling to disk and mapping are blocking file I/O
+        upload = await run_in_threadpool(spool_upload, file.file)
+        with upload:
+            # parsing runs off the event loop (and in a sandbox worker if configured)
+            await run_in_threadpool(admit_upload, upload, extension)
+            extracted = await run_in_threadpool(
+                cached_extract, upload.buffer, extension, file.filename
+            )
         
         return{
             "filename": file.filename,
-            "text": text.strip()
+            "text": extracted["text"].strip(),
+            "sections": extracted["sections"]
         }
+    except UploadRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except (ExtractionTimeout, ExtractionCrashed) as e:
+        raise HTTPException(status_code=422, detail=f"Unable to process file: {str(e)}")
+    except SandboxBusy as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
 
 
+def _extract_batch_item(index: int, filename: Optional[str], extension: str, upload: SpooledUpload) -> dict:
+    """Extract one file of a batch; failures are reported in the result instead of raised."""
+    result = {"index": index, "filename": filename}
+
+    try:
+        admit_upload(upload, extension)
+        extracted = cached_extract(upload.buffer, extension, label=filename)
+        result["text"] = extracted["text"].strip()
+        result["sections"] = extracted["sections"]
+    except UploadRejected as e:
+        result["error"] = e.detail
+    except (ExtractionTimeout, ExtractionCrashed) as e:
+        result["error"] = f"Unable to process file: {str(e)}"
+    except SandboxBusy as e:
+        result["error"] = str(e)
+    except Exception as e:
+        result["error"] = f"Error processing file: {str(e)}"
+    finally:
+        upload.close()
+
+    return result
+
+
+@router.post("/extract-text/batch")
+async def extract_text_batch(files: List[UploadFile] = File(...)):
+    """
+    Extract text from many resumes in one multipart request.
+
+    Files are parsed concurrently on a worker pool and streamed back as
+    NDJSON, one line per file in completion order. Each line carries the
+    file's `index` in the upload and either `text` or `error`.
+    """
+    if len(files) > BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many files in one batch (max {BATCH_MAX_FILES})"
+        )
+
+    # map everything up front; the uploads are closed once the handler returns
+    accepted = []
+    rejected = []
+    try:
+        for index, file in enumerate(files):
+            try:
+                extension = check_declared_type(file.filename, file.content_type)
+                # flushing, spilling to disk and mapping are blocking file I/O
+                upload = await run_in_threadpool(spool_upload, file.file)
+                accepted.append((index, file.filename, extension, upload))
+            except UploadRejected as e:
+                rejected.append({"index": index, "filename": file.filename, "error": e.detail})
+            finally:
+                # the mapping outlives the spooled file, so it can go now
+                await file.close()
+    except BaseException:
+        for *_, upload in accepted:
+            upload.close()
+        raise
+
+    # submitted before streaming starts: each task closes its upload, even if
+    # the client disconnects before reading any results
+    loop = asyncio.get_running_loop()
+    pending = [
+        loop.run_in_executor(batch_executor, _extract_batch_item, *item)
+        for item in accepted
+    ]
+
+    async def results():
+        for result in rejected:
+            yield json.dumps(result) + "\n"
+        for next_done in asyncio.as_completed(pending):
+            yield json.dumps(await next_done) + "\n"
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+
+@router.get("/cache/stats")
+async def cache_stats():
+    return {
+        "extraction": extraction_cache.stats(),
+        "analysis": analysis_cache.stats(),
+        "syllables": syllable_cache_stats(),
+        "job_profiles": job_profile_store.stats()
+    }
+
+
 @router.post("/analyze")
 async def analyze_text(request: ResumeAnalyzeRequest):
     try:
-        content = request.content
+        return await run_in_threadpool(
+            analyze_and_store, request.content, sections=request.sections
+        )
 
-        analysis = get_analysis(content)
-        ats = compute_ats_score(analysis, content)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error analyzing content: {str(e)}")
 
-        analysis.pop("raw_sections")
-        
-        return {
-            **analysis,
-            **ats
-        }
 
-        
-        
+@router.post("/analyze/batch")
+async def analyze_batch(request: BatchAnalyzeRequest):
+    """
+    Analyze many resume texts on the process pool.
+
+    Inputs are chunked across worker processes and streamed back as NDJSON
+    in input order, one line per resume (`index` plus the /analyze fields,
+    or `error`). The last line is a summary with throughput.
+    """
+    if len(request.resumes) > ANALYZE_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many resumes in one batch (max {ANALYZE_BATCH_MAX_ITEMS})"
+        )
+
+    items = [resume.model_dump() for resume in request.resumes]
+    pool = get_analyze_pool()
+    taxonomy_version = get_taxonomy().version
+
+    async def results():
+        started = time.perf_counter()
+        errors = 0
+        # every chunk is queued up front; awaiting them in order keeps output ordered
+        pending = [
+            asyncio.wrap_future(pool.submit(analyze_chunk, start, chunk, taxonomy_version))
+            for start, chunk in iter_chunks(items)
+        ]
+        for chunk in pending:
+            for result in await chunk:
+                errors += "error" in result
+                yield json.dumps(result) + "\n"
+
+        elapsed = time.perf_counter() - started
+        yield json.dumps({
+            "summary": {
+                "count": len(items),
+                "errors": errors,
+                "chunks": len(pending),
+                "workers": ANALYZE_BATCH_WORKERS,
+                "seconds": round(elapsed, 3),
+                "resumes_per_second": round(len(items) / elapsed, 2) if elapsed else 0.0,
+            }
+        }) + "\n"
 
+    return StreamingResponse(results(), media_type="application/x-ndjson")
 
+
+@router.post("/analyze/incremental")
+async def analyze_incremental(request: IncrementalAnalyzeRequest):
+    """
+    Re-analyze an edited resume.
+
+    Expects:
+        - analysis_id: Handle returned by /analyze
+        - changed_sections: Section key -> new section text
+
+    Returns:
+        - analysis_id: Same handle, now pointing at the updated analysis
+        - delta: Only the fields and ATS breakdown entries that changed
+    """
+    try:
+        unknown = set(request.changed_sections) - set(SECTION_HEADERS)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown sections: {', '.join(sorted(unknown))}"
+            )
+
+        result = reanalyze(request.analysis_id, request.changed_sections)
+        if result is None:
+            raise HTTPException(
+                status_code=404,
+                detail="analysis_id not found or expired; run /analyze again"
+            )
+
+        return result
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error analyzing content: {str(e)}")
 
 
+@router.post("/job-profile")
+async def create_job_profile(request: JobProfileRequest):
+    """
+    Compile a job description once for matching against many resumes.
+    
+    Expects:
+        - job_description: Raw job description text
+    
+    Returns:
+        - job_profile_id: Handle for /job-match and cover letter requests
+        - skills: Extracted job skills
+        - taxonomy_version: Skill taxonomy the profile was compiled with
+        - expires_in: Seconds the profile is kept after its last use
+    """
+    try:
+        if not request.job_description or not request.job_description.strip():
+            raise HTTPException(
+                status_code=400,
+                detail="job_description cannot be empty"
+            )
+
+        profile = await run_in_threadpool(compile_job_profile, request.job_description)
+        return describe_job_profile(store_job_profile(profile), profile)
+
+    except HTTPException:
+        raise
+    except SpacyModelUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error compiling job profile: {str(e)}"
+        )
+
+
 @router.post("/job-match")
 async def job_match(request: JobMatchRequest):
     """
@@ -81,7 +326,8 @@ async def job_match(request: JobMatchRequest):
     
     Expects:
         - resume_analysis: Output from /analyze endpoint (with 'skills' and 'ats_score')
-        - job_description: Raw job description text
+        - job_description: Raw job description text, or
+        - job_profile_id: Handle returned by /job-profile
     
     Returns:
         - job_fit_score: Overall job fit score (0-100)
@@ -99,7 +345,16 @@ async def job_match(request: JobMatchRequest):
                 detail="resume_analysis is required"
             )
         
-        if not request.job_description or not request.job_description.strip():
+        job_profile = None
+        if request.job_profile_id:
+            # a profile from an older taxonomy is recompiled (spaCy + encoding)
+            job_profile = await run_in_threadpool(get_job_profile, request.job_profile_id)
+            if job_profile is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail="job_profile_id not found or expired; run /job-profile again"
+                )
+        elif not request.job_description or not request.job_description.strip():
             raise HTTPException(
                 status_code=400,
                 detail="job_description cannot be empty"
@@ -121,13 +376,16 @@ async def job_match(request: JobMatchRequest):
         # Perform job matching
         result = match_job_with_resume(
             resume_analysis=request.resume_analysis,
-            job_description=request.job_description
+            job_description=request.job_description,
+            job_profile=job_profile
         )
         
         return result
     
     except HTTPException:
         raise
+    except SpacyModelUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -1,7 +1,11 @@
 import os
-from fastapi import FastAPI
+import time
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from app.api import resume,health,cover_letter
+from app.api import resume,health,cover_letter,admin,metrics
+from app.services.metrics import METRICS_ENABLED, http_in_flight, observe_request, route_templates
+from app.services.skill_taxonomy import start_taxonomy_watcher
+from app.services.spacy_model import start_warmup
 
 app = FastAPI(title = "CareerCraft ML Service")
 
@@ -17,6 +21,34 @@ app.add_middleware(
 app.include_router(health.router, prefix="/health", tags=["System"])
 app.include_router(resume.router, prefix="/resume", tags=["Extraction"])
 app.include_router(cover_letter.router, prefix="/cover-letter", tags=["Cover Letter"])
+app.include_router(admin.router, prefix="/admin", tags=["Admin"])
+app.include_router(metrics.router, tags=["System"])
+
+if METRICS_ENABLED:
+    @app.middleware("http")
+    async def record_request_metrics(request: Request, call_next):
+        http_in_flight.inc()
+        started = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            http_in_flight.dec()
+            # label by route template, not raw path, to keep cardinality bounded
+            route = route_templates.resolve(request.app, request.url.path)
+            observe_request(request.method, route, status, time.perf_counter() - started)
+
+@app.on_event("startup")
+async def watch_taxonomy():
+    # reloads the skill taxonomy when its file changes (SKILL_TAXONOMY_WATCH_SECONDS)
+    start_taxonomy_watcher()
+
+@app.on_event("startup")
+async def warm_up_spacy():
+    # loads the spaCy model in the background (SPACY_WARMUP); /health/ready reports when it is done
+    start_warmup()
 
 @app.get("/")
 async def root():
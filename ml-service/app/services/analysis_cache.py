@@ -0,0 +1,121 @@
+"""
+Analysis Cache Service
+Caches resume analysis results by normalized content.
+
+Keys are the SHA-256 of the normalized text (and any pre-segmented
+sections) plus a version stamp built from the scorer, skill matcher, skill
+taxonomy and keyword model versions. When any of them changes, old entries
+are dropped on the next lookup instead of being served.
+"""
+
+from typing import Dict, Optional, Tuple
+import hashlib
+import json
+import os
+import threading
+
+from app.services.ats_scorer import SCORER_VERSION, compute_ats_score
+from app.services.cache import LRUCache
+from app.services.keyword_model import keyword_model_version
+from app.services.resume_analyzer import get_analysis
+from app.services.skill_matcher import MATCHER_VERSION
+from app.services.skill_taxonomy import get_taxonomy, pinned_taxonomy
+
+ANALYSIS_CACHE_MAX_BYTES = int(os.getenv("ANALYSIS_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "5000"))
+
+
+def analysis_version() -> str:
+    """Version stamp of everything that can change an analysis result."""
+    return (
+        f"s{SCORER_VERSION}-m{MATCHER_VERSION}-t{get_taxonomy().version}"
+        f"-k{keyword_model_version()}"
+    )
+
+
+def normalize_content(content: str) -> str:
+    """Canonical form of resume text: unified line endings, no outer whitespace."""
+    return content.replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
+def analysis_key(content: str, sections: Optional[Dict[str, str]] = None) -> str:
+    """
+    Build the cache key for an analysis request.
+
+    Args:
+        content: Normalized resume text
+        sections: Pre-segmented sections passed with the request, if any
+
+    Returns:
+        Hex digest of the inputs, suffixed with the analysis version
+    """
+    digest = hashlib.sha256(content.encode("utf-8"))
+    if sections is not None:
+        digest.update(b"\0")
+        digest.update(json.dumps(sections, sort_keys=True).encode("utf-8"))
+    return f"{digest.hexdigest()}-{analysis_version()}"
+
+
+def _entry_size(entry: Dict) -> int:
+    return len(json.dumps(entry, default=str).encode("utf-8"))
+
+
+class AnalysisCache:
+    """LRU cache of (analysis, ats) pairs that empties itself on a version change."""
+
+    def __init__(self, max_bytes: int, max_entries: int):
+        self.memory = LRUCache(max_bytes, max_entries=max_entries, sizeof=_entry_size)
+        self._lock = threading.Lock()
+        self.version = analysis_version()
+        self.invalidations = 0
+
+    def _check_version(self) -> None:
+        current = analysis_version()
+        if current == self.version:
+            return
+        with self._lock:
+            if current != self.version:
+                self.memory.clear()
+                self.version = current
+                self.invalidations += 1
+
+    def get(self, key: str) -> Optional[Dict]:
+        self._check_version()
+        return self.memory.get(key)
+
+    def put(self, key: str, entry: Dict) -> None:
+        self._check_version()
+        self.memory.put(key, entry)
+
+    def stats(self) -> Dict:
+        return {
+            "version": self.version,
+            "invalidations": self.invalidations,
+            "memory": self.memory.stats(),
+        }
+
+
+analysis_cache = AnalysisCache(ANALYSIS_CACHE_MAX_BYTES, ANALYSIS_CACHE_MAX_ENTRIES)
+
+
+def cached_analysis(content: str, sections: Optional[Dict[str, str]] = None) -> Tuple[str, Dict, Dict]:
+    """
+    Analyze and score resume text, going through the shared analysis cache.
+
+    Returns:
+        (normalized content, analysis, ats result). Cached values are shared;
+        callers must not mutate them in place.
+    """
+    content = normalize_content(content)
+
+    # one taxonomy version for the key, the extractors and the scorer
+    with pinned_taxonomy():
+        key = analysis_key(content, sections)
+        entry = analysis_cache.get(key)
+
+        if entry is None:
+            analysis = get_analysis(content, sections=sections)
+            entry = {"analysis": analysis, "ats": compute_ats_score(analysis, content)}
+            analysis_cache.put(key, entry)
+
+    return content, entry["analysis"], entry["ats"]
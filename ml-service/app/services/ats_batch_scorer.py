@@ -0,0 +1,288 @@
+"""
+Batch ATS Scorer
+Scores many analyzed resumes at once, e.g. to re-score stored resumes after
+a rubric change.
+
+Per-resume work is limited to what needs the text (the TextStats scan) and
+the analysis dicts (collecting skills and sections). Everything else runs on
+arrays: keyword counts of all resumes form one sparse term matrix over a
+shared vocabulary, TF-IDF weighting is a single transform of that matrix,
+and every rubric threshold table is applied with `np.searchsorted`.
+
+Results are exactly what `compute_ats_score` returns for each resume.
+"""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+from scipy import sparse
+
+from app.services.ats_scorer import (
+    FILLER_TIERS,
+    FLESCH_TIERS,
+    KEYWORD_DENSITY_TIERS,
+    KEYWORD_PRESENCE_TIERS,
+    PARAGRAPH_DENSITY_TIERS,
+    REQUIRED_SECTIONS,
+    SECTION_RAW_SCORE,
+    SECTION_STRUCTURED_SCORE,
+    SENTENCE_LENGTH_TIERS,
+    SKILL_COUNT_TIERS,
+    SKILL_DIVERSITY_TIERS,
+    SKILL_REUSE_TIERS,
+    TOP_KEYWORDS,
+    Tiers,
+    assemble_ats_result,
+    normalize_token
+)
+from app.services.keyword_model import get_keyword_model
+from app.services.skill_taxonomy import SkillTaxonomy, get_taxonomy
+from app.services.text_stats import TextStats, compute_text_stats
+
+
+def tier_scores(values: np.ndarray, tiers: Tiers) -> np.ndarray:
+    """Vectorized `tier_score`."""
+    positions = np.searchsorted(np.asarray(tiers.bounds), values, side=tiers.side)
+    return np.asarray(tiers.scores)[positions]
+
+
+def _ratios(counts: np.ndarray, totals: np.ndarray) -> np.ndarray:
+    return counts / np.maximum(totals, 1)
+
+
+def _binary_matrix(rows: List[int], cols: List[int], shape: tuple) -> sparse.csr_matrix:
+    matrix = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int64), (rows, cols)), shape=shape
+    )
+    matrix.data[:] = 1
+    return matrix
+
+
+# --- SECTIONS ---
+def section_scores(analyses: Sequence[dict]) -> np.ndarray:
+    # 0 = no section, 1 = structured content, 2 = raw text only
+    states = np.zeros((len(analyses), len(REQUIRED_SECTIONS)), dtype=np.int8)
+    for i, analysis in enumerate(analyses):
+        for j, section in enumerate(REQUIRED_SECTIONS):
+            if not analysis["sections"].get(section):
+                continue
+            content = analysis.get(section)
+            if content and isinstance(content, list):
+                states[i, j] = 1
+            elif analysis["raw_sections"].get(section):
+                states[i, j] = 2
+
+    points = np.select(
+        [states == 1, states == 2],
+        [SECTION_STRUCTURED_SCORE, SECTION_RAW_SCORE],
+        0.0
+    )
+    return points.sum(axis=1)
+
+
+# --- SKILLS ---
+def skill_scores(analyses: Sequence[dict], taxonomy: SkillTaxonomy) -> np.ndarray:
+    n = len(analyses)
+    category_ids = {name: index for index, name in enumerate(taxonomy.ats_category_names)}
+    skill_categories: Dict[str, int] = {}
+
+    counts = np.zeros(n, dtype=np.int64)
+    reused = np.zeros(n, dtype=np.int64)
+    rows: List[int] = []
+    cols: List[int] = []
+
+    for i, analysis in enumerate(analyses):
+        skills = analysis["skills"]
+        counts[i] = len(skills)
+
+        text = (
+            analysis["raw_sections"].get("experience", "") +
+            analysis["raw_sections"].get("projects", "")
+        ).lower()
+        reused[i] = sum(1 for s in skills if s in text)
+
+        for skill in skills:
+            if skill not in skill_categories:
+                category = taxonomy.ats_category(skill)
+                skill_categories[skill] = category_ids[category] if category else -1
+            category_id = skill_categories[skill]
+            if category_id >= 0:
+                rows.append(i)
+                cols.append(category_id)
+
+    categories_covered = _binary_matrix(rows, cols, (n, len(category_ids))).getnnz(axis=1)
+
+    return (
+        tier_scores(counts, SKILL_COUNT_TIERS)
+        + tier_scores(categories_covered, SKILL_DIVERSITY_TIERS)
+        + tier_scores(_ratios(reused, counts), SKILL_REUSE_TIERS)
+    )
+
+
+# --- KEYWORDS ---
+def term_matrix(stats: Sequence[TextStats]) -> tuple:
+    """(counts, vocabulary): documents x terms, columns in alphabetical term order."""
+    vocabulary = sorted(set().union(*(s.term_counts for s in stats)))
+    columns = {term: index for index, term in enumerate(vocabulary)}
+
+    indptr = [0]
+    indices: List[int] = []
+    data: List[int] = []
+    for s in stats:
+        row = sorted(columns[term] for term in s.term_counts)
+        indices.extend(row)
+        data.extend(s.term_counts[vocabulary[col]] for col in row)
+        indptr.append(len(indices))
+
+    counts = sparse.csr_matrix(
+        (np.array(data, dtype=np.int64), np.array(indices, dtype=np.int64), np.array(indptr)),
+        shape=(len(stats), len(vocabulary))
+    )
+    return counts, vocabulary
+
+
+def top_keyword_mask(counts: sparse.csr_matrix, vocabulary: List[str], top_k: int) -> np.ndarray:
+    """
+    Mark the stored entries of `counts` that are among their row's top keywords.
+
+    Same selection as `ats_scorer.top_keywords`, row by row.
+    """
+    keep = np.zeros(counts.nnz, dtype=bool)
+    row_ids = np.repeat(np.arange(counts.shape[0]), np.diff(counts.indptr))
+    model = get_keyword_model()
+
+    if model is not None:
+        # one TF-IDF transform for the whole matrix
+        idf = np.array([model.idf.get(term, model.unseen_idf) for term in vocabulary])
+        weights = counts.data * idf[counts.indices]
+
+        # rank within each row by weight, ties by term (= column order)
+        order = np.lexsort((counts.indices, -weights, row_ids))
+        ranks = np.arange(counts.nnz) - counts.indptr[row_ids[order]]
+        keep[order[ranks < top_k]] = True
+        return keep
+
+    # no model: most frequent terms per row. Rows that fit keep everything;
+    # the rest use the same argsort as the per-document path, so ties
+    # resolve identically.
+    sizes = np.diff(counts.indptr)
+    keep[sizes[row_ids] <= top_k] = True
+    for row in np.flatnonzero(sizes > top_k):
+        start = counts.indptr[row]
+        row_counts = counts.data[start:counts.indptr[row + 1]]
+        keep[start + (-row_counts).argsort()[:top_k]] = True
+    return keep
+
+
+def keyword_scores(analyses: Sequence[dict], stats: Sequence[TextStats], top_k: int = TOP_KEYWORDS) -> np.ndarray:
+    n = len(stats)
+    counts, vocabulary = term_matrix(stats)
+    columns = {term: index for index, term in enumerate(vocabulary)}
+
+    normalized_columns: Dict[str, List[int]] = {}
+    for index, term in enumerate(vocabulary):
+        normalized_columns.setdefault(normalize_token(term), []).append(index)
+
+    # per resume: which vocabulary terms are skills (exact / normalized),
+    # and which appear at least twice as keyword-density tokens
+    exact_rows, exact_cols = [], []
+    normalized_rows, normalized_cols = [], []
+    repeated_rows, repeated_cols = [], []
+    for i, (analysis, s) in enumerate(zip(analyses, stats)):
+        skills = analysis["skills"]
+        for skill in set(skills):
+            if skill in columns:
+                exact_rows.append(i)
+                exact_cols.append(columns[skill])
+        for normalized in {normalize_token(skill) for skill in skills}:
+            for col in normalized_columns.get(normalized, ()):
+                normalized_rows.append(i)
+                normalized_cols.append(col)
+        for word, count in s.word_counts.items():
+            if count >= 2 and word in columns:
+                repeated_rows.append(i)
+                repeated_cols.append(columns[word])
+
+    shape = (n, len(vocabulary))
+    keywords = counts.copy()
+    keywords.data = top_keyword_mask(counts, vocabulary, top_k).astype(np.int64)
+    keywords.eliminate_zeros()
+
+    def keyword_hits(rows: List[int], cols: List[int]) -> np.ndarray:
+        hits = keywords.multiply(_binary_matrix(rows, cols, shape)).sum(axis=1)
+        return np.asarray(hits).ravel()
+
+    n_keywords = keywords.getnnz(axis=1)
+    presence = keyword_hits(normalized_rows, normalized_cols)
+    repeated = keyword_hits(repeated_rows, repeated_cols)
+    technical = keyword_hits(exact_rows, exact_cols)
+
+    scores = (
+        tier_scores(presence, KEYWORD_PRESENCE_TIERS)
+        + tier_scores(_ratios(repeated, n_keywords), KEYWORD_DENSITY_TIERS)
+        + tier_scores(_ratios(technical, n_keywords), FILLER_TIERS)
+    )
+    blank = np.array([s.is_blank for s in stats], dtype=bool)
+    return np.where(blank, 0, scores)
+
+
+# --- READABILITY ---
+def _average_lengths(lengths: Sequence[List[int]], tiers: Tiers) -> np.ndarray:
+    totals = np.array([sum(l) for l in lengths], dtype=np.int64)
+    counts = np.array([len(l) for l in lengths], dtype=np.int64)
+    scores = tier_scores(_ratios(totals, counts), tiers)
+    return np.where(counts > 0, scores, 0)
+
+
+def readability_scores(stats: Sequence[TextStats]) -> np.ndarray:
+    flesch = np.array([s.flesch_reading_ease for s in stats], dtype=np.float64)
+    scores = (
+        tier_scores(flesch, FLESCH_TIERS)
+        + _average_lengths([s.sentence_lengths for s in stats], SENTENCE_LENGTH_TIERS)
+        + _average_lengths([s.paragraph_lengths for s in stats], PARAGRAPH_DENSITY_TIERS)
+    )
+    blank = np.array([s.is_blank for s in stats], dtype=bool)
+    return np.where(blank, 0, scores)
+
+
+def score_batch(analyses: Sequence[dict], stats: Sequence[TextStats]) -> List[dict]:
+    """`compute_ats_scores` for texts that have already been scanned."""
+    taxonomy = get_taxonomy()
+
+    breakdowns = zip(
+        section_scores(analyses).tolist(),
+        skill_scores(analyses, taxonomy).tolist(),
+        keyword_scores(analyses, stats).tolist(),
+        readability_scores(stats).tolist(),
+    )
+    return [
+        assemble_ats_result(analysis, {
+            "sections": sections,
+            "skills": skills,
+            "keywords": keywords,
+            "readability": readability,
+        })
+        for analysis, (sections, skills, keywords, readability) in zip(analyses, breakdowns)
+    ]
+
+
+def compute_ats_scores(analyses: Sequence[dict], contents: Sequence[str]) -> List[dict]:
+    """
+    Score many resumes in one pass.
+
+    Args:
+        analyses: `get_analysis` results
+        contents: The resume texts, in the same order
+
+    Returns:
+        One `compute_ats_score` result per resume, in input order
+
+    Raises:
+        ValueError: if the two sequences differ in length
+    """
+    if len(analyses) != len(contents):
+        raise ValueError("analyses and contents must have the same length")
+    if not analyses:
+        return []
+
+    return score_batch(analyses, [compute_text_stats(content) for content in contents])
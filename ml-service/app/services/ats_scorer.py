@@ -1,13 +1,51 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from collections import Counter
-import re
-from textstat.textstat import textstat
-
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple, Optional
+import numpy as np
+from app.services.keyword_model import get_keyword_model
+from app.services.metrics import stage, timed
+from app.services.skill_taxonomy import get_taxonomy
+from app.services.text_stats import TextStats, compute_text_stats
+
+# Bump when scoring logic changes; cached analyses are keyed on it
+SCORER_VERSION = "1"
+
+
+class Tiers(NamedTuple):
+    """
+    Threshold table: a value scores `scores[i]` where i is its position
+    among `bounds` (numpy searchsorted semantics). side="right" means a value
+    equal to a bound reaches that tier (>=); side="left" means it does not
+    (> for rising, <= for falling tables).
+    """
+    bounds: tuple
+    scores: tuple
+    side: str = "right"
+
+
+def tier_score(value: float, tiers: Tiers) -> float:
+    search = bisect_right if tiers.side == "right" else bisect_left
+    return tiers.scores[search(tiers.bounds, value)]
+
+
+# Scoring rubric. The batch scorer (ats_batch_scorer) applies the same tables.
+SKILL_COUNT_TIERS = Tiers((6, 10, 15), (5, 10, 13, 15))
+SKILL_DIVERSITY_TIERS = Tiers((2, 3, 4), (2, 4, 6, 8))
+SKILL_REUSE_TIERS = Tiers((0.2, 0.4, 0.6), (1, 3, 5, 7), side="left")
+KEYWORD_PRESENCE_TIERS = Tiers((3, 5, 8), (2, 4, 7, 10))
+KEYWORD_DENSITY_TIERS = Tiers((0.3, 0.5), (2, 4, 6), side="left")
+FILLER_TIERS = Tiers((0.25, 0.4), (1, 2, 4), side="left")
+FLESCH_TIERS = Tiers((30, 40, 50), (2, 5, 8, 10))
+SENTENCE_LENGTH_TIERS = Tiers((20, 25), (5, 3, 1), side="left")
+PARAGRAPH_DENSITY_TIERS = Tiers((80, 120), (5, 3, 1), side="left")
+
+REQUIRED_SECTIONS = ("skills", "education", "experience", "projects")
+# per required section: structured content found / only raw text found
+SECTION_STRUCTURED_SCORE = 7.5
+SECTION_RAW_SCORE = 3.5
+TOP_KEYWORDS = 30
 
 # --- SECTION ---
 def score_section_completeness(analysis: dict) -> float:
-    REQUIRED_SECTIONS = ["skills", "education", "experience", "projects"]
-
     score = 0.0
 
     for section in REQUIRED_SECTIONS:
@@ -17,51 +55,24 @@ def score_section_completeness(analysis: dict) -> float:
 
             # non-empty structured content
             if content and isinstance(content, list) and len(content) > 0:
-                score += 7.5
+                score += SECTION_STRUCTURED_SCORE
             # raw section exists but poorly populated
             elif analysis["raw_sections"].get(section):
-                score += 3.5
-
-    return score
+                score += SECTION_RAW_SCORE
 
     return score
 
 # --- SKILLS ---
 def score_skill_count(skills: list[str]) -> float:
-    n = len(skills)
-
-    if n < 6:
-        return 5
-    elif n < 10:
-        return 10
-    elif n < 15:
-        return 13
-    else:
-        return 15
-
-SKILL_CATEGORIES = {
-    "languages": {"c", "c++", "c#", "python", "javascript", "sql", "kotlin"},
-    "frameworks": {"fastapi", "react", "flutter", "express"},
-    "databases": {"mongodb", "firebase"},
-    "tools": {"git", "github", "postman", "vs code", "aws", "docker", "faiss"}
-}
+    return tier_score(len(skills), SKILL_COUNT_TIERS)
 
 def score_skill_diversity(skills: list[str]) -> float:
-    present = set(skills)
-    categories_covered = 0
-
-    for group in SKILL_CATEGORIES.values():
-        if present & group:
-            categories_covered += 1
-
-    if categories_covered >= 4:
-        return 8
-    elif categories_covered == 3:
-        return 6
-    elif categories_covered == 2:
-        return 4
-    else:
-        return 2
+    taxonomy = get_taxonomy()
+    categories_covered = len({
+        taxonomy.ats_category(skill) for skill in skills
+    } - {None})
+
+    return tier_score(categories_covered, SKILL_DIVERSITY_TIERS)
 
 def score_skill_reuse(skills: list[str], analysis: dict) -> float:
     text = (
@@ -73,14 +84,7 @@ def score_skill_reuse(skills: list[str], analysis: dict) -> float:
 
     ratio = reused / max(len(skills), 1)
 
-    if ratio > 0.6:
-        return 7
-    elif ratio > 0.4:
-        return 5
-    elif ratio > 0.2:
-        return 3
-    else:
-        return 1
+    return tier_score(ratio, SKILL_REUSE_TIERS)
 
 def score_skills(analysis: dict) -> float:
     skills = analysis["skills"]
@@ -93,14 +97,24 @@ def score_skills(analysis: dict) -> float:
 
 
 # --- KEYWORD ---
-def extract_top_keywords(text: str, top_k: int = 30) -> list[str]:
-    vectorizer = TfidfVectorizer(
-        stop_words="english",
-        max_features=top_k
-    )
+def top_keywords(stats: TextStats, top_k: int = TOP_KEYWORDS) -> list[str]:
+    # corpus-fitted IDF when a keyword model has been built (see keyword_model)
+    model = get_keyword_model()
+    if model is not None:
+        return model.top_keywords_from_counts(stats.term_counts, top_k)
+
+    # fallback: what TfidfVectorizer(max_features=top_k) fitted on this one
+    # document keeps: the most frequent terms, in alphabetical order
+    terms = sorted(stats.term_counts)
+    if len(terms) <= top_k:
+        return terms
+    counts = np.array([stats.term_counts[term] for term in terms], dtype=np.int64)
+    keep = np.sort((-counts).argsort()[:top_k])
+    return [terms[i] for i in keep]
+
 
-    tfidf = vectorizer.fit_transform([text])
-    return vectorizer.get_feature_names_out().tolist()
+def extract_top_keywords(text: str, top_k: int = TOP_KEYWORDS) -> list[str]:
+    return top_keywords(compute_text_stats(text), top_k)
 
 
 def normalize_token(s: str) -> str:
@@ -111,29 +125,16 @@ def score_keyword_presence(keywords: list[str], skills: list[str]) -> float:
     skill_set = {normalize_token(s) for s in skills}
     hits = sum(1 for k in keywords if normalize_token(k) in skill_set)
 
-    if hits >= 8:
-        return 10
-    elif hits >= 5:
-        return 7
-    elif hits >= 3:
-        return 4
-    else:
-        return 2
+    return tier_score(hits, KEYWORD_PRESENCE_TIERS)
 
-def score_keyword_density(text: str, keywords: list[str]) -> float:
-    words = re.findall(r"[a-z0-9]+", text.lower())
-    counts = Counter(words)
+def score_keyword_density(stats: TextStats, keywords: list[str]) -> float:
+    counts = stats.word_counts
 
     repeated = sum(1 for k in keywords if counts[k] >= 2)
 
     ratio = repeated / max(len(keywords), 1)
 
-    if ratio > 0.5:
-        return 6
-    elif ratio > 0.3:
-        return 4
-    else:
-        return 2
+    return tier_score(ratio, KEYWORD_DENSITY_TIERS)
 
 def score_filler_penalty(keywords: list[str], skills: list[str]) -> float:
     technical = set(skills)
@@ -141,87 +142,64 @@ def score_filler_penalty(keywords: list[str], skills: list[str]) -> float:
 
     ratio = tech_hits / max(len(keywords), 1)
 
-    if ratio > 0.4:
-        return 4
-    elif ratio > 0.25:
-        return 2
-    else:
-        return 1
+    return tier_score(ratio, FILLER_TIERS)
 
-def score_keyword_optimization(analysis: dict, content: str) -> float:
-    if not content or not content.strip():
+def score_keyword_optimization(analysis: dict, content: str, stats: Optional[TextStats] = None) -> float:
+    if stats is None:
+        stats = compute_text_stats(content)
+    if stats.is_blank:
         return 0
 
-    text = content.lower()
-    keywords = extract_top_keywords(text)
+    keywords = top_keywords(stats)
     skills = analysis["skills"]
 
     return (
         score_keyword_presence(keywords, skills)
-        + score_keyword_density(text, keywords)
+        + score_keyword_density(stats, keywords)
         + score_filler_penalty(keywords, skills)
     )
 
 # --- READABILITY ---
-def score_flesch(text: str) -> float:
-    score = textstat.flesch_reading_ease(text)
-
-    if score >= 50:
-        return 10
-    elif score >= 40:
-        return 8
-    elif score >= 30:
-        return 5
-    else:
-        return 2
-    
-def score_sentence_length(text: str) -> float:
-    sentences = re.split(r"[.!?]", text)
-    sentences = [s.strip() for s in sentences if s.strip()]
+def score_flesch(stats: TextStats) -> float:
+    return tier_score(stats.flesch_reading_ease, FLESCH_TIERS)
+
+def score_sentence_length(stats: TextStats) -> float:
+    sentences = stats.sentence_lengths
 
     if not sentences:
         return 0
 
-    avg_len = sum(len(s.split()) for s in sentences) / len(sentences)
+    avg_len = sum(sentences) / len(sentences)
 
-    if avg_len <= 20:
-        return 5
-    elif avg_len <= 25:
-        return 3
-    else:
-        return 1
+    return tier_score(avg_len, SENTENCE_LENGTH_TIERS)
 
-def score_paragraph_density(text: str) -> float:
-    paragraphs = [p for p in text.split("\n\n") if p.strip()]
+def score_paragraph_density(stats: TextStats) -> float:
+    paragraphs = stats.paragraph_lengths
 
     if not paragraphs:
         return 0
 
-    avg_len = sum(len(p.split()) for p in paragraphs) / len(paragraphs)
-
-    if avg_len <= 80:
-        return 5
-    elif avg_len <= 120:
-        return 3
-    else:
-        return 1
-    
-def score_readability(text: str) -> float:
-    if not text or not text.strip():
+    avg_len = sum(paragraphs) / len(paragraphs)
+
+    return tier_score(avg_len, PARAGRAPH_DENSITY_TIERS)
+
+def score_readability(text: str, stats: Optional[TextStats] = None) -> float:
+    if stats is None:
+        stats = compute_text_stats(text)
+    if stats.is_blank:
         return 0
 
     return (
-        score_flesch(text)
-        + score_sentence_length(text)
-        + score_paragraph_density(text)
+        score_flesch(stats)
+        + score_sentence_length(stats)
+        + score_paragraph_density(stats)
     )
 
 # --- FEEDBACK ---
 def feedback_sections(analysis: dict) -> list[str]:
     feedback = []
-    required = ["skills", "education", "experience", "projects"]
 
-    for sec in required:
+    for sec in REQUIRED_SECTIONS:
         if not analysis["sections"].get(sec):
             feedback.append(
                 f"Add a {sec} section to improve resume completeness and ATS visibility."
@@ -262,6 +240,7 @@ def feedback_readability(readability_score: float) -> list[str]:
         ]
     return []
 
+@timed("ats_scorer.feedback")
 def generate_feedback(
     analysis: dict,
     section_score: float,
@@ -294,29 +273,54 @@ def generate_feedback(
     return final[:5]
 
 
-def compute_ats_score(analysis: dict, content: str) -> dict:
-    section_score = score_section_completeness(analysis)
-    skill_score = score_skills(analysis)
-    keyword_score = score_keyword_optimization(analysis, content)
-    readability_score = score_readability(content)
+ATS_COMPONENTS = ("sections", "skills", "keywords", "readability")
 
-    total = section_score + skill_score + keyword_score + readability_score
+# ATS sub-scores that read each structured section. Keyword and
+# readability scores read the full text, so any edit touches them.
+SECTION_SCORE_DEPENDENCIES = {
+    "skills": {"sections", "skills"},
+    "education": {"sections"},
+    "experience": {"sections", "skills"},
+    "projects": {"sections", "skills"},
+}
+TEXT_SCORE_COMPONENTS = {"keywords", "readability"}
+
+
+def score_components(analysis: dict, content: str, components=ATS_COMPONENTS) -> dict:
+    """Compute only the requested ATS sub-scores."""
+    # the text is scanned once, and only if a text-based score is requested
+    stats = compute_text_stats(content) if TEXT_SCORE_COMPONENTS & set(components) else None
+    scorers = {
+        "sections": lambda: score_section_completeness(analysis),
+        "skills": lambda: score_skills(analysis),
+        "keywords": lambda: score_keyword_optimization(analysis, content, stats),
+        "readability": lambda: score_readability(content, stats),
+    }
+    breakdown = {}
+    for name in components:
+        with stage(f"ats_scorer.{name}"):
+            breakdown[name] = scorers[name]()
+    return breakdown
+
+
+def assemble_ats_result(analysis: dict, breakdown: dict) -> dict:
+    """Total and feedback from a full set of sub-scores."""
+    total = sum(breakdown[name] for name in ATS_COMPONENTS)
 
     feedback = generate_feedback(
         analysis,
-        section_score,
-        skill_score,
-        keyword_score,
-        readability_score
+        breakdown["sections"],
+        breakdown["skills"],
+        breakdown["keywords"],
+        breakdown["readability"]
     )
 
     return {
         "ats_score": min(100, round(total)),
-        "breakdown": {
-            "sections": section_score,
-            "skills": skill_score,
-            "keywords": keyword_score,
-            "readability": readability_score
-        },
+        "breakdown": {name: breakdown[name] for name in ATS_COMPONENTS},
         "feedback": feedback
-    }
\ No newline at end of file
+    }
+
+
+def compute_ats_score(analysis: dict, content: str) -> dict:
+    return assemble_ats_result(analysis, score_components(analysis, content))
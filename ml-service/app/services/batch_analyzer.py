@@ -0,0 +1,79 @@
+"""
+Batch Analyzer Service
+Runs resume analysis for bulk imports on a pool of worker processes.
+
+Analysis is CPU-bound pure Python, so threads would serialize on the GIL.
+Inputs are split into chunks and each chunk is analyzed in a spawned worker;
+results come back chunk by chunk in input order.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional
+import multiprocessing
+import os
+import threading
+
+from app.services.analysis_cache import cached_analysis
+from app.services.skill_taxonomy import ensure_taxonomy_version
+
+ANALYZE_BATCH_WORKERS = int(os.getenv("ANALYZE_BATCH_WORKERS", str(os.cpu_count() or 1)))
+ANALYZE_BATCH_CHUNK_SIZE = int(os.getenv("ANALYZE_BATCH_CHUNK_SIZE", "50"))
+ANALYZE_BATCH_MAX_ITEMS = int(os.getenv("ANALYZE_BATCH_MAX_ITEMS", "10000"))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_analyze_pool() -> ProcessPoolExecutor:
+    """Lazily create the shared analysis pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=ANALYZE_BATCH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+    return _pool
+
+
+def analyze_resume(content: str, sections: Optional[Dict[str, str]] = None) -> Dict:
+    """Full analysis plus ATS score, shaped like the /analyze response."""
+    _, analysis, ats = cached_analysis(content, sections=sections)
+
+    result = {**analysis, **ats}
+    result.pop("raw_sections")
+    return result
+
+
+def analyze_chunk(start: int, items: List[Dict], taxonomy_version: Optional[str] = None) -> List[Dict]:
+    """
+    Analyze one chunk of a batch in a worker process.
+
+    Args:
+        start: Batch index of the first item
+        items: Dicts with "content" and optional "sections"
+        taxonomy_version: Taxonomy version of the parent; the worker reloads
+            the taxonomy file if it is behind
+
+    Returns:
+        One result per item, tagged with its `index`; failures carry `error`
+    """
+    if taxonomy_version is not None:
+        ensure_taxonomy_version(taxonomy_version)
+
+    results = []
+    for offset, item in enumerate(items):
+        result = {"index": start + offset}
+        try:
+            result.update(analyze_resume(item["content"], sections=item.get("sections")))
+        except Exception as e:
+            result["error"] = f"Error analyzing content: {str(e)}"
+        results.append(result)
+    return results
+
+
+def iter_chunks(items: List[Dict], chunk_size: int = ANALYZE_BATCH_CHUNK_SIZE) -> Iterator[tuple]:
+    """Yield (start index, chunk) pairs covering `items` in order."""
+    chunk_size = max(1, chunk_size)
+    for start in range(0, len(items), chunk_size):
+        yield start, items[start:start + chunk_size]
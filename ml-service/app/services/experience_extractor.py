@@ -1,5 +1,6 @@
 from typing import TypedDict, Optional
-import re
+
+from app.services.line_tagger import LineTag, tag_lines
 
 class ExperienceEntry(TypedDict):
     organization: Optional[str]
@@ -7,48 +8,11 @@ class ExperienceEntry(TypedDict):
     duration: Optional[str]
     description: str
 
-ROLE_PATTERN = re.compile(
-    r"(intern|engineer|developer|analyst|software|backend|frontend|full[- ]?stack)",
-    re.IGNORECASE
-)
-
-DURATION_PATTERN = re.compile(
-    r"""
-    (                           # start date
-        (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec|
-           January|February|March|April|June|July|August|September|
-           October|November|December)?
-        \s*
-        \d{4}
-    )
-    \s*
-    (?:[-]|to|\u2013|\u2014|\s{2,})
-    \s*
-    (                           # end date
-        (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec|
-           January|February|March|April|June|July|August|September|
-           October|November|December)?
-        \s*
-        (?:\d{4}|Present|present)
-    )
-    """,
-    re.IGNORECASE | re.VERBOSE
-)
-
-
-def preprocess_lines(text: str) -> list[str]:
-    return [
-        l.strip()
-        for l in text.splitlines()
-        if l.strip()
-    ]
-
-
 def extract_experience(experience_text: str) -> list[ExperienceEntry]:
     if not experience_text:
         return []
 
-    lines = preprocess_lines(experience_text)
+    lines = tag_lines(experience_text)
 
     entries: list[ExperienceEntry] = []
     current: ExperienceEntry = {
@@ -66,30 +30,27 @@ def extract_experience(experience_text: str) -> list[ExperienceEntry]:
 
     for line in lines:
         # duration
-        match = DURATION_PATTERN.search(line)
-        if match:
-            start = match.group(1).strip()
-            end = match.group(2).strip()
-            current["duration"] = f"{start} - {end}"
+        if line.tags & LineTag.DATE_RANGE:
+            start, end = line.date_range
+            current["duration"] = f"{start.strip()} - {end.strip()}"
             continue
 
         # role
-        if ROLE_PATTERN.search(line):
-            current["role"] = line
+        if line.tags & LineTag.ROLE:
+            current["role"] = line.text
             continue
 
         # organization (short, non-sentence, before role)
         if (
             current["organization"] is None
             and current["role"] is None
-            and len(line.split()) <= 4
+            and line.word_count <= 4
         ):
-            current["organization"] = line
+            current["organization"] = line.text
             continue
 
         # description (fallback)
-        if line:
-            current["description"] += line + " "
+        current["description"] += line.text + " "
 
     flush()
     return entries
@@ -0,0 +1,228 @@
+"""
+Extraction Cache Service
+Content-addressed cache for extracted resume text and sections.
+
+Keys are the SHA-256 of the uploaded bytes plus the parser version, so a
+re-upload of the same file skips pymupdf/python-docx entirely and a parser
+change never serves stale text.
+
+Both tiers are bounded. The disk tier is LRU by file mtime (touched on every
+hit), so its order survives restarts; entries of older parser versions are
+never read again and age out first.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from app.services.cache import LRUCache
+from app.services.resume_parser import PARSER_VERSION, extract_document
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_CACHE_MAX_BYTES = int(os.getenv("EXTRACTION_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Optional persistent tier; disabled when unset
+EXTRACTION_CACHE_DIR = os.getenv("EXTRACTION_CACHE_DIR", "")
+EXTRACTION_CACHE_DISK_MAX_BYTES = int(os.getenv("EXTRACTION_CACHE_DISK_MAX_BYTES", str(1024 * 1024 * 1024)))
+# Temp files older than this were left by a writer that died; newer ones may
+# belong to another process sharing the directory
+STALE_TMP_SECONDS = 300
+
+
+def content_key(file_bytes, file_type: str) -> str:
+    """
+    Build the cache key for an upload.
+
+    Args:
+        file_bytes: Raw uploaded bytes (any buffer-protocol object)
+        file_type: Parsed format, e.g. "pdf" or "docx"
+
+    Returns:
+        Hex digest identifying bytes, format and parser version
+    """
+    digest = hashlib.sha256(file_bytes).hexdigest()
+    return f"{digest}-{file_type}-{PARSER_VERSION}"
+
+
+def _result_size(result: Dict) -> int:
+    size = len(result["text"].encode("utf-8"))
+    for text in (result.get("sections") or {}).values():
+        size += len(text.encode("utf-8"))
+    return size
+
+
+def _remove(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+class ExtractionCache:
+    """Two-tier (memory LRU + optional disk) cache of extraction results."""
+
+    def __init__(
+        self,
+        max_bytes: int,
+        cache_dir: Optional[str] = None,
+        disk_max_bytes: int = EXTRACTION_CACHE_DISK_MAX_BYTES
+    ):
+        self.memory = LRUCache(max_bytes, sizeof=_result_size)
+        self.cache_dir = cache_dir or None
+        self.disk_max_bytes = disk_max_bytes
+        self._lock = threading.Lock()
+        # key -> file size, least recently used first
+        self._disk_entries: "OrderedDict[str, int]" = OrderedDict()
+        self.disk_bytes = 0
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self.disk_writes = 0
+        self.disk_evictions = 0
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._load_disk_index()
+
+    def _path(self, key: str) -> str:
+        # two-level fan-out keeps directories small
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _load_disk_index(self) -> None:
+        """
+        Rebuild the disk tier's LRU order from file mtimes and prune it to the
+        cap. Stale temp files from interrupted writes are removed.
+        """
+        found = []
+        stale_before = time.time() - STALE_TMP_SECONDS
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    found.append((stat.st_mtime, entry.name[:-len(".json")], stat.st_size))
+                elif entry.name.endswith(".tmp") and entry.stat().st_mtime < stale_before:
+                    _remove(entry.path)
+
+        with self._lock:
+            for _, key, size in sorted(found):
+                self._disk_entries[key] = size
+                self.disk_bytes += size
+            self._evict_disk()
+
+    def _record_disk(self, key: str, size: int) -> None:
+        """Mark an entry most recently used and evict to make room. Call with the lock held."""
+        old = self._disk_entries.pop(key, None)
+        if old is not None:
+            self.disk_bytes -= old
+        self._disk_entries[key] = size
+        self.disk_bytes += size
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        while self._disk_entries and self.disk_bytes > self.disk_max_bytes:
+            key, size = self._disk_entries.popitem(last=False)
+            self.disk_bytes -= size
+            self.disk_evictions += 1
+            try:
+                os.unlink(self._path(key))
+            except FileNotFoundError:
+                pass
+            except OSError:
+                logger.exception("Failed to evict extraction cache entry %s", key)
+
+    def get(self, key: str) -> Optional[Dict]:
+        result = self.memory.get(key)
+        if result is not None or not self.cache_dir:
+            return result
+
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+            # the mtime carries the LRU order across restarts
+            os.utime(path)
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.disk_misses += 1
+                # evicted by another process sharing the directory
+                if key in self._disk_entries:
+                    self.disk_bytes -= self._disk_entries.pop(key)
+            return None
+        except (OSError, ValueError):
+            logger.exception("Failed to read extraction cache entry %s", key)
+            return None
+
+        with self._lock:
+            self.disk_hits += 1
+            self._record_disk(key, size)
+        # promote to the memory tier
+        self.memory.put(key, result)
+        return result
+
+    def put(self, key: str, result: Dict) -> None:
+        self.memory.put(key, result)
+
+        if not self.cache_dir:
+            return
+
+        path = self._path(key)
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # write-then-rename so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(result, f)
+            os.replace(tmp_path, path)
+            tmp_path = None
+            size = os.path.getsize(path)
+        except OSError:
+            logger.exception("Failed to write extraction cache entry %s", key)
+            return
+        finally:
+            # a failed write (e.g. disk full) must not leave its temp file behind
+            if tmp_path is not None:
+                _remove(tmp_path)
+
+        with self._lock:
+            self.disk_writes += 1
+            self._record_disk(key, size)
+
+    def stats(self) -> Dict:
+        return {
+            "parser_version": PARSER_VERSION,
+            "memory": self.memory.stats(),
+            "disk": {
+                "enabled": bool(self.cache_dir),
+                "entries": len(self._disk_entries),
+                "bytes": self.disk_bytes,
+                "max_bytes": self.disk_max_bytes,
+                "hits": self.disk_hits,
+                "misses": self.disk_misses,
+                "writes": self.disk_writes,
+                "evictions": self.disk_evictions,
+            },
+        }
+
+
+extraction_cache = ExtractionCache(EXTRACTION_CACHE_MAX_BYTES, EXTRACTION_CACHE_DIR)
+
+
+def cached_extract(file_bytes, file_type: str, label: str = "document") -> Dict:
+    """Extract an upload (see extract_document), going through the shared extraction cache."""
+    key = content_key(file_bytes, file_type)
+    result = extraction_cache.get(key)
+
+    if result is None:
+        result = extract_document(file_bytes, file_type, label=label)
+        extraction_cache.put(key, result)
+
+    return result
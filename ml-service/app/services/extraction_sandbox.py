@@ -0,0 +1,279 @@
+"""
+Extraction Sandbox Service
+Runs PDF/DOCX parsing in a pool of recyclable subprocess workers.
+
+Each worker runs under RLIMIT_AS and a per-task RLIMIT_CPU budget, and every
+task has a wall-clock timeout. A worker that times out, crashes or exceeds
+its limits is killed and replaced, so a hostile upload can only take down
+its own worker, never the uvicorn event loop.
+"""
+
+from typing import Dict, Optional
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+from app.services import resume_parser
+
+logger = logging.getLogger(__name__)
+
+SANDBOX_WORKERS = int(os.getenv("SANDBOX_WORKERS", "2"))
+SANDBOX_TASK_TIMEOUT = float(os.getenv("SANDBOX_TASK_TIMEOUT", "20"))
+SANDBOX_MEMORY_LIMIT_MB = int(os.getenv("SANDBOX_MEMORY_LIMIT_MB", "1024"))
+SANDBOX_CPU_SECONDS = int(os.getenv("SANDBOX_CPU_SECONDS", "15"))
+# Workers are replaced after this many tasks to shed leaked memory
+SANDBOX_MAX_TASKS_PER_WORKER = int(os.getenv("SANDBOX_MAX_TASKS_PER_WORKER", "100"))
+# How long a request waits for a free worker before it is turned away
+SANDBOX_QUEUE_TIMEOUT = float(os.getenv("SANDBOX_QUEUE_TIMEOUT", "30"))
+
+
+class ExtractionTimeout(RuntimeError):
+    """The worker did not finish within the wall-clock timeout."""
+
+
+class ExtractionCrashed(RuntimeError):
+    """The worker died while parsing (e.g. killed for exceeding a limit)."""
+
+
+class SandboxBusy(RuntimeError):
+    """No worker became free within the queue timeout, or none could be started."""
+
+
+def _apply_cpu_budget(cpu_seconds: int) -> None:
+    import resource
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = int(usage.ru_utime + usage.ru_stime) + 1
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = used + cpu_seconds
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(conn, memory_limit_bytes: int, cpu_seconds: int) -> None:
+    """Subprocess loop: receive (bytes, type, label), reply ("ok", result) or ("error", message)."""
+    if memory_limit_bytes:
+        import resource
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+
+    # daemon workers cannot start the page pool; parse pages serially
+    resume_parser.PDF_EXTRACT_WORKERS = 1
+
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+
+        file_bytes, file_type, label = task
+        if cpu_seconds:
+            # RLIMIT_CPU is cumulative, so move the soft limit per task
+            _apply_cpu_budget(cpu_seconds)
+
+        try:
+            result = resume_parser.extract_document_inline(file_bytes, file_type, label=label)
+            conn.send(("ok", result))
+        except MemoryError:
+            conn.send(("error", "Memory limit exceeded while parsing"))
+        except Exception as e:
+            conn.send(("error", str(e)))
+
+
+class _Worker:
+    def __init__(self, context, memory_limit_bytes: int, cpu_seconds: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, memory_limit_bytes, cpu_seconds),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join(timeout=1)
+        self.conn.close()
+
+
+class SandboxPool:
+    """Fixed-size pool of sandboxed extraction workers."""
+
+    def __init__(
+        self,
+        size: int = SANDBOX_WORKERS,
+        timeout: float = SANDBOX_TASK_TIMEOUT,
+        memory_limit_mb: int = SANDBOX_MEMORY_LIMIT_MB,
+        cpu_seconds: int = SANDBOX_CPU_SECONDS,
+        max_tasks_per_worker: int = SANDBOX_MAX_TASKS_PER_WORKER,
+        queue_timeout: float = SANDBOX_QUEUE_TIMEOUT,
+    ):
+        self.size = size
+        self.timeout = timeout
+        self.memory_limit_bytes = memory_limit_mb * 1024 * 1024
+        self.cpu_seconds = cpu_seconds
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.queue_timeout = queue_timeout
+
+        self._context = multiprocessing.get_context("spawn")
+        # a None slot lost its worker to a failed spawn; it is respawned on next use
+        self._idle: "queue.Queue[Optional[_Worker]]" = queue.Queue()
+        self._lock = threading.Lock()
+
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.crashes = 0
+        self.respawns = 0
+        self.recycles = 0
+        self.queue_timeouts = 0
+        self.spawn_failures = 0
+        self.busy = 0
+        self.total_seconds = 0.0
+
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        return _Worker(self._context, self.memory_limit_bytes, self.cpu_seconds)
+
+    def _respawn(self) -> Optional[_Worker]:
+        """A new worker for a slot, or None (retried on the slot's next use) if it cannot start."""
+        try:
+            return self._spawn()
+        except Exception:
+            self._count("spawn_failures")
+            logger.exception("Failed to start a sandbox worker; retrying on next use")
+            return None
+
+    def _count(self, field: str, amount=1) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + amount)
+
+    def run(self, file_bytes, file_type: str, label: str = "document") -> Dict:
+        """
+        Extract a document in a sandboxed worker.
+
+        Raises:
+            ExtractionTimeout: if the worker exceeded the wall-clock timeout
+            ExtractionCrashed: if the worker died (memory/CPU limit, segfault)
+            SandboxBusy: if no worker became free within the queue timeout,
+                or a slot's worker could not be restarted
+            RuntimeError: if the parser itself failed
+        """
+        # pipes need real bytes; mapped uploads are copied here
+        payload = file_bytes if isinstance(file_bytes, bytes) else bytes(file_bytes)
+
+        try:
+            worker = self._idle.get(timeout=self.queue_timeout)
+        except queue.Empty:
+            self._count("queue_timeouts")
+            raise SandboxBusy(f"No extraction worker became free within {self.queue_timeout:g}s")
+
+        if worker is None:
+            worker = self._respawn()
+            if worker is None:
+                self._idle.put(None)
+                raise SandboxBusy("No extraction worker could be started")
+            self._count("respawns")
+
+        # counted on the worker that runs it, before any respawn replaces it
+        worker.tasks += 1
+        self._count("busy")
+        started = time.perf_counter()
+
+        try:
+            try:
+                worker.conn.send((payload, file_type, label))
+                if not worker.conn.poll(self.timeout):
+                    self._count("timeouts")
+                    raise ExtractionTimeout(
+                        f"Parsing {label} exceeded {self.timeout:g}s"
+                    )
+                status, result = worker.conn.recv()
+            except (EOFError, OSError):
+                self._count("crashes")
+                raise ExtractionCrashed(f"Extraction worker died while parsing {label}")
+        except (ExtractionTimeout, ExtractionCrashed):
+            logger.warning("Replacing sandbox worker %s after failure on %s", worker.process.pid, label)
+            worker.kill()
+            worker = self._respawn()
+            if worker is not None:
+                self._count("respawns")
+            self._count("failed")
+            raise
+        finally:
+            # the slot goes back even if its replacement failed to start
+            if worker is not None and worker.tasks >= self.max_tasks_per_worker:
+                worker.stop()
+                worker = self._respawn()
+                self._count("recycles")
+            self._count("busy", -1)
+            self._count("total_seconds", time.perf_counter() - started)
+            self._idle.put(worker)
+
+        if status != "ok":
+            self._count("failed")
+            raise RuntimeError(result)
+
+        self._count("completed")
+        return result
+
+    def stats(self) -> Dict:
+        finished = self.completed + self.failed
+        return {
+            "workers": self.size,
+            "busy": self.busy,
+            "idle": self._idle.qsize(),
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "crashes": self.crashes,
+            "respawns": self.respawns,
+            "recycles": self.recycles,
+            "queue_timeouts": self.queue_timeouts,
+            "spawn_failures": self.spawn_failures,
+            "avg_task_seconds": round(self.total_seconds / finished, 4) if finished else 0.0,
+            "limits": {
+                "timeout_seconds": self.timeout,
+                "memory_mb": self.memory_limit_bytes // (1024 * 1024),
+                "cpu_seconds": self.cpu_seconds,
+                "max_tasks_per_worker": self.max_tasks_per_worker,
+                "queue_timeout_seconds": self.queue_timeout,
+            },
+        }
+
+
+_pool: Optional[SandboxPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_sandbox_pool() -> SandboxPool:
+    """Lazily start the shared sandbox pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SandboxPool()
+    return _pool
+
+
+def sandbox_stats() -> Optional[Dict]:
+    """Pool health, or None if no sandboxed extraction has run yet."""
+    return _pool.stats() if _pool is not None else None
@@ -0,0 +1,168 @@
+"""
+Incremental Analyzer Service
+Re-analyzes an edited resume by re-running only what an edit can change.
+
+Every full analysis is kept server-side under an `analysis_id`. An edit names
+the sections that changed; only their extractors and the ATS sub-scores that
+depend on them are recomputed, and the caller gets back a delta.
+"""
+
+from typing import Dict, Optional
+import copy
+import os
+
+from app.services.analysis_cache import cached_analysis
+from app.services.ats_scorer import (
+    ATS_COMPONENTS,
+    SECTION_SCORE_DEPENDENCIES,
+    TEXT_SCORE_COMPONENTS,
+    assemble_ats_result,
+    compute_ats_score,
+    score_components
+)
+from app.services.resume_analyzer import SECTION_EXTRACTORS, extract_skills, get_analysis
+from app.services.section_segmenter import SECTION_HEADERS, segment
+from app.services.skill_taxonomy import pinned_taxonomy
+from app.services.ttl_store import TTLStore
+
+ANALYSIS_STORE_MAX_ENTRIES = int(os.getenv("ANALYSIS_STORE_MAX_ENTRIES", "2000"))
+ANALYSIS_STORE_TTL_SECONDS = float(os.getenv("ANALYSIS_STORE_TTL_SECONDS", "3600"))
+
+analysis_store = TTLStore(ANALYSIS_STORE_MAX_ENTRIES, ANALYSIS_STORE_TTL_SECONDS)
+
+# Top-level response fields a delta can contain
+RESULT_FIELDS = (
+    "sections", "skills", "education", "experience", "projects",
+    "taxonomy_version", "ats_score", "feedback"
+)
+
+
+def store_analysis(content: str, analysis: dict, ats: dict, analysis_id: Optional[str] = None) -> str:
+    """Keep an analysis (including raw sections) for later incremental updates."""
+    return analysis_store.put(
+        {"content": content, "analysis": analysis, "ats": ats},
+        key=analysis_id
+    )
+
+
+def analyze_and_store(content: str, sections: Optional[dict] = None) -> dict:
+    """Full analysis, stored under a new `analysis_id`. Returns the response body."""
+    content, analysis, ats = cached_analysis(content, sections=sections)
+    analysis_id = store_analysis(content, analysis, ats)
+
+    result = {**analysis, **ats, "analysis_id": analysis_id}
+    result.pop("raw_sections")
+    return result
+
+
+def splice_sections(content: str, changes: Dict[str, str]) -> str:
+    """
+    Replace the body of each changed section in the full text.
+
+    Sections without a header in the text are appended under their
+    canonical header. A section split over several headers (e.g. "WORK
+    EXPERIENCE" and "INTERNSHIPS") is edited as a whole: the new text goes
+    under its first header and the later occurrences are removed.
+    """
+    pieces = []
+    cursor = 0
+    seen = set()
+
+    for span in segment(content):
+        if span.key not in changes:
+            continue
+        if span.key in seen:
+            pieces.append(content[cursor:span.header_start])
+        else:
+            pieces.append(content[cursor:span.start])
+            pieces.append(changes[span.key].strip() + "\n")
+            seen.add(span.key)
+        cursor = span.end
+    pieces.append(content[cursor:])
+
+    for key, text in changes.items():
+        if key not in seen:
+            pieces.append(f"\n\n{SECTION_HEADERS[key]}\n{text.strip()}\n")
+
+    return "".join(pieces)
+
+
+def _apply_changes(old_analysis: dict, old_ats: dict, content: str, changes: Dict[str, str]) -> tuple:
+    """Re-run only the extractors and ATS sub-scores the changed sections feed."""
+    analysis = copy.copy(old_analysis)
+    analysis["raw_sections"] = {**old_analysis["raw_sections"], **changes}
+    analysis["sections"] = {
+        **old_analysis["sections"],
+        **{key: True for key in changes}
+    }
+
+    for key in changes:
+        if key in SECTION_EXTRACTORS:
+            analysis[key] = SECTION_EXTRACTORS[key](changes[key])
+
+    # skills fall back to a full-text scan when the skills section is empty,
+    # in which case any edit can change them
+    if "skills" in changes or not analysis["raw_sections"].get("skills"):
+        analysis["skills"] = extract_skills(analysis["raw_sections"], content)
+
+    stale = set(TEXT_SCORE_COMPONENTS)
+    for key in changes:
+        stale |= SECTION_SCORE_DEPENDENCIES.get(key, set())
+    if analysis["skills"] != old_analysis["skills"]:
+        stale.add("skills")
+
+    breakdown = {
+        **old_ats["breakdown"],
+        **score_components(analysis, content, [name for name in ATS_COMPONENTS if name in stale])
+    }
+    return analysis, assemble_ats_result(analysis, breakdown)
+
+
+def reanalyze(analysis_id: str, changes: Dict[str, str]) -> Optional[dict]:
+    """
+    Apply section edits to a stored analysis.
+
+    Args:
+        analysis_id: Handle returned by a previous analysis
+        changes: Section key -> new raw section text
+
+    Returns:
+        {"analysis_id", "delta"} where delta holds only the fields (and ATS
+        breakdown entries) whose values changed, or None if the handle is
+        unknown or expired.
+    """
+    state = analysis_store.get(analysis_id)
+    if state is None:
+        return None
+
+    old_analysis = state["analysis"]
+    old_ats = state["ats"]
+    content = splice_sections(state["content"], changes)
+
+    with pinned_taxonomy() as taxonomy:
+        if old_analysis.get("taxonomy_version") != taxonomy.version:
+            # unchanged sections were extracted with an older taxonomy
+            analysis = get_analysis(content)
+            ats = compute_ats_score(analysis, content)
+        else:
+            analysis, ats = _apply_changes(old_analysis, old_ats, content, changes)
+
+    store_analysis(content, analysis, ats, analysis_id=analysis_id)
+
+    old_result = {**old_analysis, **old_ats}
+    new_result = {**analysis, **ats}
+    delta = {
+        field: new_result[field]
+        for field in RESULT_FIELDS
+        if new_result[field] != old_result.get(field)
+    }
+
+    changed_breakdown = {
+        name: score
+        for name, score in ats["breakdown"].items()
+        if score != old_ats["breakdown"][name]
+    }
+    if changed_breakdown:
+        delta["breakdown"] = changed_breakdown
+
+    return {"analysis_id": analysis_id, "delta": delta}
@@ -0,0 +1,170 @@
+"""
+Job Description Ingestion
+Bulk skill extraction for partner job feeds.
+
+A JSONL feed is streamed through `extract_job_skills_batch` (spaCy's
+`nlp.pipe` with configurable batch size and worker processes), and one
+result line is written per posting as soon as its batch is parsed, so
+memory use does not grow with the feed.
+
+Input lines are JSON objects with the description under `--text-field`
+(default "description") and an optional id under `--id-field` (default
+"id"; the line number is used when it is missing). Output lines are
+`{"id": ..., "skills": [...]}`, or `{"id": ..., "error": "..."}` for lines
+that could not be read.
+
+Usage:
+    python -m app.services.jd_ingest feed.jsonl --out skills.jsonl [--batch-size 64] [--n-process 2]
+"""
+
+from typing import IO, Any, Dict, Iterator, NamedTuple, Optional, Tuple
+import argparse
+import json
+import os
+import sys
+import time
+
+from app.services.job_skill_extractor import extract_job_skills_batch
+
+JD_INGEST_BATCH_SIZE = int(os.getenv("JD_INGEST_BATCH_SIZE", "64"))
+JD_INGEST_PROCESSES = int(os.getenv("JD_INGEST_PROCESSES", "1"))
+# Progress is reported every N postings
+JD_INGEST_PROGRESS_EVERY = int(os.getenv("JD_INGEST_PROGRESS_EVERY", "1000"))
+
+
+class IngestStats(NamedTuple):
+    postings: int
+    errors: int
+    seconds: float
+
+    @property
+    def per_second(self) -> float:
+        return self.postings / self.seconds if self.seconds else 0.0
+
+
+def iter_feed(
+    lines: IO[str],
+    text_field: str = "description",
+    id_field: str = "id"
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    (description, context) pairs from a JSONL feed.
+
+    Unreadable lines get an empty description and an "error" in their
+    context, so they keep their place in the output.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        context: Dict[str, Any] = {"id": line_number}
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            context["error"] = f"Invalid JSON: {str(e)}"
+            yield "", context
+            continue
+
+        if not isinstance(record, dict):
+            context["error"] = "Expected a JSON object"
+            yield "", context
+            continue
+
+        context["id"] = record.get(id_field, line_number)
+        text = record.get(text_field)
+        if not isinstance(text, str) or not text.strip():
+            context["error"] = f"Missing '{text_field}'"
+            yield "", context
+            continue
+
+        yield text, context
+
+
+def ingest_feed(
+    lines: IO[str],
+    out: IO[str],
+    batch_size: int = JD_INGEST_BATCH_SIZE,
+    n_process: int = JD_INGEST_PROCESSES,
+    text_field: str = "description",
+    id_field: str = "id",
+    progress: Optional[IO[str]] = None,
+    progress_every: int = JD_INGEST_PROGRESS_EVERY
+) -> IngestStats:
+    """
+    Extract skills for every posting in a JSONL feed, writing results as they arrive.
+
+    Args:
+        lines: Feed lines (an open file or any iterable of strings)
+        out: Where result lines are written
+        batch_size: Descriptions per `nlp.pipe` batch
+        n_process: spaCy worker processes
+        text_field: Field holding the job description
+        id_field: Field holding the posting id
+        progress: Stream for progress lines (None to stay quiet)
+        progress_every: Postings between progress lines
+
+    Returns:
+        Totals and elapsed time
+    """
+    postings = 0
+    errors = 0
+    started = time.perf_counter()
+
+    feed = iter_feed(lines, text_field=text_field, id_field=id_field)
+    for skills, context in extract_job_skills_batch(feed, batch_size=batch_size, n_process=n_process):
+        if "error" in context:
+            errors += 1
+            result = context
+        else:
+            result = {"id": context["id"], "skills": skills}
+        out.write(json.dumps(result) + "\n")
+
+        postings += 1
+        if progress is not None and progress_every and postings % progress_every == 0:
+            out.flush()
+            elapsed = time.perf_counter() - started
+            print(f"{postings} postings, {postings / elapsed:.1f}/s", file=progress, flush=True)
+
+    out.flush()
+    return IngestStats(postings, errors, time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract skills from a JSONL feed of job descriptions")
+    parser.add_argument("feed", help="JSONL feed ('-' for stdin)")
+    parser.add_argument("--out", default="-", help="Output JSONL ('-' for stdout)")
+    parser.add_argument("--batch-size", type=int, default=JD_INGEST_BATCH_SIZE)
+    parser.add_argument("--n-process", type=int, default=JD_INGEST_PROCESSES)
+    parser.add_argument("--text-field", default="description")
+    parser.add_argument("--id-field", default="id")
+    parser.add_argument("--progress-every", type=int, default=JD_INGEST_PROGRESS_EVERY)
+    args = parser.parse_args()
+
+    feed = sys.stdin if args.feed == "-" else open(args.feed, "r", encoding="utf-8")
+    out = sys.stdout if args.out == "-" else open(args.out, "w", encoding="utf-8")
+    try:
+        stats = ingest_feed(
+            feed,
+            out,
+            batch_size=args.batch_size,
+            n_process=args.n_process,
+            text_field=args.text_field,
+            id_field=args.id_field,
+            progress=sys.stderr,
+            progress_every=args.progress_every,
+        )
+    finally:
+        if feed is not sys.stdin:
+            feed.close()
+        if out is not sys.stdout:
+            out.close()
+
+    print(
+        f"{stats.postings} postings ({stats.errors} errors) in {stats.seconds:.1f}s: "
+        f"{stats.per_second:.1f} postings/s",
+        file=sys.stderr
+    )
+
+
+if __name__ == "__main__":
+    main()
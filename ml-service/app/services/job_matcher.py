@@ -3,8 +3,11 @@ Job Matcher Service
 Computes job-fit score and generates improvement feedback based on skill matching.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
+from app.services.job_profile import JobProfile
 from app.services.job_skill_extractor import extract_job_skills
+from app.services.skill_taxonomy import get_taxonomy
+from app.services.metrics import timed
 from app.services.semantic_skill_matcher import (
     semantic_skill_matching,
     compute_skill_match_percentage
@@ -154,52 +157,27 @@ def group_skills_by_category(skills: List[str]) -> Dict[str, List[str]]:
     Returns:
         Dictionary of category -> skills
     """
-    categories = {
-        "cloud": [],
-        "devops": [],
-        "database": [],
-        "frontend": [],
-        "backend": [],
-        "mobile": [],
-        "data science": [],
-        "testing": [],
-    }
-    
-    # Keyword-based categorization
-    category_keywords = {
-        "cloud": ["aws", "azure", "gcp", "cloud", "s3", "ec2", "lambda"],
-        "devops": ["docker", "kubernetes", "jenkins", "ci/cd", "terraform", "ansible"],
-        "database": ["sql", "mongodb", "postgresql", "mysql", "redis", "database"],
-        "frontend": ["react", "angular", "vue", "html", "css", "javascript", "typescript"],
-        "backend": ["node", "express", "django", "flask", "fastapi", "spring", "api"],
-        "mobile": ["android", "ios", "flutter", "react native", "swift", "kotlin"],
-        "data science": ["python", "machine learning", "tensorflow", "pytorch", "pandas", "numpy"],
-        "testing": ["selenium", "jest", "pytest", "testing", "junit"],
-    }
+    taxonomy = get_taxonomy()
+    categories = {domain: [] for domain in taxonomy.domain_names}
     
+    # Known skills are a direct lookup; phrases fall back to the skills they contain
     for skill in skills:
-        skill_lower = skill.lower()
-        categorized = False
-        
-        for category, keywords in category_keywords.items():
-            if any(keyword in skill_lower for keyword in keywords):
-                categories[category].append(skill)
-                categorized = True
-                break
+        domain = taxonomy.domain(skill)
         
         # If not categorized, add to a general category
-        if not categorized:
-            if "general" not in categories:
-                categories["general"] = []
-            categories["general"].append(skill)
+        if domain is None:
+            domain = "general"
+        categories.setdefault(domain, []).append(skill)
     
     # Remove empty categories
     return {k: v for k, v in categories.items() if v}
 
 
+@timed("job_matcher.match_job_with_resume")
 def match_job_with_resume(
     resume_analysis: Dict,
-    job_description: str
+    job_description: Optional[str] = None,
+    job_profile: Optional[JobProfile] = None
 ) -> Dict:
     """
     Main function to match job description with resume analysis.
@@ -207,6 +185,9 @@ def match_job_with_resume(
     Args:
         resume_analysis: Resume analysis output from /analyze endpoint
         job_description: Raw job description text
+        job_profile: Compiled job description; used instead of
+            `job_description` when given, skipping skill extraction and
+            JD-side embedding
         
     Returns:
         Job matching results with score and feedback
@@ -215,11 +196,16 @@ def match_job_with_resume(
     resume_skills = resume_analysis.get("skills", [])
     ats_score = resume_analysis.get("ats_score", 0)
     
-    # Extract skills from job description
-    jd_skills = extract_job_skills(job_description)
+    # Extract skills from job description (already done for a compiled profile)
+    if job_profile is not None:
+        jd_skills = job_profile.skills
+        jd_embeddings = job_profile.embeddings
+    else:
+        jd_skills = extract_job_skills(job_description)
+        jd_embeddings = None
     
     # Perform semantic matching
-    match_results = semantic_skill_matching(resume_skills, jd_skills)
+    match_results = semantic_skill_matching(resume_skills, jd_skills, jd_embeddings=jd_embeddings)
     
     matched_skills = match_results["matched_skills"]
     partial_matches = match_results["partial_matches"]
@@ -0,0 +1,90 @@
+"""
+Job Profile Service
+Compiles a job description once so it can be matched against many resumes.
+
+A JobProfile holds everything job matching derives from the description:
+the extracted skills and their sentence-transformer embeddings. Profiles
+are kept server-side under a `job_profile_id` (bounded, with TTL), so
+/resume/job-match and cover letter calls can pass the id instead of the
+text and skip spaCy and the JD-side encoding.
+"""
+
+from typing import List, NamedTuple, Optional
+import os
+import time
+
+import numpy as np
+
+from app.services.job_skill_extractor import extract_job_skills
+from app.services.metrics import timed
+from app.services.semantic_skill_matcher import compute_skill_embeddings
+from app.services.skill_taxonomy import get_taxonomy
+from app.services.ttl_store import TTLStore
+
+JOB_PROFILE_STORE_MAX_ENTRIES = int(os.getenv("JOB_PROFILE_STORE_MAX_ENTRIES", "500"))
+JOB_PROFILE_STORE_TTL_SECONDS = float(os.getenv("JOB_PROFILE_STORE_TTL_SECONDS", "86400"))
+
+job_profile_store = TTLStore(JOB_PROFILE_STORE_MAX_ENTRIES, JOB_PROFILE_STORE_TTL_SECONDS)
+
+
+class JobProfile(NamedTuple):
+    job_description: str
+    # normalized, deduplicated skills, as extract_job_skills returns them
+    skills: List[str]
+    # one row per skill, in `skills` order
+    embeddings: np.ndarray
+    taxonomy_version: str
+    compiled_at: float
+
+
+@timed("job_profile.compile_job_profile")
+def compile_job_profile(job_description: str) -> JobProfile:
+    """
+    Run every JD-side stage of job matching once.
+
+    Raises:
+        SpacyModelUnavailable: the spaCy model is not installed
+    """
+    taxonomy_version = get_taxonomy().version
+    skills = extract_job_skills(job_description)
+
+    return JobProfile(
+        job_description=job_description,
+        skills=skills,
+        embeddings=compute_skill_embeddings(skills),
+        taxonomy_version=taxonomy_version,
+        compiled_at=time.time()
+    )
+
+
+def store_job_profile(profile: JobProfile, job_profile_id: Optional[str] = None) -> str:
+    return job_profile_store.put(profile, key=job_profile_id)
+
+
+def get_job_profile(job_profile_id: str) -> Optional[JobProfile]:
+    """
+    The stored profile, or None if the id is unknown or expired.
+
+    A profile compiled under an older taxonomy is recompiled from its
+    description (and stored again under the same id) before it is returned,
+    so this can block for a spaCy parse and encoding; call it off the event
+    loop.
+    """
+    profile = job_profile_store.get(job_profile_id)
+    if profile is None:
+        return None
+
+    if profile.taxonomy_version != get_taxonomy().version:
+        profile = compile_job_profile(profile.job_description)
+        store_job_profile(profile, job_profile_id)
+    return profile
+
+
+def describe_job_profile(job_profile_id: str, profile: JobProfile) -> dict:
+    """Response body for a compiled profile (embeddings stay server-side)."""
+    return {
+        "job_profile_id": job_profile_id,
+        "skills": profile.skills,
+        "taxonomy_version": profile.taxonomy_version,
+        "expires_in": job_profile_store.ttl_seconds
+    }
@@ -0,0 +1,82 @@
+"""
+Job Skill Components
+spaCy pipeline components that collect skill candidates while the job
+description is parsed, so extraction reads everything from one Doc.
+
+`job_skill_candidates` adds:
+
+- doc.spans["skill_candidates"]: token-pattern matches labelled by rule
+  (dotted framework names like Node.js, acronyms like AWS, C++ style names,
+  C#, and "Go" where it reads as the language)
+- doc._.taxonomy_skills: canonical taxonomy skills found in the text, using
+  the taxonomy's own matcher so job descriptions and resumes are matched
+  with the same rules
+"""
+
+from typing import List
+
+from spacy.language import Language
+from spacy.matcher import Matcher
+from spacy.tokens import Doc, Span
+
+from app.services.skill_taxonomy import get_taxonomy
+
+SKILL_CANDIDATES_KEY = "skill_candidates"
+
+# rule label -> token patterns
+SHAPE_PATTERNS = {
+    # Node.js, React.js
+    "DOTTED": [[{"TEXT": {"REGEX": r"^[A-Z][a-z]+(?:\.[a-z]+)+$"}}]],
+    # AWS, SQL, API (single letters are dropped after matching; a LENGTH
+    # predicate would be checked on every token)
+    "ACRONYM": [[{"IS_ASCII": True, "IS_ALPHA": True, "IS_UPPER": True}]],
+    # C++
+    "PLUS_PLUS": [[{"TEXT": {"REGEX": r"^\w+\+\+$"}}]],
+    # C# (tokenized as "C" + "#")
+    "C_SHARP": [[{"LOWER": "c", "SPACY": False}, {"ORTH": "#"}]],
+}
+
+# "Go" only where it reads as a language ("Go, Python", "Go/C++", "experience
+# in Go"), not "go to" or "go live". Literal values only: IN predicates are
+# evaluated in Python for every token.
+GO_CONTEXT_WORDS = ("in", "with", "using", "and", "or")
+GO_SEPARATORS = (",", "/")
+GO_PATTERNS = (
+    [[{"LOWER": word}, {"LOWER": "go"}] for word in GO_CONTEXT_WORDS]
+    + [[{"LOWER": "go"}, {"ORTH": sep}] for sep in GO_SEPARATORS]
+    + [[{"ORTH": sep}, {"LOWER": "go"}] for sep in GO_SEPARATORS]
+)
+
+if not Doc.has_extension("taxonomy_skills"):
+    Doc.set_extension("taxonomy_skills", default=None)
+
+
+class JobSkillCandidates:
+    def __init__(self, nlp: Language, name: str):
+        self.name = name
+        self.matcher = Matcher(nlp.vocab)
+        for label, patterns in SHAPE_PATTERNS.items():
+            self.matcher.add(label, patterns)
+        self.matcher.add("GO", GO_PATTERNS)
+
+    def __call__(self, doc: Doc) -> Doc:
+        spans: List[Span] = []
+        for match_id, start, end in self.matcher(doc):
+            label = doc.vocab.strings[match_id]
+            if label == "ACRONYM" and len(doc[start]) < 2:
+                continue
+            if label == "GO":
+                # keep only the "go" token of the context pattern
+                start = next(i for i in range(start, end) if doc[i].lower_ == "go")
+                end = start + 1
+            spans.append(Span(doc, start, end, label=label))
+        doc.spans[SKILL_CANDIDATES_KEY] = spans
+
+        # read at call time so a pinned or reloaded taxonomy is respected
+        doc._.taxonomy_skills = get_taxonomy().find_skills(doc.text)
+        return doc
+
+
+@Language.factory("job_skill_candidates")
+def create_job_skill_candidates(nlp: Language, name: str) -> JobSkillCandidates:
+    return JobSkillCandidates(nlp, name)
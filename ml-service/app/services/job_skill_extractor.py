@@ -1,40 +1,57 @@
 """
 Job Skill Extractor Service
-Extracts required skills from job descriptions using spaCy and regex.
+Extracts required skills from job descriptions using spaCy.
+
+Every skill candidate (noun chunks, entities, taxonomy skills and the
+token-pattern rules in job_skill_components) comes from a single parse of
+the skill sections.
+
+Very long postings (scraped pages full of benefits, legal and EEO text) are
+not parsed whole. They are split into paragraphs, paragraphs without any
+skill signal are skipped, and the rest are parsed one chunk at a time until a
+per-posting time budget runs out.
 """
 
+import logging
+import os
 import re
-import spacy
-from typing import List, Set
-
-# Load spaCy model with automatic download
-def load_spacy_model():
-    """Load spaCy model, downloading if necessary."""
-    try:
-        return spacy.load("en_core_web_sm")
-    except OSError:
-        print("Downloading spaCy model 'en_core_web_sm'...")
-        import subprocess
-        import sys
-        subprocess.check_call([
-            sys.executable, "-m", "spacy", "download", "en_core_web_sm"
-        ])
-        return spacy.load("en_core_web_sm")
-
-nlp = load_spacy_model()
+import time
+from typing import Any, Iterable, Iterator, List, Optional, Set, Tuple
+
+from spacy.tokens import Doc
+
+from app.services.skill_taxonomy import get_taxonomy
+from app.services.metrics import stage, timed
+from app.services.job_skill_components import SKILL_CANDIDATES_KEY
+from app.services.spacy_model import get_nlp
+
+logger = logging.getLogger(__name__)
+
+# Skill text longer than this is extracted chunk by chunk
+JD_LONG_TEXT_CHARS = int(os.getenv("JD_LONG_TEXT_CHARS", "20000"))
+# Largest chunk handed to spaCy in long mode
+JD_CHUNK_CHARS = int(os.getenv("JD_CHUNK_CHARS", "3000"))
+# Parsing stops (keeping the skills found so far) once a long posting has taken this long
+JD_TIME_BUDGET_SECONDS = float(os.getenv("JD_TIME_BUDGET_SECONDS", "2.0"))
+
+PARAGRAPH_BREAK_PATTERN = re.compile(r"\n\s*\n")
+# Tech-looking tokens the taxonomy may not know (Svelte.js, C++, F#)
+TECH_SHAPE_PATTERN = re.compile(r"\b[A-Z][a-z]+\.[a-z]+\b|\w\+\+|\b[A-Za-z]#")
 
 
 # Skill-heavy section keywords
 SKILL_SECTION_PATTERNS = [
-    r"(?i)required\s+skills?",
-    r"(?i)technical\s+skills?",
-    r"(?i)qualifications?",
-    r"(?i)requirements?",
-    r"(?i)must\s+have",
-    r"(?i)experience\s+with",
-    r"(?i)proficiency\s+in",
-    r"(?i)knowledge\s+of",
+    r"required\s+skills?",
+    r"technical\s+skills?",
+    r"qualifications?",
+    r"requirements?",
+    r"must\s+have",
+    r"experience\s+with",
+    r"proficiency\s+in",
+    r"knowledge\s+of",
 ]
+# one search per line instead of one per pattern
+SKILL_SECTION_PATTERN = re.compile("|".join(SKILL_SECTION_PATTERNS), re.IGNORECASE)
 
 # Common soft skills to filter out
 SOFT_SKILLS = {
@@ -56,26 +73,17 @@ GENERIC_TERMS = {
     "orchestration", "containerization"
 }
 
-# Whitelist of common technologies to always extract if present
-COMMON_TECH_STACK = {
-    "java", "python", "c", "c++", "c#", ".net", "rust", "golang", "swift", "kotlin", "php", "ruby", "scala",
-    "typescript", "javascript", "js", "react", "angular", "vue", "next.js", "node.js", "express", "django", "flask", "fastapi", "spring boot", "spring",
-    "docker", "kubernetes", "k8s", "aws", "azure", "gcp", "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch",
-    "git", "github", "gitlab", "linux", "bash", "html", "css", "sass", "graphql", "rest api",
-    "terraform", "ansible", "jenkins", "circleci", "pytorch", "tensorflow", "keras", "pandas", "numpy", "scikit-learn",
-    "excel", "power bi", "tableau", "jira", "confluence", "figma"
-}
 
-
-def extract_skill_sections(job_description: str) -> str:
+@timed("job_skill_extractor.extract_skill_sections")
+def find_skill_sections(job_description: str) -> List[str]:
     """
-    Extract skill-heavy sections from job description using regex.
+    Find skill-heavy sections (requirements, required skills, ...) using regex.
     
     Args:
         job_description: Raw job description text
         
     Returns:
-        Combined text from skill-relevant sections
+        Text of each skill-relevant section; empty if there are none
     """
     skill_text = []
     lines = job_description.split('\n')
@@ -87,10 +95,7 @@ def extract_skill_sections(job_description: str) -> str:
         line_stripped = line.strip()
         
         # Check if this line starts a skill section
-        is_section_header = any(
-            re.search(pattern, line_stripped) 
-            for pattern in SKILL_SECTION_PATTERNS
-        )
+        is_section_header = SKILL_SECTION_PATTERN.search(line_stripped) is not None
         
         if is_section_header:
             in_skill_section = True
@@ -110,11 +115,27 @@ def extract_skill_sections(job_description: str) -> str:
     if section_buffer:
         skill_text.append(' '.join(section_buffer))
     
-    # If no specific sections found, use entire description
-    if not skill_text:
-        skill_text.append(job_description)
+    return skill_text
+
+
+def select_skill_text(job_description: str) -> Tuple[str, bool]:
+    """
+    Text to extract job skills from.
     
-    return ' '.join(skill_text)
+    Returns:
+        (skill sections joined, True), or (entire description, False) if it
+        has no skill sections. Skill sections list requirements, so names
+        that are also ordinary words ("Excel") count as skills there.
+    """
+    sections = find_skill_sections(job_description)
+    if not sections:
+        return job_description, False
+    return ' '.join(sections), True
+
+
+def extract_skill_sections(job_description: str) -> str:
+    """Combined text from skill-relevant sections, else the entire description."""
+    return select_skill_text(job_description)[0]
 
 
 def clean_and_normalize_skill(skill: str) -> str:
@@ -142,19 +163,38 @@ def clean_and_normalize_skill(skill: str) -> str:
     return skill
 
 
-def extract_technical_skills(text: str) -> List[str]:
+@timed("job_skill_extractor.extract_technical_skills")
+def extract_technical_skills(text: str, listed: bool = False) -> List[str]:
     """
-    Extract technical skills using spaCy NLP and pattern matching.
+    Extract technical skills from one spaCy parse.
     
     Args:
         text: Text to extract skills from
+        listed: The text is requirement lists (see select_skill_text)
         
     Returns:
         List of normalized technical skills
     """
-    # Process with spaCy
-    doc = nlp(text)
+    # loaded lazily (or by the startup warmup); raises SpacyModelUnavailable if missing
+    nlp = get_nlp()
+    with stage("job_skill_extractor.spacy"):
+        doc = nlp(text)
+
+    return skills_from_doc(doc, listed=listed)
+
+
+def skills_from_doc(doc: Doc, listed: bool = False) -> List[str]:
+    """
+    Technical skills from an already parsed skill-section Doc.
     
+    Args:
+        doc: Output of the shared pipeline (see spacy_model.get_nlp)
+        listed: The text is requirement lists, so taxonomy names that are
+            also ordinary words ("Swift", "Excel") are matched too
+        
+    Returns:
+        List of normalized technical skills
+    """
     skills = set()
     
     # Extract noun phrases as potential skills
@@ -213,41 +253,141 @@ def extract_technical_skills(text: str) -> List[str]:
             if skill and len(skill) >= 2:
                 skills.add(skill)
     
-    # Pattern-based extraction for common tech terms
-    # Technologies often appear in specific patterns
-    tech_patterns = [
-        r'\b[A-Z][a-z]+(?:\.[a-z]+)+\b',  # e.g., Node.js, React.js
-        r'\b[A-Z]{2,}\b',  # e.g., AWS, SQL, API
-        r'\b\w+\+\+\b',  # e.g., C++
-        r'\b[Cc]#\b',  # C#
-    ]
-    
-    for pattern in tech_patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            skill = clean_and_normalize_skill(match)
-            if skill:
-                skills.add(skill)
+    # Pattern-based candidates (Node.js, AWS, C++, C#, Go as a language),
+    # matched on tokens by the job_skill_candidates component
+    for span in doc.spans[SKILL_CANDIDATES_KEY]:
+        skill = clean_and_normalize_skill(span.text)
+        if skill:
+            skills.add(skill)
 
     # Dictionary-based extraction for known tech stack (High precision)
-    # This ensures we don't miss "Java", "Python" even if NLP fails
-    text_lower = text.lower()
-    for tech in COMMON_TECH_STACK:
-        # Use regex to find whole words only to avoid substring matching (e.g. "java" in "javascript")
-        # Escape special chars like "+" in "c++"
-        pattern = r'\b' + re.escape(tech) + r'\b'
-        if re.search(pattern, text_lower):
-            skills.add(tech)
-            
-    # Special handling for "Go" programming language
-    # Only match "Go" if it looks like a language (e.g. "Go, Python", "Go/C++", "knowledge of Go")
-    # Avoid matching "go to", "go live", etc.
-    if re.search(r'(?i)(\b(in|with|using|and|or)\s+Go\b)|(\bGo\s*[,/])|([,/]\s*Go\b)', text):
-        skills.add("go")
+    # This ensures we don't miss "Java", "Python" even if NLP fails.
+    # The taxonomy matcher only matches whole words, so "java" never hits "javascript"
+    skills.update(doc._.taxonomy_skills)
+    taxonomy = get_taxonomy()
+    if listed:
+        skills.update(taxonomy.listed_name_matcher.find_skills(doc.text))
+
+    # Report known skills under their canonical name (e.g. "k8s" -> "kubernetes")
+    return list({taxonomy.canonical(skill) or skill for skill in skills})
+
+
+def _split_paragraph(paragraph: str, max_chars: int) -> Iterator[str]:
+    """Pieces of at most `max_chars`, cut at line breaks, else at spaces."""
+    if len(paragraph) <= max_chars:
+        yield paragraph
+        return
+
+    for line in paragraph.splitlines():
+        while len(line) > max_chars:
+            cut = line.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            yield line[:cut]
+            line = line[cut:].lstrip()
+        if line.strip():
+            yield line
+
+
+def iter_paragraphs(text: str, max_chars: int = JD_CHUNK_CHARS) -> Iterator[str]:
+    """Non-empty paragraphs of the text, split further if over `max_chars`."""
+    for paragraph in PARAGRAPH_BREAK_PATTERN.split(text):
+        paragraph = paragraph.strip()
+        if paragraph:
+            yield from _split_paragraph(paragraph, max_chars)
+
+
+def has_skill_signal(paragraph: str) -> bool:
+    """
+    Cheap prefilter for long postings: a skill section header, a known
+    taxonomy skill or a tech-looking token. Benefits, legal and EEO
+    paragraphs usually have none of these.
+    """
+    return bool(
+        SKILL_SECTION_PATTERN.search(paragraph)
+        or TECH_SHAPE_PATTERN.search(paragraph)
+        or get_taxonomy().matcher.find(paragraph)
+    )
+
+
+def pack_chunks(paragraphs: Iterable[str], max_chars: int = JD_CHUNK_CHARS) -> Iterator[str]:
+    """Join consecutive paragraphs into chunks of at most `max_chars`."""
+    buffer: List[str] = []
+    size = 0
+    for paragraph in paragraphs:
+        if buffer and size + len(paragraph) > max_chars:
+            yield "\n\n".join(buffer)
+            buffer = []
+            size = 0
+        buffer.append(paragraph)
+        size += len(paragraph) + 2
+    if buffer:
+        yield "\n\n".join(buffer)
+
+
+@timed("job_skill_extractor.extract_technical_skills_chunked")
+def extract_technical_skills_chunked(
+    text: str,
+    time_budget: float = JD_TIME_BUDGET_SECONDS,
+    max_chars: int = JD_CHUNK_CHARS
+) -> List[str]:
+    """
+    `extract_technical_skills` for very long text, parsing only the
+    paragraphs with skill signal.
+    
+    Chunks are produced lazily and fed to spaCy one at a time, and the
+    deadline is checked before each one is fed: once `time_budget` seconds
+    have passed no further chunk is parsed and the skills found so far are
+    returned, so the budget is overrun by at most the chunk in progress.
+    
+    Args:
+        text: Text to extract skills from
+        time_budget: Seconds allowed for the whole posting
+        max_chars: Largest chunk handed to spaCy
+        
+    Returns:
+        List of normalized technical skills (not yet deduplicated)
+    """
+    deadline = time.perf_counter() + time_budget
+    nlp = get_nlp()
+
+    chunks = pack_chunks(
+        (p for p in iter_paragraphs(text, max_chars) if has_skill_signal(p)),
+        max_chars
+    )
+    parsed = 0
+    timed_out = False
+
+    def feed() -> Iterator[str]:
+        nonlocal timed_out
+        for chunk in chunks:
+            if time.perf_counter() > deadline:
+                timed_out = True
+                return
+            yield chunk
+
+    skills: Set[str] = set()
+    with stage("job_skill_extractor.spacy"):
+        # batch_size=1 so spaCy pulls the next chunk only after the previous one is parsed
+        for doc in nlp.pipe(feed(), batch_size=1):
+            skills.update(skills_from_doc(doc))
+            parsed += 1
+
+    if timed_out:
+        logger.warning(
+            "Job description skill extraction hit its %.1fs budget after %d chunks (%d chars); "
+            "returning partial skills",
+            time_budget, parsed, len(text)
+        )
 
     return list(skills)
 
 
+def is_long_text(text: str) -> bool:
+    return len(text) > JD_LONG_TEXT_CHARS
+
+
+@timed("job_skill_extractor.deduplicate_skills")
 def deduplicate_skills(skills: List[str]) -> List[str]:
     """
     Remove duplicate skills (including substring matches).
@@ -275,6 +415,14 @@ def deduplicate_skills(skills: List[str]) -> List[str]:
     return unique_skills
 
 
+def finalize_skills(skills: List[str]) -> List[str]:
+    """Deduplicated, alphabetically sorted skills."""
+    skills = deduplicate_skills(skills)
+    skills.sort()
+    return skills
+
+
+@timed("job_skill_extractor.extract_job_skills")
 def extract_job_skills(job_description: str) -> List[str]:
     """
     Main function to extract technical skills from job description.
@@ -286,15 +434,58 @@ def extract_job_skills(job_description: str) -> List[str]:
         List of normalized, deduplicated technical skills
     """
     # Extract skill-relevant sections
-    skill_text = extract_skill_sections(job_description)
+    skill_text, listed = select_skill_text(job_description)
     
-    # Extract technical skills
-    skills = extract_technical_skills(skill_text)
+    # Extract technical skills; very long postings are chunked (paragraph
+    # breaks only survive in the original text)
+    if is_long_text(skill_text):
+        skills = extract_technical_skills_chunked(job_description)
+    else:
+        skills = extract_technical_skills(skill_text, listed=listed)
     
-    # Deduplicate
-    skills = deduplicate_skills(skills)
+    # Deduplicate and sort alphabetically for consistency
+    return finalize_skills(skills)
+
+
+def extract_job_skills_batch(
+    job_descriptions: Iterable[Tuple[str, Any]],
+    batch_size: int = 64,
+    n_process: int = 1
+) -> Iterator[Tuple[List[str], Any]]:
+    """
+    Extract skills from many job descriptions with `nlp.pipe`.
     
-    # Sort alphabetically for consistency
-    skills.sort()
+    Descriptions are consumed lazily and results are yielded as soon as their
+    batch is parsed, so memory stays bounded for feeds of any size. Very long
+    descriptions are extracted chunk by chunk in this process, as
+    `extract_job_skills` does, keeping their place in the output.
     
-    return skills
+    Args:
+        job_descriptions: (job description, context) pairs; the context
+            (e.g. a record id) is passed through untouched
+        batch_size: Descriptions parsed per batch
+        n_process: Worker processes for parsing (1 parses in this process)
+        
+    Returns:
+        (skills, context) pairs in input order, skills as `extract_job_skills`
+        returns them
+    """
+    nlp = get_nlp()
+
+    def sections() -> Iterator[Tuple[str, Tuple[Any, Optional[str], bool]]]:
+        for job_description, context in job_descriptions:
+            skill_text, listed = select_skill_text(job_description)
+            if is_long_text(skill_text):
+                # parsed separately; an empty placeholder keeps the order
+                yield "", (context, job_description, False)
+            else:
+                yield skill_text, (context, None, listed)
+
+    for doc, (context, long_description, listed) in nlp.pipe(
+        sections(), as_tuples=True, batch_size=batch_size, n_process=n_process
+    ):
+        if long_description is not None:
+            skills = extract_technical_skills_chunked(long_description)
+        else:
+            skills = skills_from_doc(doc, listed=listed)
+        yield finalize_skills(skills), context
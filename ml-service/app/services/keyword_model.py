@@ -0,0 +1,198 @@
+"""
+Keyword Model Service
+Corpus-fitted TF-IDF statistics for ATS keyword scoring.
+
+Document frequencies are fitted offline on a local resume/JD corpus and
+persisted as JSON. The model is loaded once; scoring a resume only tokenizes
+it and weights term counts by the stored IDF, instead of fitting a new
+vectorizer on a single document (where every IDF is the same).
+
+The corpus can be grown incrementally: `update` adds documents to the stored
+document frequencies and bumps the model version.
+
+Usage:
+    python -m app.services.keyword_model build corpus/ [--out PATH]
+    python -m app.services.keyword_model update more_docs.jsonl [--out PATH]
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional
+import argparse
+import json
+import logging
+import math
+import os
+import tempfile
+import time
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+logger = logging.getLogger(__name__)
+
+KEYWORD_MODEL_PATH = os.getenv("KEYWORD_MODEL_PATH") or os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", "keyword_model.json"
+)
+
+# Same tokenization (lowercase, English stop words, 2+ char tokens) as the
+# per-request vectorizer it replaces
+_analyzer = TfidfVectorizer(stop_words="english").build_analyzer()
+
+
+def tokenize(text: str) -> List[str]:
+    return _analyzer(text)
+
+
+class KeywordModel:
+    """Document frequencies of a corpus, with smoothed IDF weights."""
+
+    def __init__(self, df: Dict[str, int], n_docs: int, version: int = 1, updated_at: Optional[float] = None):
+        self.df = df
+        self.n_docs = n_docs
+        self.version = version
+        self.updated_at = updated_at or time.time()
+        self._compile()
+
+    def _compile(self) -> None:
+        # sklearn's smooth_idf: ln((1 + n) / (1 + df)) + 1
+        n = self.n_docs
+        self.idf = {term: math.log((1 + n) / (1 + count)) + 1 for term, count in self.df.items()}
+        # terms never seen in the corpus get the highest weight
+        self.unseen_idf = math.log(1 + n) + 1
+
+    @classmethod
+    def fit(cls, documents: Iterable[str]) -> "KeywordModel":
+        model = cls({}, 0, version=0)
+        model.update(documents)
+        return model
+
+    def update(self, documents: Iterable[str]) -> int:
+        """Add documents to the corpus statistics. Returns how many were added."""
+        added = 0
+        for document in documents:
+            for term in set(tokenize(document)):
+                self.df[term] = self.df.get(term, 0) + 1
+            added += 1
+
+        self.n_docs += added
+        self.version += 1
+        self.updated_at = time.time()
+        self._compile()
+        return added
+
+    def transform_counts(self, term_counts: Mapping[str, int]) -> Dict[str, float]:
+        """TF-IDF weight of every term, from already tokenized term counts."""
+        idf = self.idf
+        unseen = self.unseen_idf
+        return {
+            term: count * idf.get(term, unseen)
+            for term, count in term_counts.items()
+        }
+
+    def transform(self, text: str) -> Dict[str, float]:
+        """TF-IDF weight of every term in the text."""
+        return self.transform_counts(Counter(tokenize(text)))
+
+    def top_keywords_from_counts(self, term_counts: Mapping[str, int], top_k: int = 30) -> List[str]:
+        """The `top_k` highest weighted terms, best first (ties by term)."""
+        weights = self.transform_counts(term_counts)
+        ranked = sorted(weights.items(), key=lambda item: (-item[1], item[0]))
+        return [term for term, _ in ranked[:top_k]]
+
+    def top_keywords(self, text: str, top_k: int = 30) -> List[str]:
+        return self.top_keywords_from_counts(Counter(tokenize(text)), top_k)
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": self.version,
+            "n_docs": self.n_docs,
+            "updated_at": self.updated_at,
+            "df": self.df,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "KeywordModel":
+        return cls(data["df"], data["n_docs"], data.get("version", 1), data.get("updated_at"))
+
+    def save(self, path: str = KEYWORD_MODEL_PATH) -> None:
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # write-then-rename so a running service never loads a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+
+def load_keyword_model(path: str = KEYWORD_MODEL_PATH) -> Optional[KeywordModel]:
+    """Load the fitted model, or None if no model has been built."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return KeywordModel.from_dict(json.load(f))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError):
+        logger.exception("Failed to load keyword model from %s", path)
+        return None
+
+
+_model = load_keyword_model()
+
+
+def get_keyword_model() -> Optional[KeywordModel]:
+    return _model
+
+
+def keyword_model_version() -> str:
+    return str(_model.version) if _model is not None else "none"
+
+
+def iter_corpus(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Yield documents from corpus paths.
+
+    Directories are walked for .txt files (one document each) and .jsonl
+    files (one document per line, either a JSON string or an object with a
+    "text", "content" or "description" field).
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                yield from iter_corpus(os.path.join(root, name) for name in sorted(files))
+        elif path.endswith(".jsonl"):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if isinstance(record, str):
+                        yield record
+                    else:
+                        text = record.get("text") or record.get("content") or record.get("description")
+                        if text:
+                            yield text
+        elif path.endswith(".txt"):
+            with open(path, "r", encoding="utf-8") as f:
+                yield f.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or update the ATS keyword model")
+    parser.add_argument("command", choices=["build", "update"])
+    parser.add_argument("corpus", nargs="+", help="Corpus files or directories (.txt, .jsonl)")
+    parser.add_argument("--out", default=KEYWORD_MODEL_PATH)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        model = KeywordModel.fit(iter_corpus(args.corpus))
+    else:
+        model = load_keyword_model(args.out)
+        if model is None:
+            parser.error(f"No keyword model at {args.out}; run build first")
+        model.update(iter_corpus(args.corpus))
+
+    model.save(args.out)
+    print(f"Keyword model v{model.version}: {model.n_docs} documents, {len(model.df)} terms -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
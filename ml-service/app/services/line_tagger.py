@@ -0,0 +1,126 @@
+"""
+Line Tagger
+Classifies each line of a resume section once, for all structured extractors.
+
+Every non-empty line is stripped and tagged with the line kinds the education,
+experience and project extractors care about (date range, single date, role,
+institution, degree, tech line, title candidate). The extractors then walk the
+tagged lines as small state machines without running any regex themselves.
+"""
+
+from enum import IntFlag
+from typing import NamedTuple, Optional
+import re
+
+
+class LineTag(IntFlag):
+    DATE_RANGE = 1
+    SINGLE_DATE = 2
+    ROLE = 4
+    INSTITUTION = 8
+    DEGREE = 16
+    TECH = 32
+    TITLE = 64
+
+
+class TaggedLine(NamedTuple):
+    text: str
+    tags: LineTag
+    word_count: int
+    # raw (start, end) groups of the date range, when tagged DATE_RANGE
+    date_range: Optional[tuple[str, str]]
+
+
+DURATION_PATTERN = re.compile(
+    r"""
+    (                           # start date
+        (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec|
+           January|February|March|April|June|July|August|September|
+           October|November|December)?
+        \s*
+        \d{4}
+    )
+    \s*
+    (?:[-]|to|\u2013|\u2014|\s{2,})
+    \s*
+    (                           # end date
+        (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec|
+           January|February|March|April|June|July|August|September|
+           October|November|December)?
+        \s*
+        (?:\d{4}|Present|present)
+    )
+    """,
+    re.IGNORECASE | re.VERBOSE
+)
+
+SINGLE_DATE_PATTERN = re.compile(
+    r"""
+    ^
+    (?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec|
+       January|February|March|April|June|July|August|September|
+       October|November|December)?
+    \s*\d{4}
+    $
+    """,
+    re.IGNORECASE | re.VERBOSE
+)
+
+ROLE_PATTERN = re.compile(
+    r"(intern|engineer|developer|analyst|software|backend|frontend|full[- ]?stack)",
+    re.IGNORECASE
+)
+
+INSTITUTION_PATTERN = re.compile(
+    r"(university|institute|college|school)",
+    re.IGNORECASE
+)
+
+DEGREE_PATTERN = re.compile(
+    r"(bachelor|b\.tech|btech|master|m\.tech|mtech|phd|secondary|senior secondary|high school)",
+    re.IGNORECASE
+)
+
+# project titles are short, non-sentence lines
+TITLE_MAX_WORDS = 10
+
+
+def tag_line(line: str) -> TaggedLine:
+    """Tag one stripped, non-empty line."""
+    tags = LineTag(0)
+    date_range = None
+    word_count = len(line.split())
+
+    match = DURATION_PATTERN.search(line)
+    if match:
+        tags |= LineTag.DATE_RANGE
+        date_range = (match.group(1), match.group(2))
+
+    if SINGLE_DATE_PATTERN.match(line):
+        tags |= LineTag.SINGLE_DATE
+    if ROLE_PATTERN.search(line):
+        tags |= LineTag.ROLE
+    if INSTITUTION_PATTERN.search(line):
+        tags |= LineTag.INSTITUTION
+    if DEGREE_PATTERN.search(line):
+        tags |= LineTag.DEGREE
+
+    if line.lower().startswith("tech"):
+        tags |= LineTag.TECH
+    elif (
+        word_count <= TITLE_MAX_WORDS
+        and not tags & (LineTag.DATE_RANGE | LineTag.SINGLE_DATE)
+        and not line.endswith(".")
+    ):
+        tags |= LineTag.TITLE
+
+    return TaggedLine(line, tags, word_count, date_range)
+
+
+def tag_lines(text: str) -> list[TaggedLine]:
+    """Strip, drop blank lines and tag the rest, in order."""
+    return [
+        tag_line(stripped)
+        for stripped in (line.strip() for line in text.splitlines())
+        if stripped
+    ]
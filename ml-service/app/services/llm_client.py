@@ -2,6 +2,8 @@ import requests
 import logging
 import os
 
+from app.services.metrics import timed
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +37,7 @@ class LLMClient:
 
     # -----------------------------------------------------
 
+    @timed("llm_client.generate_text")
     def generate_text(
         self,
         prompt: str,
@@ -0,0 +1,260 @@
+"""
+Metrics Service
+In-process latency histograms, in-flight gauges and cache hit ratios,
+rendered in the Prometheus text exposition format for GET /metrics.
+
+Pipeline stages are instrumented with `@timed("module.stage")` or
+`with stage("module.stage"):`. With METRICS_ENABLED off (the default),
+`timed` returns the function unchanged and `stage` returns a shared no-op,
+so instrumentation costs nothing on the hot path.
+
+Metrics are per process: batch and PDF worker processes do not report here.
+"""
+
+from bisect import bisect_left
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import os
+import re
+import threading
+import time
+
+from starlette.routing import compile_path
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() in ("1", "true", "yes")
+
+# seconds; spans sub-millisecond regex stages up to LLM calls
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, description: str, label_names: Sequence[str] = ()):
+        super().__init__(name, description, label_names)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_labels(self.label_names, labels)} {_number(value)}"
+            for labels, value in values
+        ]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, description, label_names)
+        self.buckets = tuple(buckets)
+        # per label set: per-bucket counts (last one is +Inf), sum
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            snapshot = sorted((labels, list(counts), total[0]) for labels, (counts, total) in self._series.items())
+
+        lines = self.header()
+        bounds = self.buckets + (float("inf"),)
+        for labels, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                le = 'le="' + _number(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+
+stage_seconds = Histogram(
+    "ml_stage_duration_seconds", "Time spent in each pipeline stage.", ("stage",)
+)
+stage_in_flight = Gauge(
+    "ml_stage_in_flight", "Pipeline stage calls currently running.", ("stage",)
+)
+stage_errors = Counter(
+    "ml_stage_errors_total", "Pipeline stage calls that raised.", ("stage",)
+)
+http_seconds = Histogram(
+    "ml_http_request_duration_seconds", "HTTP request latency.", ("method", "route", "status")
+)
+http_in_flight = Gauge(
+    "ml_http_requests_in_flight", "HTTP requests currently being served."
+)
+
+_metrics: List[Metric] = [stage_seconds, stage_in_flight, stage_errors, http_seconds, http_in_flight]
+_caches: Dict[str, Callable[[], Dict]] = {}
+
+
+class _Stage:
+    __slots__ = ("name", "started")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        stage_in_flight.inc(self.name)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        stage_seconds.observe(time.perf_counter() - self.started, self.name)
+        stage_in_flight.dec(self.name)
+        if exc_type is not None:
+            stage_errors.inc(self.name)
+        return False
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name: str):
+    """Context manager timing one pipeline stage (a no-op when metrics are off)."""
+    return _Stage(name) if METRICS_ENABLED else _NULL_STAGE
+
+
+def timed(name: str):
+    """Decorator timing every call as stage `name`; returns the function itself when metrics are off."""
+    def decorator(func):
+        if not METRICS_ENABLED:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def register_cache(name: str, stats: Callable[[], Dict]) -> None:
+    """Report a cache whose `stats()` has "hits" and "misses" counts."""
+    _caches[name] = stats
+
+
+def _render_caches() -> List[str]:
+    hits = Counter("ml_cache_hits_total", "Cache lookups that hit.", ("cache",))
+    misses = Counter("ml_cache_misses_total", "Cache lookups that missed.", ("cache",))
+    ratio = Gauge("ml_cache_hit_ratio", "Cache hits / lookups since start.", ("cache",))
+
+    for name, stats in sorted(_caches.items()):
+        values = stats()
+        lookups = values["hits"] + values["misses"]
+        hits.inc(name, amount=values["hits"])
+        misses.inc(name, amount=values["misses"])
+        ratio.inc(name, amount=values["hits"] / lookups if lookups else 0.0)
+
+    return hits.render() + misses.render() + ratio.render()
+
+
+def render_metrics() -> str:
+    lines: List[str] = []
+    for metric in _metrics:
+        lines.extend(metric.render())
+    lines.extend(_render_caches())
+    return "\n".join(lines) + "\n"
+
+
+def observe_request(method: str, route: str, status: int, seconds: float) -> None:
+    http_seconds.observe(seconds, method, route, str(status))
+
+
+class RouteTemplates:
+    """
+    Maps request paths to the app's route templates, so request labels
+    stay bounded: a path parameter is labelled by its template, and paths
+    that match no route are labelled "unmatched".
+    """
+
+    def __init__(self):
+        self._patterns: Optional[List[Tuple[re.Pattern, str]]] = None
+
+    def resolve(self, app, path: str) -> str:
+        if self._patterns is None:
+            self._patterns = [(compile_path(template)[0], template) for template in app.openapi()["paths"]]
+        for pattern, template in self._patterns:
+            if pattern.match(path):
+                return template
+        return "unmatched"
+
+
+route_templates = RouteTemplates()
@@ -0,0 +1,262 @@
+"""
+Readability Service
+Flesch Reading Ease without re-deriving syllables on every request.
+
+Scores are identical to `textstat.flesch_reading_ease` (same tokenization,
+CMU dictionary first, pyphen hyphenation otherwise). The difference is where
+syllable counts come from:
+
+- a bundled dictionary of common resume/English words (app/data), loaded at
+  import and never evicted
+- a process-wide LRU of every other word seen so far
+- the CMU dictionary (loaded on the first miss) and pyphen, only for words
+  that are in neither
+
+The text is tokenized once and the word list is shared by the word count and
+the syllable count. The ATS scorers do not tokenize here at all: text_stats
+derives textstat's words and sentences from its own scan and calls
+`flesch_from_counts`.
+
+Usage:
+    python -m app.services.readability build corpus/ [--top 2000] [--out PATH]
+"""
+
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional
+import argparse
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+
+import pyphen
+
+from app.services.keyword_model import iter_corpus
+from app.services.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+SYLLABLE_DICTIONARY_PATH = os.getenv("SYLLABLE_DICTIONARY_PATH") or os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", "syllable_dictionary.json"
+)
+# Words outside the bundled dictionary whose syllable counts are kept in memory
+SYLLABLE_CACHE_SIZE = int(os.getenv("SYLLABLE_CACHE_SIZE", "50000"))
+
+# Flesch Reading Ease (English)
+FRE_BASE = 206.835
+FRE_SENTENCE_LENGTH = 1.015
+FRE_SYLLABLES_PER_WORD = 84.6
+
+# textstat's punctuation removal: apostrophes survive only in contractions
+NONCONTRACTION_APOSTROPHE_PATTERN = re.compile(r"\'(?![tsd]|ve|ll|re)")
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s\']")
+SENTENCE_PATTERN = re.compile(r"\b[^.!?]+[.!?]*")
+WORD_CHAR_PATTERN = re.compile(r"\w")
+
+# sentences of this many words or fewer are not counted (textstat's rule)
+MIN_SENTENCE_WORDS = 2
+# textstat keeps an apostrophe only when one of these follows it (a contraction)
+CONTRACTION_SUFFIXES = ("t", "s", "d", "ve", "ll", "re")
+
+
+class Readability(NamedTuple):
+    words: int
+    sentences: int
+    syllables: int
+    flesch_reading_ease: float
+
+
+def list_words(text: str) -> List[str]:
+    """Words as textstat counts them: punctuation stripped, split on whitespace."""
+    text = NONCONTRACTION_APOSTROPHE_PATTERN.sub("", text)
+    return PUNCTUATION_PATTERN.sub("", text).split()
+
+
+def _is_counted_sentence(sentence: str) -> bool:
+    # a whitespace chunk survives punctuation removal iff it has a word char
+    words = 0
+    for chunk in sentence.split():
+        if WORD_CHAR_PATTERN.search(chunk):
+            words += 1
+            if words > MIN_SENTENCE_WORDS:
+                return True
+    return False
+
+
+def count_sentences(text: str) -> int:
+    if not text:
+        return 0
+    sentences = SENTENCE_PATTERN.findall(text)
+    counted = sum(1 for sentence in sentences if _is_counted_sentence(sentence))
+    return max(1, counted)
+
+
+# ---------------------------------------------------------------------------
+# Syllables
+# ---------------------------------------------------------------------------
+
+_cmudict: Optional[Dict[str, list]] = None
+_cmudict_lock = threading.Lock()
+_hyphenator = pyphen.Pyphen(lang="en_US")
+
+
+def _get_cmudict() -> Dict[str, list]:
+    global _cmudict
+    if _cmudict is None:
+        with _cmudict_lock:
+            if _cmudict is None:
+                try:
+                    import nltk
+                    _cmudict = nltk.corpus.cmudict.dict()
+                except (ImportError, LookupError):
+                    # no runtime download; hyphenation alone is a close estimate
+                    logger.warning("CMU pronouncing dictionary unavailable; counting syllables with pyphen only")
+                    _cmudict = {}
+    return _cmudict
+
+
+def derive_syllables(word: str) -> int:
+    """Syllables of one lowercased word, from the CMU dictionary or pyphen."""
+    phones = _get_cmudict().get(word)
+    if phones:
+        return sum(1 for phone in phones[0] if phone[-1].isdigit())
+    return len(_hyphenator.positions(word)) + 1
+
+
+def load_syllable_dictionary(path: str = SYLLABLE_DICTIONARY_PATH) -> Dict[str, int]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["words"]
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, KeyError):
+        logger.exception("Failed to load syllable dictionary from %s", path)
+        return {}
+
+
+_common_syllables = load_syllable_dictionary()
+
+
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def _cached_syllables(word: str) -> int:
+    return derive_syllables(word)
+
+
+def syllable_count(word: str) -> int:
+    """Syllables of one lowercased word."""
+    count = _common_syllables.get(word)
+    if count is None:
+        count = _cached_syllables(word)
+    return count
+
+
+def count_syllables(words: Iterable[str]) -> int:
+    # resumes repeat their vocabulary; look each distinct word up once
+    return sum(
+        syllable_count(word.lower()) * occurrences
+        for word, occurrences in Counter(words).items()
+    )
+
+
+def syllable_cache_stats() -> Dict:
+    info = _cached_syllables.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "dictionary_words": len(_common_syllables),
+        "entries": info.currsize,
+        "max_entries": info.maxsize,
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Flesch Reading Ease
+# ---------------------------------------------------------------------------
+
+def _flesch(word_count: int, sentence_count: int, syllables: int) -> float:
+    words_per_sentence = word_count / sentence_count if sentence_count else 0.0
+    syllables_per_word = syllables / word_count if word_count else 0.0
+
+    if words_per_sentence == 0 or syllables_per_word == 0:
+        return 0.0
+    return (
+        FRE_BASE
+        - FRE_SENTENCE_LENGTH * words_per_sentence
+        - FRE_SYLLABLES_PER_WORD * syllables_per_word
+    )
+
+
+def compute_readability(text: str) -> Readability:
+    words = list_words(text)
+    word_count = len(words)
+    sentence_count = count_sentences(text)
+    syllables = count_syllables(words)
+
+    return Readability(word_count, sentence_count, syllables, _flesch(word_count, sentence_count, syllables))
+
+
+@timed("readability.flesch_reading_ease")
+def flesch_reading_ease(text: str) -> float:
+    return compute_readability(text).flesch_reading_ease
+
+
+@timed("readability.flesch_from_counts")
+def flesch_from_counts(word_counts: Mapping[str, int], sentence_count: int) -> float:
+    """
+    Flesch Reading Ease from an already tokenized text.
+
+    Args:
+        word_counts: Lowercased words as `list_words` splits them, with counts
+        sentence_count: Sentences as `count_sentences` counts them
+    """
+    word_count = sum(word_counts.values())
+    syllables = sum(syllable_count(word) * occurrences for word, occurrences in word_counts.items())
+    return _flesch(word_count, sentence_count, syllables)
+
+
+# ---------------------------------------------------------------------------
+# Bundled dictionary
+# ---------------------------------------------------------------------------
+
+def build_syllable_dictionary(documents: Iterable[str], top: int, base: Iterable[str] = ()) -> Dict[str, int]:
+    """Syllable counts of the `top` most frequent corpus words plus `base`."""
+    frequencies: Counter = Counter()
+    for document in documents:
+        frequencies.update(word.lower() for word in list_words(document))
+
+    words = set(base) | {word for word, _ in frequencies.most_common(top)}
+    return {word: derive_syllables(word) for word in sorted(words)}
+
+
+def save_syllable_dictionary(words: Dict[str, int], path: str = SYLLABLE_DICTIONARY_PATH) -> None:
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"words": words}, f, indent=0, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the bundled syllable dictionary")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("corpus", nargs="+", help="Corpus files or directories (.txt, .jsonl)")
+    parser.add_argument("--top", type=int, default=2000, help="Most frequent corpus words to include")
+    parser.add_argument("--out", default=SYLLABLE_DICTIONARY_PATH)
+    parser.add_argument("--replace", action="store_true", help="Drop the words already in the dictionary")
+    args = parser.parse_args()
+
+    base = () if args.replace else load_syllable_dictionary(args.out).keys()
+    words = build_syllable_dictionary(iter_corpus(args.corpus), args.top, base)
+    save_syllable_dictionary(words, args.out)
+    print(f"Syllable dictionary: {len(words)} words -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,74 +1,77 @@
-from app.services.skill_extractor import extract_skills_from_section
+from app.services.skill_extractor import extract_skills_from_section, extract_skills_from_text
 from app.services.education_extractor import extract_education
 from app.services.experience_extractor import extract_experience
 from app.services.project_extractor import extract_projects
-import re
-
-SECTION_HEADERS = {
-    "skills": "SKILLS",
-    "education": "EDUCATION",
-    "projects": "PROJECTS",
-    "experience": "EXPERIENCE",
-    "achievements": "ACHIEVEMENTS",
-    "positions": "POSITIONS OF RESPONSIBILITY"
-}
-
-
-def detect_sections(text: str) -> dict:
-    upper = text.upper()
+from app.services.section_segmenter import (
+    SECTION_HEADERS,
+    SectionSpan,
+    segment,
+    section_texts
+)
+from app.services.skill_taxonomy import get_taxonomy
+from app.services.metrics import stage, timed
+from typing import Optional
+
+def detect_sections(text: str, spans: Optional[list[SectionSpan]] = None) -> dict:
+    if spans is None:
+        spans = segment(text)
+    found = {span.key for span in spans}
     return {
-        key: header in upper
-        for key, header in SECTION_HEADERS.items()
+        key: key in found
+        for key in SECTION_HEADERS
     }
 
-def extract_raw_sections(text: str) -> dict:
-    lines = text.splitlines()
-    section_indices = {}
-
-    # find line indices of each section header
-    for i, line in enumerate(lines):
-        normalized = line.strip().upper()
-        for key, header in SECTION_HEADERS.items():
-            if normalized == header:
-                section_indices[key] = i
-
-    # sort sections by appearance
-    ordered = sorted(section_indices.items(), key=lambda x: x[1])
-
-    raw_sections = {}
-
-    for idx, (section, start) in enumerate(ordered):
-        end = (
-            ordered[idx + 1][1]
-            if idx + 1 < len(ordered)
-            else len(lines)
-        )
-
-        raw_text = "\n".join(lines[start + 1 : end]).strip()
-        raw_sections[section] = raw_text
+def extract_raw_sections(text: str, spans: Optional[list[SectionSpan]] = None) -> dict:
+    if spans is None:
+        spans = segment(text)
+    return section_texts(text, spans)
 
-    return raw_sections
 
+# Structured extractors, one per section they read
+SECTION_EXTRACTORS = {
+    "education": extract_education,
+    "experience": extract_experience,
+    "projects": extract_projects,
+}
 
-def get_analysis(content: str):
-
-    sections_present = detect_sections(content)
-    raw_sections = extract_raw_sections(content)
 
+@timed("resume_analyzer.extract_skills")
+def extract_skills(raw_sections: dict, content: str) -> list[str]:
     skills = extract_skills_from_section(raw_sections.get("skills", ""))
     # Fallback: if no skills found in dedicated section, scan full content
     if not skills:
-        skills = extract_skills_from_section(content)
-
-    education = extract_education(raw_sections.get("education", ""))
-    experience = extract_experience(raw_sections.get("experience", ""))
-    projects = extract_projects(raw_sections.get("projects", ""))
-
-    return {
+        skills = extract_skills_from_text(content)
+    return skills
+
+
+@timed("resume_analyzer.get_analysis")
+def get_analysis(content: str, sections: Optional[dict] = None):
+    """
+    Analyze resume text.
+
+    `sections` are raw section texts already segmented during extraction
+    (see resume_parser.extract_pdf_document); when given, header detection
+    over the full text is skipped.
+    """
+    if sections is not None:
+        raw_sections = {key: text for key, text in sections.items() if key in SECTION_HEADERS}
+        sections_present = {key: key in raw_sections for key in SECTION_HEADERS}
+    else:
+        with stage("resume_analyzer.segment"):
+            spans = segment(content)
+        sections_present = detect_sections(content, spans)
+        raw_sections = extract_raw_sections(content, spans)
+
+    analysis = {
         "sections": sections_present,
         "raw_sections": raw_sections,
-        "skills": skills,
-        "education": education,
-        "experience": experience,
-        "projects": projects,
-    }
\ No newline at end of file
+        "skills": extract_skills(raw_sections, content),
+    }
+    for key, extractor in SECTION_EXTRACTORS.items():
+        with stage(f"resume_analyzer.extract_{key}"):
+            analysis[key] = extractor(raw_sections.get(key, ""))
+
+    # which taxonomy produced the skills and categories
+    analysis["taxonomy_version"] = get_taxonomy().version
+
+    return analysis
\ No newline at end of file
@@ -1,20 +1,456 @@
 import pymupdf
 from docx import Document
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
+from typing import Iterator, NamedTuple, Optional
+import xml.etree.ElementTree as ET
+import multiprocessing
+import zipfile
+import logging
+import time
 import io
+import os
 import re
 
-def extract_textpdf(file_bytes):
-    doc = pymupdf.open(stream=file_bytes, filetype="pdf")
+from app.services.metrics import timed
+from app.services.section_segmenter import match_header, match_styled_header
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever extraction output changes; cached text is keyed on it
+PARSER_VERSION = "6"
+
+NON_ASCII_PATTERN = re.compile(r"[^\x00-\x7F]+")
+
+# Pages beyond this cap are not extracted at all
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "50"))
+
+# Page fan-out over worker processes; small documents stay inline
+PDF_EXTRACT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", str(min(4, os.cpu_count() or 1))))
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "8"))
+PDF_PAGES_PER_TASK = int(os.getenv("PDF_PAGES_PER_TASK", "4"))
+
+# "inline" parses in the request process, "sandbox" in resource-limited workers
+EXTRACTION_MODE = os.getenv("EXTRACTION_MODE", "inline")
+
+# Pages slower than this are logged as warnings
+PDF_SLOW_PAGE_SECONDS = float(os.getenv("PDF_SLOW_PAGE_SECONDS", "0.5"))
+
+
+# Span flag bit pymupdf sets for bold text
+BOLD_FLAG = 16
+
+# Styled section headers: short lines in bold or noticeably larger than body text
+HEADER_SIZE_RATIO = 1.15
+HEADER_MAX_WORDS = 5
+
+# A page is read as two columns when each side of a gutter holds this share of its text
+COLUMN_MIN_SHARE = 0.2
+
+
+class PageTiming(NamedTuple):
+    page: int
+    blocks: int
+    seconds: float
+
+
+class TextLine(NamedTuple):
+    text: str
+    size: float
+    bold: bool
+
+
+class TextBlock(NamedTuple):
+    page: int
+    bbox: tuple[float, float, float, float]
+    lines: tuple[TextLine, ...]
+
+    @property
+    def text(self) -> str:
+        return "".join(line.text + "\n" for line in self.lines)
+
+
+class PdfDocument(NamedTuple):
+    text: str
+    sections: dict[str, str]
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """Lazily create the shared page-extraction pool."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=PDF_EXTRACT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def _as_pdf_stream(source):
+    # pymupdf takes bytes or a memoryview; a memoryview over an mmap avoids a copy
+    if isinstance(source, (bytes, memoryview)):
+        return source
+    return memoryview(source)
+
+
+def _read_line(line: dict) -> Optional[TextLine]:
+    spans = [span for span in line["spans"] if span["text"]]
+    if not spans:
+        return None
+
+    visible = [span for span in spans if span["text"].strip()]
+    bold = bool(visible) and all(
+        span["flags"] & BOLD_FLAG or "bold" in span["font"].lower()
+        for span in visible
+    )
+
+    return TextLine(
+        text=NON_ASCII_PATTERN.sub(" ", "".join(span["text"] for span in spans)),
+        size=round(max(span["size"] for span in spans), 1),
+        bold=bold,
+    )
+
+
+def _find_gutter(blocks: list[TextBlock], width: float) -> Optional[float]:
+    """
+    Return the x position separating two text columns, if the page has them.
+
+    Candidates are block left edges in the middle of the page; the one with
+    the widest empty strip to its left wins, provided both sides carry a fair
+    share of the text.
+    """
+    chars = [len(block.text) for block in blocks]
+    total = sum(chars)
+    best = None
+
+    for x0 in sorted({block.bbox[0] for block in blocks}):
+        if not 0.2 * width < x0 < 0.8 * width:
+            continue
+
+        gutter = x0 - 1
+        left = [(block, n) for block, n in zip(blocks, chars) if block.bbox[2] <= gutter]
+        right = sum(n for block, n in zip(blocks, chars) if block.bbox[0] >= gutter)
+
+        if min(sum(n for _, n in left), right) < COLUMN_MIN_SHARE * total:
+            continue
+
+        strip = x0 - max(block.bbox[2] for block, _ in left)
+        if best is None or strip > best[0]:
+            best = (strip, gutter)
+
+    return best[1] if best else None
+
+
+def order_columns(blocks: list[TextBlock], width: float) -> list[TextBlock]:
+    """
+    Put multi-column pages into reading order.
+
+    Blocks crossing the gutter (names, full-width headers) split the page into
+    bands; within a band the left column is read before the right. Single
+    column pages keep pymupdf's order.
+    """
+    gutter = _find_gutter(blocks, width)
+    if gutter is None:
+        return blocks
+
+    ordered: list[TextBlock] = []
+    left: list[TextBlock] = []
+    right: list[TextBlock] = []
+
+    def close_band():
+        ordered.extend(sorted(left, key=lambda b: b.bbox[1]))
+        ordered.extend(sorted(right, key=lambda b: b.bbox[1]))
+        left.clear()
+        right.clear()
+
+    for block in sorted(blocks, key=lambda b: b.bbox[1]):
+        if block.bbox[2] <= gutter:
+            left.append(block)
+        elif block.bbox[0] >= gutter:
+            right.append(block)
+        else:
+            close_band()
+            ordered.append(block)
+
+    close_band()
+    return ordered
+
+
+def _extract_page(page, number: int) -> tuple[list[TextBlock], PageTiming]:
+    started = time.perf_counter()
+    layout = page.get_text("dict")
+
     blocks = []
+    for block in layout["blocks"]:
+        # skip image blocks
+        if block["type"] != 0:
+            continue
+        lines = tuple(filter(None, (_read_line(line) for line in block["lines"])))
+        if lines:
+            blocks.append(TextBlock(number, tuple(block["bbox"]), lines))
 
-    for page in doc:
-        for b in page.get_text("blocks"):
-            text = b[4]  # block text
-            text = re.sub(r"[^\x00-\x7F]+", " ", text)
-            blocks.append(text)
+    blocks = order_columns(blocks, layout["width"])
+    return blocks, PageTiming(number, len(blocks), time.perf_counter() - started)
 
-    return "\n".join(blocks)
 
-def extract_textdocs(file_bytes):
-    doc = Document(io.BytesIO(file_bytes))
+def _extract_page_range(file_bytes, start: int, end: int) -> list[tuple[list[TextBlock], PageTiming]]:
+    """Pool worker: reopen the document from the shared bytes and extract pages [start, end)."""
+    doc = pymupdf.open(stream=file_bytes, filetype="pdf")
+    try:
+        return [_extract_page(doc[number], number) for number in range(start, end)]
+    finally:
+        doc.close()
+
+
+def iter_pdf_blocks(
+    file_bytes,
+    max_pages: Optional[int] = None,
+    timings: Optional[list[PageTiming]] = None,
+) -> Iterator[TextBlock]:
+    """
+    Yield the text blocks of a PDF in reading order.
+
+    Documents with at least PDF_PARALLEL_MIN_PAGES pages are split into page
+    ranges and extracted on the process pool; each worker reopens the document
+    from the bytes. Per-page timings are appended to `timings` when given.
+    """
+    max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+
+    doc = pymupdf.open(stream=_as_pdf_stream(file_bytes), filetype="pdf")
+    try:
+        page_count = min(doc.page_count, max_pages)
+        if doc.page_count > page_count:
+            logger.info("PDF has %d pages, extracting first %d", doc.page_count, page_count)
+
+        if page_count < PDF_PARALLEL_MIN_PAGES or PDF_EXTRACT_WORKERS < 2:
+            for number in range(page_count):
+                blocks, timing = _extract_page(doc[number], number)
+                if timings is not None:
+                    timings.append(timing)
+                yield from blocks
+            return
+    finally:
+        doc.close()
+
+    starts = range(0, page_count, PDF_PAGES_PER_TASK)
+    ends = [min(start + PDF_PAGES_PER_TASK, page_count) for start in starts]
+
+    # workers need picklable bytes; mapped uploads are copied once here
+    shared = file_bytes if isinstance(file_bytes, bytes) else bytes(file_bytes)
+
+    # map() yields results in submission order, so pages stream out in order
+    for pages in get_pdf_pool().map(
+        _extract_page_range, [shared] * len(ends), starts, ends
+    ):
+        for blocks, timing in pages:
+            if timings is not None:
+                timings.append(timing)
+            yield from blocks
+
+
+def log_page_timings(timings: list[PageTiming], label: str = "pdf") -> None:
+    if not timings:
+        return
+
+    total = sum(t.seconds for t in timings)
+    slowest = max(timings, key=lambda t: t.seconds)
+    logger.info(
+        "Extracted %s: %d pages in %.3fs (slowest page %d: %.3fs, %d blocks)",
+        label, len(timings), total, slowest.page + 1, slowest.seconds, slowest.blocks
+    )
+
+    for t in timings:
+        if t.seconds >= PDF_SLOW_PAGE_SECONDS:
+            logger.warning(
+                "Slow PDF page in %s: page %d took %.3fs (%d blocks)",
+                label, t.page + 1, t.seconds, t.blocks
+            )
+
+
+def body_font_size(blocks: list[TextBlock]) -> float:
+    """Most common font size, weighted by characters."""
+    weights = Counter()
+    for block in blocks:
+        for line in block.lines:
+            weights[line.size] += len(line.text)
+    return weights.most_common(1)[0][0] if weights else 0.0
+
+
+def header_key(line: TextLine, body_size: float) -> Optional[str]:
+    """
+    Return the section key if `line` is a section header.
+
+    Any line that is exactly a known header counts, as in plain-text
+    segmentation. Styled lines (bold or larger than body text) also count
+    when they are a header phrase plus a known suffix ("Skills Summary") or
+    trailing punctuation; a styled project title or employer that only
+    contains a header word ("Education Portal") is not a header.
+    """
+    text = line.text.strip()
+    if not text or len(text.split()) > HEADER_MAX_WORDS:
+        return None
+
+    key = match_header(text)
+    if key is not None:
+        return key
+
+    if line.bold or line.size >= body_size * HEADER_SIZE_RATIO:
+        return match_styled_header(text)
+
+    return None
+
+
+@timed("resume_parser.extract_pdf_document")
+def extract_pdf_document(file_bytes, max_pages: Optional[int] = None, label: str = "pdf") -> PdfDocument:
+    """
+    Extract a PDF into its full text plus raw section texts.
+
+    Section headers are tagged from block font metadata while the text is
+    assembled, so the analyzer doesn't need to rescan the text for them.
+    """
+    timings: list[PageTiming] = []
+    blocks = list(iter_pdf_blocks(file_bytes, max_pages=max_pages, timings=timings))
+    log_page_timings(timings, label)
+
+    body_size = body_font_size(blocks)
+    section_lines: dict[str, list[str]] = {}
+    current: Optional[list[str]] = None
+
+    for block in blocks:
+        for line in block.lines:
+            key = header_key(line, body_size)
+            if key is not None:
+                # a repeated key (e.g. "Work Experience" then "Internships")
+                # continues the same section after a blank line
+                current = section_lines.setdefault(key, [])
+                if current:
+                    current.append("")
+            elif current is not None:
+                current.append(line.text)
+        # block boundaries read as blank lines, as in the joined text
+        if current is not None:
+            current.append("")
+
+    return PdfDocument(
+        text="\n".join(block.text for block in blocks),
+        sections={
+            key: "\n".join(lines).strip()
+            for key, lines in section_lines.items()
+        },
+    )
+
+
+def extract_textpdf(file_bytes, max_pages: Optional[int] = None, label: str = "pdf"):
+    timings: list[PageTiming] = []
+    text = "\n".join(
+        block.text
+        for block in iter_pdf_blocks(file_bytes, max_pages=max_pages, timings=timings)
+    )
+    log_page_timings(timings, label)
+    return text
+
+
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_P = WORD_NS + "p"
+W_T = WORD_NS + "t"
+W_TAB = WORD_NS + "tab"
+W_BREAKS = (WORD_NS + "br", WORD_NS + "cr")
+
+
+def _as_file(source):
+    # mapped uploads are file-like already; only raw bytes need wrapping
+    if hasattr(source, "seek"):
+        source.seek(0)
+        return source
+    return io.BytesIO(source)
+
+
+def iter_docx_paragraphs(file_bytes) -> Iterator[str]:
+    """
+    Stream paragraph text out of word/document.xml without building a DOM.
+
+    Paragraphs inside table cells are included. Elements are discarded as
+    soon as their paragraph is emitted, so memory stays flat for large files.
+    """
+    with zipfile.ZipFile(_as_file(file_bytes)) as archive:
+        with archive.open("word/document.xml") as xml:
+            # one buffer per open paragraph; text boxes nest paragraphs
+            open_paragraphs: list[list[str]] = []
+            depth = 0
+            body = None
+
+            for event, elem in ET.iterparse(xml, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if depth == 2:
+                        body = elem
+                    if elem.tag == W_P:
+                        open_paragraphs.append([])
+                    continue
+
+                depth -= 1
+                tag = elem.tag
+
+                if open_paragraphs:
+                    if tag == W_T:
+                        open_paragraphs[-1].append(elem.text or "")
+                    elif tag == W_TAB:
+                        open_paragraphs[-1].append("\t")
+                    elif tag in W_BREAKS:
+                        open_paragraphs[-1].append("\n")
+
+                if tag == W_P:
+                    yield "".join(open_paragraphs.pop())
+
+                # top-level body children are fully consumed once closed
+                if depth == 2 and body is not None:
+                    body.clear()
+
+
+def extract_textdocs_dom(file_bytes):
+    doc = Document(_as_file(file_bytes))
     return "\n".join(paragraph.text for paragraph in doc.paragraphs)
+
+
+@timed("resume_parser.extract_textdocs")
+def extract_textdocs(file_bytes):
+    try:
+        return "\n".join(iter_docx_paragraphs(file_bytes))
+    except (zipfile.BadZipFile, KeyError, ET.ParseError):
+        logger.warning("Streaming DOCX parse failed, falling back to python-docx", exc_info=True)
+        return extract_textdocs_dom(file_bytes)
+
+
+def extract_document_inline(file_bytes, file_type: str, label: str = "document") -> dict:
+    if file_type == "pdf":
+        document = extract_pdf_document(file_bytes, label=label)
+        return {"text": document.text, "sections": document.sections}
+    if file_type == "docx":
+        return {"text": extract_textdocs(file_bytes), "sections": None}
+    raise ValueError(f"Unsupported file type: {file_type}")
+
+
+@timed("resume_parser.extract_document")
+def extract_document(file_bytes, file_type: str, label: str = "document", mode: Optional[str] = None) -> dict:
+    """
+    Extract an uploaded resume.
+
+    Args:
+        mode: "inline" parses in this process; "sandbox" parses in a
+            resource-limited worker (see extraction_sandbox). Defaults to
+            EXTRACTION_MODE.
+
+    Returns:
+        {"text": full text, "sections": raw section texts or None}.
+        Sections are only pre-segmented for PDFs.
+    """
+    mode = mode or EXTRACTION_MODE
+
+    if mode == "sandbox":
+        from app.services.extraction_sandbox import get_sandbox_pool
+        return get_sandbox_pool().run(file_bytes, file_type, label=label)
+
+    return extract_document_inline(file_bytes, file_type, label=label)
@@ -0,0 +1,159 @@
+"""
+Section Segmenter
+Splits resume text into sections in a single scan.
+
+All header synonyms are compiled once into one anchored alternation, so
+every line is classified by a single regex pass over the text. Sections are
+returned as offsets into the original string; callers slice only what they
+need. Several headers can map to one key ("WORK EXPERIENCE" and
+"INTERNSHIPS" are both experience); each occurrence is its own span, and
+`section_texts` joins them.
+"""
+
+from typing import NamedTuple, Optional
+import re
+
+# Canonical header for each section key
+SECTION_HEADERS = {
+    "skills": "SKILLS",
+    "education": "EDUCATION",
+    "projects": "PROJECTS",
+    "experience": "EXPERIENCE",
+    "achievements": "ACHIEVEMENTS",
+    "positions": "POSITIONS OF RESPONSIBILITY"
+}
+
+# Header variants seen in real resumes, per section key
+HEADER_SYNONYMS = {
+    "skills": [
+        "SKILLS", "TECHNICAL SKILLS", "KEY SKILLS", "CORE SKILLS", "SKILL SET",
+        "SKILLS & TOOLS", "SKILLS & INTERESTS", "TECHNICAL PROFICIENCIES",
+        "CORE COMPETENCIES",
+    ],
+    "education": [
+        "EDUCATION", "ACADEMIC BACKGROUND", "ACADEMIC QUALIFICATIONS",
+        "EDUCATIONAL QUALIFICATIONS", "ACADEMICS", "EDUCATION & TRAINING",
+    ],
+    "projects": [
+        "PROJECTS", "PERSONAL PROJECTS", "ACADEMIC PROJECTS", "KEY PROJECTS",
+        "SELECTED PROJECTS", "SIDE PROJECTS", "TECHNICAL PROJECTS",
+    ],
+    "experience": [
+        "EXPERIENCE", "WORK EXPERIENCE", "PROFESSIONAL EXPERIENCE",
+        "EMPLOYMENT HISTORY", "WORK HISTORY", "INTERNSHIPS",
+        "INTERNSHIP EXPERIENCE", "RELEVANT EXPERIENCE",
+    ],
+    "achievements": [
+        "ACHIEVEMENTS", "ACCOMPLISHMENTS", "AWARDS", "AWARDS & ACHIEVEMENTS",
+        "HONORS & AWARDS", "CERTIFICATIONS & ACHIEVEMENTS",
+    ],
+    "positions": [
+        "POSITIONS OF RESPONSIBILITY", "POSITION OF RESPONSIBILITY",
+        "LEADERSHIP", "LEADERSHIP EXPERIENCE", "LEADERSHIP & ACTIVITIES",
+    ],
+}
+
+
+class SectionSpan(NamedTuple):
+    key: str
+    header_start: int   # offset of the header line
+    start: int          # first character after the header line
+    end: int            # start of the next header line, or len(text)
+
+
+def normalize_header(text: str) -> str:
+    return " ".join(text.upper().replace("&", " AND ").split())
+
+
+def _synonym_pattern(synonym: str) -> str:
+    words = [
+        r"(?:&|AND)" if word == "&" else re.escape(word)
+        for word in synonym.split()
+    ]
+    return r"[ \t]+".join(words)
+
+
+HEADER_LOOKUP = {
+    normalize_header(synonym): key
+    for key, synonyms in HEADER_SYNONYMS.items()
+    for synonym in synonyms
+}
+
+# longest first so "WORK EXPERIENCE" wins over "EXPERIENCE"
+_ALTERNATION = "|".join(
+    _synonym_pattern(synonym)
+    for synonym in sorted(
+        {s for synonyms in HEADER_SYNONYMS.values() for s in synonyms},
+        key=len,
+        reverse=True,
+    )
+)
+
+# a header line: optional indent, the header, optional colon, nothing else
+HEADER_LINE_PATTERN = re.compile(
+    rf"^[ \t]*(?P<header>{_ALTERNATION})[ \t]*:?[ \t]*\r?$",
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Words that may follow a header on a styled (bold / large) PDF line,
+# e.g. "Skills Summary"
+STYLED_HEADER_SUFFIXES = ["SUMMARY", "OVERVIEW", "HIGHLIGHTS", "DETAILS"]
+
+# a styled header: the header, optionally one known suffix; trailing
+# punctuation is stripped before matching
+STYLED_HEADER_PATTERN = re.compile(
+    rf"(?P<header>{_ALTERNATION})(?:[ \t]+(?:{'|'.join(STYLED_HEADER_SUFFIXES)}))?",
+    re.IGNORECASE
+)
+STYLED_HEADER_TRAILING = " \t:;.,-\u2013\u2014|"
+
+
+def match_header(line: str) -> Optional[str]:
+    """Section key if the whole line is a header, else None."""
+    match = HEADER_LINE_PATTERN.match(line.strip())
+    return HEADER_LOOKUP[normalize_header(match.group("header"))] if match else None
+
+
+def match_styled_header(line: str) -> Optional[str]:
+    """
+    Section key if a styled line is a header phrase, possibly with a known
+    suffix ("Skills Summary"), else None. A line that merely contains a
+    header word ("Education Portal", "Skills Academy Inc.") is not a header.
+    """
+    match = STYLED_HEADER_PATTERN.fullmatch(line.strip().rstrip(STYLED_HEADER_TRAILING))
+    return HEADER_LOOKUP[normalize_header(match.group("header"))] if match else None
+
+
+def segment(text: str) -> list[SectionSpan]:
+    """
+    Locate every section in one pass.
+
+    Each section runs from the line after its header to the next header.
+    Spans are in text order; a key appears once per header occurrence.
+    """
+    headers = [
+        (HEADER_LOOKUP[normalize_header(m.group("header"))], m.start(), m.end())
+        for m in HEADER_LINE_PATTERN.finditer(text)
+    ]
+
+    spans: list[SectionSpan] = []
+    for i, (key, header_start, header_end) in enumerate(headers):
+        end = headers[i + 1][1] if i + 1 < len(headers) else len(text)
+        spans.append(SectionSpan(key, header_start, min(header_end + 1, end), end))
+
+    return spans
+
+
+def section_text(text: str, span: SectionSpan) -> str:
+    return text[span.start:span.end].strip()
+
+
+def section_texts(text: str, spans: list[SectionSpan]) -> dict[str, str]:
+    """Raw text per section key; repeated sections are joined in text order."""
+    parts: dict[str, list[str]] = {}
+    for span in spans:
+        bodies = parts.setdefault(span.key, [])
+        body = section_text(text, span)
+        if body:
+            bodies.append(body)
+    return {key: "\n\n".join(bodies) for key, bodies in parts.items()}
@@ -10,7 +10,9 @@ os.environ['TRANSFORMERS_NO_TF'] = '1'
 from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
-from typing import List, Tuple, Dict
+from typing import List, Optional, Tuple, Dict
+
+from app.services.metrics import stage, timed
 
 # Cache the model in memory (lazy loading)
 _model = None
@@ -25,7 +27,8 @@ def get_model() -> SentenceTransformer:
     """
     global _model
     if _model is None:
-        _model = SentenceTransformer('all-MiniLM-L6-v2')
+        with stage("semantic_skill_matcher.load_model"):
+            _model = SentenceTransformer('all-MiniLM-L6-v2')
     return _model
 
 
@@ -35,6 +38,7 @@ MATCH_THRESHOLD = 0.90  # Almost exact match
 PARTIAL_THRESHOLD = 0.80  # Strict partial match to ensure Java != JavaScript
 
 
+@timed("semantic_skill_matcher.compute_skill_embeddings")
 def compute_skill_embeddings(skills: List[str]) -> np.ndarray:
     """
     Compute embeddings for a list of skills.
@@ -94,9 +98,11 @@ def match_single_skill(
     return (best_jd_skill, float(best_score), match_type)
 
 
+@timed("semantic_skill_matcher.semantic_skill_matching")
 def semantic_skill_matching(
     resume_skills: List[str],
-    jd_skills: List[str]
+    jd_skills: List[str],
+    jd_embeddings: Optional[np.ndarray] = None
 ) -> Dict:
     """
     Perform semantic matching between resume skills and job description skills.
@@ -104,6 +110,8 @@ def semantic_skill_matching(
     Args:
         resume_skills: Skills from resume
         jd_skills: Skills from job description
+        jd_embeddings: Precomputed embeddings of `jd_skills` (e.g. from a
+            JobProfile); computed here when omitted
         
     Returns:
         Dictionary with matched, partial, and missing skills
@@ -127,7 +135,8 @@ def semantic_skill_matching(
     
     # Compute embeddings
     resume_embeddings = compute_skill_embeddings(resume_skills)
-    jd_embeddings = compute_skill_embeddings(jd_skills)
+    if jd_embeddings is None:
+        jd_embeddings = compute_skill_embeddings(jd_skills)
     
     # Track which JD skills have been matched
     jd_matched = set()
@@ -1,34 +1,26 @@
-SKILL_VOCAB = {
-    # languages
-    "c", "c++", "c#", "python", "javascript", "sql", "kotlin",
+import re
 
-    # frameworks / libraries
-    "fastapi", "react", "flutter", "express", "node.js",
+from app.services.skill_taxonomy import get_taxonomy
 
-    # databases / infra
-    "mongodb", "firebase", "aws",
-
-    # tools
-    "git", "github", "postman", "vs code", "docker", "faiss"
-}
-
-def normalize(text: str) -> str:
-    return (
-        text.lower()
-        .replace("&", "and")
-        .replace(".", "")
-        .replace("-", " ")
-    )
+# labelled skill lists outside a skills section ("Skills: React, Express")
+SKILL_LIST_LINE_PATTERN = re.compile(
+    r"^[ \t]*(?:[\w&/+-]+[ \t]+){0,2}(?:skills|technologies|tech stack|tools|languages|frameworks)[ \t]*:(?P<items>.*)$",
+    re.IGNORECASE | re.MULTILINE
+)
 
 def extract_skills_from_section(skills_text: str) -> list[str]:
     if not skills_text:
         return []
 
-    normalized_text = normalize(skills_text)
-    found = set()
+    # a skills section lists skills, so names like "Express" count there
+    return get_taxonomy().find_listed_skills(skills_text)
 
-    for skill in SKILL_VOCAB:
-        if normalize(skill) in normalized_text:
-            found.add(skill)
+def extract_skills_from_text(text: str) -> list[str]:
+    if not text:
+        return []
 
-    return sorted(found)
\ No newline at end of file
+    taxonomy = get_taxonomy()
+    skills = set(taxonomy.find_skills(text))
+    for match in SKILL_LIST_LINE_PATTERN.finditer(text):
+        skills.update(taxonomy.find_listed_skills(match.group("items")))
+    return sorted(skills)
@@ -0,0 +1,140 @@
+"""
+Skill Matcher
+Multi-pattern skill matching with an Aho-Corasick automaton.
+
+The automaton is built once per vocabulary, so a scan is one linear pass
+over the normalized text no matter how many skills there are. Matches are
+only kept on word boundaries, so "c" no longer matches inside "docker".
+"""
+
+from collections import deque
+from typing import Iterable, Mapping, NamedTuple, Union
+import re
+
+
+# Bump when matching semantics change; cached analyses are keyed on it
+MATCHER_VERSION = "2"
+
+
+class SkillMatch(NamedTuple):
+    skill: str
+    start: int   # offsets into the normalized text
+    end: int
+
+
+# characters that continue a word, e.g. the "++" in "c++" or the "#" in "c#"
+WORD_CHARS = frozenset("+#_")
+
+# a dot inside a word ("node.js"); a leading one (".net") is kept
+INNER_DOT_PATTERN = re.compile(r"(?<=\w)\.(?=\w)")
+
+
+def normalize(text: str) -> str:
+    text = (
+        text.lower()
+        .replace("&", "and")
+        .replace("-", " ")
+    )
+    return INNER_DOT_PATTERN.sub("", text)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char in WORD_CHARS
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over a skill vocabulary.
+
+    `vocabulary` is either skill names, or a mapping of pattern -> skill so
+    several aliases can report the same canonical skill.
+    """
+
+    def __init__(self, vocabulary: Union[Iterable[str], Mapping[str, str]]):
+        # state 0 is the root; each state has goto edges, a failure link and outputs
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[tuple[str, int]]] = [[]]
+        self.size = 0
+
+        if isinstance(vocabulary, Mapping):
+            entries = vocabulary.items()
+        else:
+            entries = ((skill, skill) for skill in vocabulary)
+
+        for raw_pattern, skill in entries:
+            pattern = normalize(raw_pattern)
+            if pattern:
+                self._add(pattern, skill)
+                self.size += 1
+
+        self._link()
+
+    def _add(self, pattern: str, skill: str) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state].append((skill, len(pattern)))
+
+    def _link(self) -> None:
+        # breadth-first, so every failure target is linked before it is used
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find_normalized(self, text: str) -> list[SkillMatch]:
+        """Every whole-word occurrence in already-normalized text."""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        length = len(text)
+
+        matches = []
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            if not output[state]:
+                continue
+
+            end = index + 1
+            if end < length and _is_word_char(text[end]):
+                continue
+            for skill, pattern_length in output[state]:
+                start = end - pattern_length
+                if start == 0 or not _is_word_char(text[start - 1]):
+                    matches.append(SkillMatch(skill, start, end))
+
+        return matches
+
+    def find(self, text: str) -> list[SkillMatch]:
+        """
+        Locate every vocabulary skill in the text.
+
+        Returns:
+            Matches in order of end offset; offsets refer to normalize(text)
+        """
+        return self.find_normalized(normalize(text))
+
+    def find_skills(self, text: str) -> list[str]:
+        """Sorted, de-duplicated skills present in the text."""
+        return sorted({match.skill for match in self.find(text)})
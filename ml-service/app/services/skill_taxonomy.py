@@ -0,0 +1,300 @@
+"""
+Skill Taxonomy Service
+Single source of skill knowledge for every service.
+
+The taxonomy is loaded once from app/data/skill_taxonomy.json and compiled
+into frozen lookups: alias -> canonical skill, per-skill ATS category and
+job-matching domain arrays, and an Aho-Corasick matcher over all aliases.
+Categorizing a known skill is a dict lookup instead of a keyword scan.
+
+The taxonomy can be reloaded at runtime. A new SkillTaxonomy is fully built
+before it replaces the current one with a single reference swap, so readers
+see either the old or the new index, never a half-built one. A request can
+pin the taxonomy it started with so every stage sees the same version.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from app.services.skill_matcher import SkillMatcher, normalize
+
+logger = logging.getLogger(__name__)
+
+SKILL_TAXONOMY_PATH = os.getenv("SKILL_TAXONOMY_PATH") or os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data", "skill_taxonomy.json"
+)
+# Poll the taxonomy file for changes every N seconds; 0 disables the watcher
+SKILL_TAXONOMY_WATCH_SECONDS = float(os.getenv("SKILL_TAXONOMY_WATCH_SECONDS", "0"))
+
+
+class TaxonomyError(ValueError):
+    """Raised when taxonomy data is malformed."""
+
+
+class SkillTaxonomy:
+    """Compiled, read-only view of a taxonomy file."""
+
+    def __init__(self, data: Dict):
+        validate_taxonomy(data)
+
+        # the file's version label plus a digest of the content, so an edit
+        # that forgets to bump the label still invalidates cached analyses,
+        # job profiles and worker processes
+        self.version: str = f"{data['version']}-{taxonomy_digest(data)}"
+        self.ats_category_names: tuple[str, ...] = tuple(data["ats_categories"])
+        self.domain_names: tuple[str, ...] = tuple(data["domains"])
+        self.loaded_at = time.time()
+
+        skills = []
+        ats_categories = []
+        domains = []
+        aliases: Dict[str, str] = {}
+        patterns: Dict[str, str] = {}
+        listed_names: Dict[str, str] = {}
+
+        for entry in data["skills"]:
+            name = entry["name"]
+            skills.append(name)
+            ats_categories.append(entry.get("ats_category"))
+            domains.append(entry.get("domain"))
+
+            # names that are ordinary words only match via aliases ("go"), or
+            # also in text known to list skills ("excel", see find_listed_skills)
+            match_name = entry.get("match_name", True)
+            names = ([name] if match_name is True else []) + entry.get("aliases", [])
+            if match_name == "lists":
+                listed_names[name] = name
+            for alias in [name] + entry.get("aliases", []):
+                aliases[normalize(alias)] = name
+            for alias in names:
+                patterns[alias] = name
+
+        self.skills: tuple[str, ...] = tuple(skills)
+        self.skill_ids: Mapping[str, int] = MappingProxyType(
+            {name: index for index, name in enumerate(skills)}
+        )
+        self.aliases: Mapping[str, str] = MappingProxyType(aliases)
+        # indexed by skill id
+        self.ats_categories: tuple[Optional[str], ...] = tuple(ats_categories)
+        self.domains: tuple[Optional[str], ...] = tuple(domains)
+
+        self.matcher = SkillMatcher(patterns)
+        self.listed_name_matcher = SkillMatcher(listed_names)
+
+        # domain hints inside free-form phrases ("aws lambda functions", "rest api design")
+        domain_patterns = {
+            alias: self.domains[self.skill_ids[name]]
+            for alias, name in patterns.items()
+            if self.domains[self.skill_ids[name]]
+        }
+        for domain, keywords in data.get("domain_keywords", {}).items():
+            for keyword in keywords:
+                domain_patterns[keyword] = domain
+        self.domain_matcher = SkillMatcher(domain_patterns)
+        self._domain_rank = {domain: rank for rank, domain in enumerate(self.domain_names)}
+
+    def canonical(self, skill: str) -> Optional[str]:
+        """Canonical name for a skill or any of its aliases, else None."""
+        return self.aliases.get(normalize(skill).strip())
+
+    def ats_category(self, skill: str) -> Optional[str]:
+        name = self.canonical(skill)
+        return self.ats_categories[self.skill_ids[name]] if name else None
+
+    def domain(self, skill: str) -> Optional[str]:
+        """
+        Job-matching domain of a skill or skill phrase.
+
+        Known skills are a direct lookup; other phrases take the highest
+        ranked domain of any skill or keyword they contain.
+        """
+        name = self.canonical(skill)
+        if name:
+            domain = self.domains[self.skill_ids[name]]
+            if domain:
+                return domain
+
+        found = {match.skill for match in self.domain_matcher.find(skill)}
+        if not found:
+            return None
+        return min(found, key=self._domain_rank.__getitem__)
+
+    def find_skills(self, text: str) -> List[str]:
+        """Sorted canonical skills mentioned in the text."""
+        return self.matcher.find_skills(text)
+
+    def find_listed_skills(self, text: str) -> List[str]:
+        """
+        `find_skills` for text known to list skills (a resume skills section,
+        a tech-stack line, job requirements), where names that are also
+        ordinary words ("Express", "Excel") count as well.
+        """
+        found = set(self.matcher.find_skills(text))
+        found.update(self.listed_name_matcher.find_skills(text))
+        return sorted(found)
+
+    def info(self) -> Dict:
+        return {
+            "version": self.version,
+            "skills": len(self.skills),
+            "aliases": len(self.aliases),
+            "loaded_at": self.loaded_at,
+        }
+
+
+def taxonomy_digest(data: Dict) -> str:
+    """Short hash of the taxonomy content, independent of key order and formatting."""
+    content = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+
+
+def validate_taxonomy(data: Dict) -> None:
+    """
+    Check taxonomy data before anything is compiled from it.
+
+    Raises:
+        TaxonomyError: describing the first problem found
+    """
+    for field in ("version", "ats_categories", "domains", "skills"):
+        if field not in data:
+            raise TaxonomyError(f"Taxonomy is missing '{field}'")
+
+    ats_categories = set(data["ats_categories"])
+    domains = set(data["domains"])
+    names = set()
+
+    for entry in data["skills"]:
+        name = entry.get("name")
+        if not name or not isinstance(name, str):
+            raise TaxonomyError(f"Skill entry without a name: {entry}")
+        if name in names:
+            raise TaxonomyError(f"Duplicate skill '{name}'")
+        names.add(name)
+
+        if entry.get("ats_category") not in ats_categories | {None}:
+            raise TaxonomyError(f"Unknown ATS category for '{name}': {entry['ats_category']}")
+        if entry.get("domain") not in domains | {None}:
+            raise TaxonomyError(f"Unknown domain for '{name}': {entry['domain']}")
+        if entry.get("match_name", True) not in (True, False, "lists"):
+            raise TaxonomyError(f"Invalid match_name for '{name}': {entry['match_name']!r}")
+
+    for domain in data.get("domain_keywords", {}):
+        if domain not in domains:
+            raise TaxonomyError(f"Unknown domain in domain_keywords: {domain}")
+
+
+def load_taxonomy(path: str = SKILL_TAXONOMY_PATH) -> SkillTaxonomy:
+    with open(path, "r", encoding="utf-8") as f:
+        return SkillTaxonomy(json.load(f))
+
+
+_taxonomy = load_taxonomy()
+_reload_lock = threading.Lock()
+_pinned: ContextVar[Optional[SkillTaxonomy]] = ContextVar("pinned_taxonomy", default=None)
+
+
+def get_taxonomy() -> SkillTaxonomy:
+    """
+    The taxonomy for the current request.
+
+    Returns the pinned taxonomy inside `pinned_taxonomy()`, else the current
+    shared one. Look it up per call rather than holding on to it.
+    """
+    return _pinned.get() or _taxonomy
+
+
+@contextmanager
+def pinned_taxonomy() -> Iterator[SkillTaxonomy]:
+    """Keep the current taxonomy for the duration of the block, across reloads."""
+    taxonomy = get_taxonomy()
+    token = _pinned.set(taxonomy)
+    try:
+        yield taxonomy
+    finally:
+        _pinned.reset(token)
+
+
+def _swap(taxonomy: SkillTaxonomy) -> SkillTaxonomy:
+    global _taxonomy
+    previous = _taxonomy
+    _taxonomy = taxonomy
+    logger.info("Skill taxonomy %s -> %s (%d skills)", previous.version, taxonomy.version, len(taxonomy.skills))
+    return taxonomy
+
+
+def reload_taxonomy(path: str = SKILL_TAXONOMY_PATH) -> SkillTaxonomy:
+    """
+    Rebuild the taxonomy from its file and swap it in.
+
+    The new matchers are compiled on the calling thread (run it off the
+    event loop); the shared taxonomy only changes once they are complete.
+
+    Raises:
+        TaxonomyError, OSError, ValueError: the current taxonomy is kept
+    """
+    with _reload_lock:
+        return _swap(load_taxonomy(path))
+
+
+def replace_taxonomy(data: Dict, path: str = SKILL_TAXONOMY_PATH) -> SkillTaxonomy:
+    """
+    Compile new taxonomy data, persist it to the taxonomy file and swap it in.
+
+    The file is the source of truth for worker processes, so it is written
+    (atomically) before the in-process swap.
+    """
+    with _reload_lock:
+        taxonomy = SkillTaxonomy(data)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+
+        return _swap(taxonomy)
+
+
+def ensure_taxonomy_version(version: str, path: str = SKILL_TAXONOMY_PATH) -> SkillTaxonomy:
+    """Reload from the file if this process is behind `version` (used by worker processes)."""
+    if get_taxonomy().version != version:
+        reload_taxonomy(path)
+    return get_taxonomy()
+
+
+_watcher: Optional[threading.Thread] = None
+
+
+def _watch(path: str, interval: float) -> None:
+    last_mtime = os.stat(path).st_mtime
+    while True:
+        time.sleep(interval)
+        try:
+            mtime = os.stat(path).st_mtime
+            if mtime == last_mtime:
+                continue
+            last_mtime = mtime
+            reload_taxonomy(path)
+        except Exception:
+            logger.exception("Skill taxonomy reload from %s failed; keeping version %s", path, _taxonomy.version)
+
+
+def start_taxonomy_watcher(path: str = SKILL_TAXONOMY_PATH, interval: float = SKILL_TAXONOMY_WATCH_SECONDS) -> None:
+    """Reload the taxonomy whenever its file changes (no-op if interval is 0)."""
+    global _watcher
+    if interval <= 0 or _watcher is not None:
+        return
+    _watcher = threading.Thread(target=_watch, args=(path, interval), name="taxonomy-watcher", daemon=True)
+    _watcher.start()
@@ -0,0 +1,135 @@
+"""
+spaCy Model Service
+Lazy, trimmed loading of the spaCy pipeline used for job description parsing.
+
+The model is loaded on first use, or ahead of time by a background warmup
+thread started with the app, so importing the service (and serving /health)
+never waits for it. Only the components job skill extraction reads are
+loaded: the parser for noun chunks, NER, and the tagger / attribute ruler
+that give the POS tags noun chunking depends on. The lemmatizer is excluded.
+The job skill components (app/services/job_skill_components.py) are added
+after loading, so skill candidates are collected in the same pass.
+
+The model must be installed with the image (`python -m spacy download
+en_core_web_sm` in the Dockerfile). A missing model fails fast with
+SpacyModelUnavailable; nothing is ever downloaded at runtime.
+"""
+
+from typing import Dict, Optional
+import logging
+import os
+import threading
+import time
+
+import spacy
+from spacy.language import Language
+
+from app.services.metrics import stage
+# registers the component factories
+from app.services import job_skill_components  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+# Components never used by job skill extraction
+SPACY_EXCLUDE = ["lemmatizer"]
+# Added after loading, in order
+SPACY_COMPONENTS = ["job_skill_candidates"]
+# Load the model in a background thread at startup instead of on first request
+SPACY_WARMUP = os.getenv("SPACY_WARMUP", "true").lower() in ("1", "true", "yes")
+
+
+class SpacyModelUnavailable(RuntimeError):
+    """The spaCy model is not installed or failed to load."""
+
+
+_nlp: Optional[Language] = None
+_error: Optional[str] = None
+_state = "not_loaded"
+_load_seconds: Optional[float] = None
+_load_lock = threading.Lock()
+
+
+def get_nlp() -> Language:
+    """
+    The shared spaCy pipeline, loading it on first call.
+
+    Raises:
+        SpacyModelUnavailable: the model is missing or broken; later calls
+            fail immediately with the same error
+    """
+    if _nlp is not None:
+        return _nlp
+    return _load()
+
+
+def _load() -> Language:
+    global _nlp, _error, _state, _load_seconds
+
+    # concurrent first calls wait for a single load
+    with _load_lock:
+        if _nlp is not None:
+            return _nlp
+        if _error is not None:
+            raise SpacyModelUnavailable(_error)
+
+        _state = "loading"
+        started = time.perf_counter()
+        try:
+            with stage("spacy_model.load"):
+                nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+                for component in SPACY_COMPONENTS:
+                    nlp.add_pipe(component)
+        except (OSError, ImportError, ValueError) as e:
+            _state = "failed"
+            _error = (
+                f"spaCy model '{SPACY_MODEL}' is not available ({e}). "
+                f"Install it with: python -m spacy download {SPACY_MODEL}"
+            )
+            logger.error(_error)
+            raise SpacyModelUnavailable(_error) from e
+
+        _load_seconds = time.perf_counter() - started
+        _nlp = nlp
+        _state = "ready"
+        logger.info("Loaded spaCy model %s (%s) in %.2fs", SPACY_MODEL, ", ".join(nlp.pipe_names), _load_seconds)
+        return nlp
+
+
+def _warmup() -> None:
+    try:
+        get_nlp()
+    except SpacyModelUnavailable:
+        # already logged; requests needing the model will get the same error
+        pass
+
+
+def start_warmup() -> Optional[threading.Thread]:
+    """Load the model in a background thread (no-op if disabled or already loaded)."""
+    if not SPACY_WARMUP or _state != "not_loaded":
+        return None
+    thread = threading.Thread(target=_warmup, name="spacy-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def is_ready() -> bool:
+    """
+    Whether the service can take traffic: the model is loaded, or warmup is
+    disabled (it loads on the first job-description parse) and no load has
+    failed. Otherwise readiness would wait for a request that never comes.
+    """
+    if _nlp is not None:
+        return True
+    return not SPACY_WARMUP and _state != "failed"
+
+
+def model_status() -> Dict:
+    return {
+        "model": SPACY_MODEL,
+        "state": _state,
+        "warmup": SPACY_WARMUP,
+        "pipeline": list(_nlp.pipe_names) if _nlp is not None else None,
+        "load_seconds": round(_load_seconds, 3) if _load_seconds is not None else None,
+        "error": _error,
+    }
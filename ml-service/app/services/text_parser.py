@@ -1,6 +1,8 @@
 from typing import Dict, List
 import re
 
+from app.services.metrics import timed
+
 
 class CoverLetterTextParser:
     """
@@ -8,6 +10,7 @@ class CoverLetterTextParser:
     Preserves paragraph structure whenever possible.
     """
 
+    @timed("text_parser.parse_text_response")
     def parse_text_response(self, text: str) -> Dict:
         lines = [l.rstrip() for l in text.split("\n")]
 
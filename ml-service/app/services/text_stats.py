@@ -0,0 +1,178 @@
+"""
+Text Stats
+One-pass document statistics shared by every ATS scorer.
+
+A single regex scan over the lowercased text yields word runs, sentence
+terminators and paragraph breaks. From that one stream it builds the TF-IDF
+term counts, the keyword-density word counts, and the sentence and paragraph
+word counts, and textstat's words and sentences for Flesch Reading Ease.
+The counts are exactly what the scorers' separate tokenizations (and
+textstat) produced before.
+"""
+
+from collections import Counter
+from typing import NamedTuple
+import re
+
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+from app.services.metrics import timed
+from app.services.readability import (
+    CONTRACTION_SUFFIXES,
+    MIN_SENTENCE_WORDS,
+    flesch_from_counts,
+    flesch_reading_ease
+)
+
+# one token per match: a word run, a paragraph break, a sentence terminator,
+# or a run of other non-space symbols; whitespace is the gap between matches
+SCAN_PATTERN = re.compile(r"(\w+)|(\n\n)|([.!?])|([^\s\w.!?]+)")
+
+# keyword density counts [a-z0-9]+ runs
+DENSITY_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class TextStats(NamedTuple):
+    is_blank: bool
+    # TF-IDF analyzer tokens (2+ word chars, no English stop words)
+    term_counts: Counter
+    # [a-z0-9]+ runs, for keyword density
+    word_counts: Counter
+    # whitespace-separated words per sentence / paragraph (blank ones skipped)
+    sentence_lengths: list[int]
+    paragraph_lengths: list[int]
+    flesch_reading_ease: float
+
+
+def _is_density_token(run: str) -> bool:
+    return run.isascii() and run.isalnum()
+
+
+def _lowercase_is_positional(content: str, lowered: str) -> bool:
+    # offsets into the lowered text index the original only if lowercasing
+    # kept every character in place (U+0130 expands) and was context-free
+    # (final sigma), which textstat's case-sensitive apostrophe rule needs
+    return len(lowered) == len(content) and "\u03a3" not in content
+
+
+def _apostrophes(content: str, start: int, end: int) -> str:
+    """The apostrophes of a symbol run that textstat keeps (contractions)."""
+    kept = ""
+    index = content.find("'", start, end)
+    while index != -1:
+        if content.startswith(CONTRACTION_SUFFIXES, index + 1):
+            kept += "'"
+        index = content.find("'", index + 1, end)
+    return kept
+
+
+@timed("text_stats.compute_text_stats")
+def compute_text_stats(content: str) -> TextStats:
+    """Scan the document once and collect everything the ATS scorers read."""
+    if not content or not content.strip():
+        return TextStats(True, Counter(), Counter(), [], [], 0.0)
+
+    term_counts: Counter = Counter()
+    word_counts: Counter = Counter()
+    sentence_lengths: list[int] = []
+    paragraph_lengths: list[int] = []
+
+    sentence_words = 0
+    paragraph_words = 0
+    # end offset of the previous token, and whether it joins words onto it
+    last_end = -1
+    last_in_sentence_word = False
+    last_in_paragraph_word = False
+
+    # Flesch, as textstat tokenizes: a word is a whitespace-separated chunk
+    # with punctuation (but not contraction apostrophes) removed; a sentence
+    # runs from a word character to the next terminator and counts if it has
+    # more than MIN_SENTENCE_WORDS words
+    lowered = content.lower()
+    flesch_inline = _lowercase_is_positional(content, lowered)
+    flesch_words: Counter = Counter()
+    flesch_word = ""
+    flesch_sentences = 0
+    flesch_sentence_words = 0
+    in_flesch_sentence = False
+    chunk_in_sentence = False
+
+    for match in SCAN_PATTERN.finditer(lowered):
+        run, paragraph_break, terminator, symbols = match.groups()
+        start = match.start()
+        adjacent = start == last_end
+
+        if paragraph_break:
+            if paragraph_words:
+                paragraph_lengths.append(paragraph_words)
+            paragraph_words = 0
+            last_in_sentence_word = last_in_paragraph_word = False
+            last_end = match.end()
+            continue
+
+        # paragraph words are maximal non-space runs, terminators included
+        if not (adjacent and last_in_paragraph_word):
+            paragraph_words += 1
+            if flesch_word:
+                flesch_words[flesch_word] += 1
+                flesch_word = ""
+            chunk_in_sentence = False
+        last_in_paragraph_word = True
+
+        if terminator:
+            if sentence_words:
+                sentence_lengths.append(sentence_words)
+            sentence_words = 0
+            last_in_sentence_word = False
+            if in_flesch_sentence:
+                flesch_sentences += flesch_sentence_words > MIN_SENTENCE_WORDS
+                in_flesch_sentence = False
+        else:
+            # sentence words stop at terminators as well as whitespace
+            if not (adjacent and last_in_sentence_word):
+                sentence_words += 1
+            last_in_sentence_word = True
+
+        if run:
+            if len(run) >= 2 and run not in ENGLISH_STOP_WORDS:
+                term_counts[run] += 1
+            if _is_density_token(run):
+                word_counts[run] += 1
+            else:
+                word_counts.update(DENSITY_TOKEN_PATTERN.findall(run))
+
+            flesch_word += run
+            if not in_flesch_sentence:
+                in_flesch_sentence = True
+                flesch_sentence_words = 0
+                chunk_in_sentence = False
+            if not chunk_in_sentence:
+                flesch_sentence_words += 1
+                chunk_in_sentence = True
+        elif symbols and flesch_inline and "'" in symbols:
+            flesch_word += _apostrophes(content, start, match.end())
+
+        last_end = match.end()
+
+    if sentence_words:
+        sentence_lengths.append(sentence_words)
+    if paragraph_words:
+        paragraph_lengths.append(paragraph_words)
+
+    if flesch_inline:
+        if flesch_word:
+            flesch_words[flesch_word] += 1
+        if in_flesch_sentence:
+            flesch_sentences += flesch_sentence_words > MIN_SENTENCE_WORDS
+        flesch = flesch_from_counts(flesch_words, max(1, flesch_sentences))
+    else:
+        flesch = flesch_reading_ease(content)
+
+    return TextStats(
+        is_blank=False,
+        term_counts=term_counts,
+        word_counts=word_counts,
+        sentence_lengths=sentence_lengths,
+        paragraph_lengths=paragraph_lengths,
+        flesch_reading_ease=flesch,
+    )
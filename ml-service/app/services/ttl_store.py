@@ -0,0 +1,66 @@
+"""
+Bounded key-value store with per-entry TTL, used for server-side handles
+(analysis results, compiled job profiles).
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+import threading
+import time
+import uuid
+
+
+class TTLStore:
+    """
+    Thread-safe store holding at most `max_entries` items, each expiring
+    `ttl_seconds` after it was last written. The least recently used entry
+    is dropped when the store is full.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.expired = 0
+        self.evictions = 0
+
+    def put(self, value: Any, key: Optional[str] = None) -> str:
+        """Store `value` and return its id (a new one unless `key` is given)."""
+        key = key or uuid.uuid4().hex
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return key
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expired += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "expired": self.expired,
+            "evictions": self.evictions,
+        }
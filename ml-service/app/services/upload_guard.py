@@ -0,0 +1,177 @@
+"""
+Upload Guard Service
+Admission checks for uploaded resumes, run before any parsing.
+
+Uploads are memory-mapped from the temp file the multipart parser already
+spooled them to, so large files never sit in RAM as one bytes object and
+the parsers read the mapping directly.
+"""
+
+from typing import Optional
+import mmap
+import os
+import re
+import zipfile
+
+# Hard cap on upload size
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+
+# Structural limits checked on the raw bytes before pymupdf sees the file
+PDF_MAX_PAGE_COUNT = int(os.getenv("PDF_MAX_PAGE_COUNT", "200"))
+PDF_MAX_OBJECTS = int(os.getenv("PDF_MAX_OBJECTS", "100000"))
+
+# Zip bomb guard for DOCX
+DOCX_MAX_UNCOMPRESSED_BYTES = int(os.getenv("DOCX_MAX_UNCOMPRESSED_BYTES", str(100 * 1024 * 1024)))
+
+CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+PDF_MAGIC = b"%PDF-"
+ZIP_MAGIC = b"PK\x03\x04"
+
+PDF_OBJECT_PATTERN = re.compile(rb"\d+\s+\d+\s+obj\b")
+PDF_PAGE_PATTERN = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+PDF_PAGES_COUNT_PATTERN = re.compile(rb"/Count\s+(\d+)")
+# objects packed into object streams are not visible to PDF_OBJECT_PATTERN
+PDF_OBJSTM_PATTERN = re.compile(rb"/Type\s*/ObjStm[^>]*?/N\s+(\d+)|/N\s+(\d+)[^>]*?/Type\s*/ObjStm")
+
+
+class UploadRejected(ValueError):
+    """Raised when an upload fails an admission check."""
+
+    def __init__(self, detail: str, status_code: int = 422):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+
+
+class SpooledUpload:
+    """Read-only memory map over a spooled upload."""
+
+    def __init__(self, buffer: mmap.mmap):
+        self.buffer = buffer
+        self.size = len(buffer)
+
+    def close(self) -> None:
+        try:
+            self.buffer.close()
+        except BufferError:
+            # a parser still holds a view; the mapping is released with it
+            pass
+
+    def __enter__(self) -> "SpooledUpload":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def check_declared_type(filename: Optional[str], content_type: Optional[str]) -> str:
+    """
+    Validate the filename extension and declared content type.
+
+    Returns:
+        The file type ("pdf" or "docx")
+    """
+    if not filename:
+        raise UploadRejected("Unable to access the filename", status_code=400)
+
+    extension = filename.split(".")[-1].lower()
+    if extension not in CONTENT_TYPES:
+        raise UploadRejected("Unsupported file format. Please upload PDF or DOCX.")
+
+    if content_type not in CONTENT_TYPES.values():
+        raise UploadRejected("Invalid file type")
+
+    return extension
+
+
+def spool_upload(file, max_bytes: int = MAX_UPLOAD_BYTES) -> SpooledUpload:
+    """
+    Memory-map an uploaded file without reading it into memory.
+
+    Args:
+        file: Binary file object backing the upload (e.g. UploadFile.file)
+        max_bytes: Hard size cap
+
+    Returns:
+        SpooledUpload over the file contents
+    """
+    file.flush()
+    # fileno() moves an in-memory spooled file to disk if it hasn't been already
+    fd = file.fileno()
+    size = os.fstat(fd).st_size
+
+    if size == 0:
+        raise UploadRejected("Uploaded file is empty", status_code=400)
+    if size > max_bytes:
+        raise UploadRejected(
+            f"File too large (max {max_bytes // (1024 * 1024)} MB)",
+            status_code=413
+        )
+
+    return SpooledUpload(mmap.mmap(fd, 0, access=mmap.ACCESS_READ))
+
+
+def sniff_format(buffer) -> Optional[str]:
+    """Identify the file type from its magic bytes."""
+    if buffer[:5] == PDF_MAGIC:
+        return "pdf"
+
+    if buffer[:4] == ZIP_MAGIC:
+        try:
+            with zipfile.ZipFile(buffer) as archive:
+                if "word/document.xml" in archive.namelist():
+                    return "docx"
+        except zipfile.BadZipFile:
+            return None
+        finally:
+            buffer.seek(0)
+
+    return None
+
+
+def check_pdf_limits(buffer) -> None:
+    """Reject PDFs whose raw structure exceeds the page or object limits."""
+    objects = sum(1 for _ in PDF_OBJECT_PATTERN.finditer(buffer))
+    for match in PDF_OBJSTM_PATTERN.finditer(buffer):
+        objects += int(match.group(1) or match.group(2))
+
+    if objects > PDF_MAX_OBJECTS:
+        raise UploadRejected(f"PDF has too many objects (max {PDF_MAX_OBJECTS})", status_code=413)
+
+    pages = sum(1 for _ in PDF_PAGE_PATTERN.finditer(buffer))
+    declared = max((int(m.group(1)) for m in PDF_PAGES_COUNT_PATTERN.finditer(buffer)), default=0)
+
+    if max(pages, declared) > PDF_MAX_PAGE_COUNT:
+        raise UploadRejected(f"PDF has too many pages (max {PDF_MAX_PAGE_COUNT})", status_code=413)
+
+
+def check_docx_limits(buffer) -> None:
+    """Reject DOCX archives that would inflate past the uncompressed limit."""
+    try:
+        with zipfile.ZipFile(buffer) as archive:
+            inflated = sum(info.file_size for info in archive.infolist())
+    finally:
+        buffer.seek(0)
+
+    if inflated > DOCX_MAX_UNCOMPRESSED_BYTES:
+        raise UploadRejected("DOCX content is too large", status_code=413)
+
+
+def admit_upload(upload: SpooledUpload, file_type: str) -> None:
+    """
+    Run content checks on a spooled upload before it is parsed.
+
+    Raises:
+        UploadRejected: if the content doesn't match `file_type` or exceeds limits
+    """
+    if sniff_format(upload.buffer) != file_type:
+        raise UploadRejected("File content does not match its extension")
+
+    if file_type == "pdf":
+        check_pdf_limits(upload.buffer)
+    else:
+        check_docx_limits(upload.buffer)
@@ -0,0 +1,115 @@
+"""
+Benchmark: re-scoring many resumes with compute_ats_scores vs calling
+compute_ats_score once per resume.
+
+Builds synthetic analyses and texts, scores them both ways, checks the
+results are identical and reports resumes per second. The scoring stage
+(after the per-text TextStats scan, which both paths share) is also timed
+on its own.
+
+Usage:
+    python -m benchmarks.bench_ats_batch [--resumes 2000] [--words 600]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.ats_batch_scorer import compute_ats_scores, score_batch
+from app.services.ats_scorer import (
+    assemble_ats_result,
+    compute_ats_score,
+    score_keyword_optimization,
+    score_readability,
+    score_section_completeness,
+    score_skills
+)
+from app.services.text_stats import compute_text_stats
+from app.services.skill_taxonomy import get_taxonomy
+
+WORDS = (
+    "python fastapi docker react node kubernetes aws sql mongodb redis api backend "
+    "frontend service latency team led built shipped designed scalable pipeline data "
+    "model training deployment testing microservices cloud performance users growth "
+    "engineer intern project dashboard analytics automation monitoring security"
+).split()
+
+
+def build_resume(rng: random.Random, words: int, skills: list) -> tuple:
+    paragraphs = []
+    for _ in range(max(1, words // 60)):
+        sentences = [
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 18))).capitalize() + "."
+            for _ in range(4)
+        ]
+        paragraphs.append(" ".join(sentences))
+    content = "\n\n".join(paragraphs)
+
+    resume_skills = rng.sample(skills, rng.randint(2, 20))
+    sections = {name: rng.random() < 0.8 for name in ("skills", "education", "experience", "projects")}
+    analysis = {
+        "skills": resume_skills,
+        "sections": sections,
+        "raw_sections": {name: paragraphs[0] for name, found in sections.items() if found},
+        "education": [{"degree": "B.Tech"}] if rng.random() < 0.7 else [],
+        "experience": [{"role": "Intern"}] if rng.random() < 0.7 else [],
+        "projects": [],
+    }
+    return analysis, content
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--words", type=int, default=600)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    skills = list(get_taxonomy().skills)
+    resumes = [build_resume(rng, args.words, skills) for _ in range(args.resumes)]
+    analyses = [analysis for analysis, _ in resumes]
+    contents = [content for _, content in resumes]
+
+    # warm up the syllable cache for both runs
+    compute_ats_scores(analyses[:50], contents[:50])
+
+    started = time.perf_counter()
+    expected = [compute_ats_score(analysis, content) for analysis, content in resumes]
+    one_by_one = time.perf_counter() - started
+
+    started = time.perf_counter()
+    results = compute_ats_scores(analyses, contents)
+    batched = time.perf_counter() - started
+
+    stats = [compute_text_stats(content) for content in contents]
+
+    started = time.perf_counter()
+    for analysis, s in zip(analyses, stats):
+        assemble_ats_result(analysis, {
+            "sections": score_section_completeness(analysis),
+            "skills": score_skills(analysis),
+            "keywords": score_keyword_optimization(analysis, "", s),
+            "readability": score_readability("", s),
+        })
+    scoring_one_by_one = time.perf_counter() - started
+
+    started = time.perf_counter()
+    score_batch(analyses, stats)
+    scoring_batched = time.perf_counter() - started
+
+    mismatches = sum(1 for a, b in zip(expected, results) if a != b)
+    print(f"{args.resumes} resumes x ~{args.words} words, {mismatches} mismatches")
+    for label, single, batch in (
+        ("end to end", one_by_one, batched),
+        ("scoring only", scoring_one_by_one, scoring_batched),
+    ):
+        print(f"{label:>12}: one by one {single:6.2f}s ({args.resumes / single:7.0f}/s), "
+              f"batched {batch:6.2f}s ({args.resumes / batch:7.0f}/s)  {single / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
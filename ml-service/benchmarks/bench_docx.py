@@ -0,0 +1,74 @@
+"""
+Benchmark: streaming DOCX extraction vs the python-docx object model.
+
+Builds a synthetic resume-like DOCX (paragraphs plus tables) and times
+both extraction paths.
+
+Usage:
+    python -m benchmarks.bench_docx [--paragraphs 2000] [--tables 200] [--runs 5]
+"""
+
+import argparse
+import io
+import sys
+import os
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from docx import Document
+
+from app.services.resume_parser import extract_textdocs, extract_textdocs_dom
+
+
+def build_docx(paragraphs: int, tables: int) -> bytes:
+    doc = Document()
+    for i in range(paragraphs):
+        doc.add_paragraph(
+            f"Built and shipped feature {i} using Python, FastAPI and Docker, "
+            "reducing latency by 30% across services."
+        )
+    for i in range(tables):
+        table = doc.add_table(rows=4, cols=3)
+        for row in table.rows:
+            for cell in row.cells:
+                cell.text = f"Skill {i}"
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def measure(fn, data: bytes, runs: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn(data)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    fn(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--paragraphs", type=int, default=2000)
+    parser.add_argument("--tables", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    data = build_docx(args.paragraphs, args.tables)
+    print(f"DOCX size: {len(data) / 1024:.1f} KB "
+          f"({args.paragraphs} paragraphs, {args.tables} tables)")
+
+    for name, fn in (("streaming", extract_textdocs), ("python-docx", extract_textdocs_dom)):
+        seconds, peak = measure(fn, data, args.runs)
+        print(f"{name:>12}: {seconds * 1000:8.1f} ms   peak {peak / 1024 / 1024:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: job description skill extraction one at a time vs batched
+through `nlp.pipe` (extract_job_skills_batch).
+
+Builds synthetic job descriptions, extracts skills both ways, checks the
+results are identical and reports postings per second for each batch size
+and process count. Needs the spaCy model (SPACY_MODEL) to be installed.
+
+Usage:
+    python -m benchmarks.bench_jd_ingest [--postings 2000] [--batch-sizes 16,64,256] [--processes 1,2]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.job_skill_extractor import extract_job_skills, extract_job_skills_batch
+from app.services.skill_taxonomy import get_taxonomy
+
+FILLER = (
+    "we are looking for an engineer to build and scale services our team works on "
+    "data pipelines and customer facing products you will design review and ship code"
+).split()
+
+HEADERS = ["Requirements:", "Required Skills:", "Must have:", "Qualifications:"]
+
+
+def build_posting(rng: random.Random, skills: list) -> str:
+    intro = " ".join(rng.choice(FILLER) for _ in range(rng.randint(30, 80))).capitalize() + "."
+    bullets = [
+        f"- Experience with {rng.choice(skills)} and {rng.choice(skills)}"
+        for _ in range(rng.randint(4, 12))
+    ]
+    return "\n".join([intro, "", rng.choice(HEADERS)] + bullets)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--postings", type=int, default=2000)
+    parser.add_argument("--batch-sizes", default="16,64,256")
+    parser.add_argument("--processes", default="1,2")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    skills = list(get_taxonomy().skills)
+    postings = [build_posting(rng, skills) for _ in range(args.postings)]
+
+    # loads the model outside the timed runs
+    extract_job_skills(postings[0])
+
+    started = time.perf_counter()
+    expected = [extract_job_skills(posting) for posting in postings]
+    one_by_one = time.perf_counter() - started
+    print(f"{args.postings} postings")
+    print(f"{'one by one':>24}: {one_by_one:6.2f}s ({args.postings / one_by_one:6.0f}/s)")
+
+    for n_process in (int(n) for n in args.processes.split(",")):
+        for batch_size in (int(b) for b in args.batch_sizes.split(",")):
+            started = time.perf_counter()
+            results = [
+                skills for skills, _ in
+                extract_job_skills_batch(((p, None) for p in postings), batch_size=batch_size, n_process=n_process)
+            ]
+            elapsed = time.perf_counter() - started
+
+            mismatches = sum(1 for a, b in zip(expected, results) if a != b)
+            label = f"batch {batch_size}, {n_process} proc"
+            print(f"{label:>24}: {elapsed:6.2f}s ({args.postings / elapsed:6.0f}/s)  "
+                  f"{one_by_one / elapsed:.1f}x, {mismatches} mismatches")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: very long job descriptions parsed whole vs in chunked mode
+(extract_technical_skills_chunked).
+
+Builds postings of the given sizes that are mostly benefits/EEO boilerplate
+with a few skill paragraphs, then reports time for a whole-text parse and
+for the chunked mode, how many paragraphs the prefilter kept, and which
+skills differ. Needs the spaCy model (SPACY_MODEL) to be installed.
+
+Usage:
+    python -m benchmarks.bench_long_jd [--sizes-kb 25,50,100] [--budget 2.0]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.job_skill_extractor import (
+    extract_technical_skills_chunked,
+    finalize_skills,
+    has_skill_signal,
+    iter_paragraphs,
+    skills_from_doc
+)
+from app.services.skill_taxonomy import get_taxonomy
+from app.services.spacy_model import get_nlp
+
+BOILERPLATE = [
+    "We offer competitive benefits including medical, dental and vision coverage, paid time off, "
+    "parental leave and a generous retirement plan with company match.",
+    "We are an equal opportunity employer and do not discriminate on the basis of race, religion, "
+    "gender identity, sexual orientation, national origin, disability or veteran status.",
+    "By submitting an application you agree to our privacy policy. Reasonable accommodations are "
+    "available on request at any stage of the hiring process.",
+    "Our mission is to help people everywhere do their best work, and our culture values curiosity, "
+    "ownership and kindness in every interaction.",
+]
+
+
+def build_posting(rng: random.Random, size_kb: int, skills: list) -> str:
+    paragraphs = []
+    while sum(len(p) for p in paragraphs) < size_kb * 1024:
+        if rng.random() < 0.1:
+            picked = ", ".join(rng.sample(skills, 4))
+            paragraphs.append(f"Requirements:\n- Experience with {picked}\n- Strong knowledge of system design")
+        else:
+            paragraphs.append(rng.choice(BOILERPLATE))
+    return "\n\n".join(paragraphs)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes-kb", default="25,50,100")
+    parser.add_argument("--budget", type=float, default=2.0)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    skills = list(get_taxonomy().skills)
+    nlp = get_nlp()
+
+    for size_kb in (int(s) for s in args.sizes_kb.split(",")):
+        posting = build_posting(rng, size_kb, skills)
+        paragraphs = list(iter_paragraphs(posting))
+        kept = sum(1 for p in paragraphs if has_skill_signal(p))
+
+        started = time.perf_counter()
+        whole = finalize_skills(skills_from_doc(nlp(posting)))
+        whole_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        chunked = finalize_skills(extract_technical_skills_chunked(posting, time_budget=args.budget))
+        chunked_seconds = time.perf_counter() - started
+
+        print(f"{size_kb:4d} KB: {kept}/{len(paragraphs)} paragraphs parsed, "
+              f"whole {whole_seconds:6.2f}s, chunked {chunked_seconds:6.2f}s ({whole_seconds / chunked_seconds:.1f}x)")
+        print(f"         only in whole parse: {sorted(set(whole) - set(chunked))}")
+        print(f"         only in chunked:     {sorted(set(chunked) - set(whole))}")
+
+
+if __name__ == "__main__":
+    main()
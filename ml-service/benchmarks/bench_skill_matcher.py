@@ -0,0 +1,84 @@
+"""
+Benchmark: Aho-Corasick skill matching vs the per-skill substring scan.
+
+Grows a synthetic vocabulary (the taxonomy's skills plus generated ones) and
+times one scan of a resume-sized text with both approaches. The automaton's
+scan time should stay flat as the vocabulary grows.
+
+Usage:
+    python -m benchmarks.bench_skill_matcher [--sizes 100,1000,10000] [--runs 5]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.skill_matcher import SkillMatcher, normalize
+from app.services.skill_taxonomy import get_taxonomy
+
+SKILL_VOCAB = get_taxonomy().skills
+
+
+def build_vocabulary(size: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    vocabulary = set(SKILL_VOCAB)
+    while len(vocabulary) < size:
+        length = rng.randint(3, 12)
+        vocabulary.add("".join(rng.choice(string.ascii_lowercase) for _ in range(length)))
+    return sorted(vocabulary)
+
+
+def build_text(words: int, seed: int = 1) -> str:
+    rng = random.Random(seed)
+    filler = ["built", "shipped", "service", "latency", "team", "using", "with", "and"]
+    skills = sorted(SKILL_VOCAB)
+    return " ".join(
+        rng.choice(skills) if rng.random() < 0.1 else rng.choice(filler)
+        for _ in range(words)
+    )
+
+
+def substring_scan(vocabulary: list[str], text: str) -> list[str]:
+    normalized = normalize(text)
+    return sorted({skill for skill in vocabulary if normalize(skill) in normalized})
+
+
+def best_of(fn, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--words", type=int, default=800)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    text = build_text(args.words)
+    print(f"Text: {args.words} words ({len(text)} chars)")
+    print(f"{'vocab':>8} {'build ms':>10} {'automaton ms':>13} {'substring ms':>13}")
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        vocabulary = build_vocabulary(size)
+
+        started = time.perf_counter()
+        matcher = SkillMatcher(vocabulary)
+        build = time.perf_counter() - started
+
+        automaton = best_of(lambda: matcher.find_skills(text), args.runs)
+        substring = best_of(lambda: substring_scan(vocabulary, text), args.runs)
+        print(f"{size:>8} {build * 1000:>10.1f} {automaton * 1000:>13.2f} {substring * 1000:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import json
+import os
+import time
+
+from app.services.extraction_cache import ExtractionCache
+
+
+def entry(n: int) -> dict:
+    return {"text": f"resume {n} " + "x" * 100, "sections": {}}
+
+
+def disk_keys(cache_dir) -> set:
+    return {name[:-len(".json")] for _, _, names in os.walk(cache_dir) for name in names}
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    size = len(json.dumps(entry(0)))
+    cache = ExtractionCache(max_bytes=0, cache_dir=str(tmp_path), disk_max_bytes=3 * size)
+
+    for n in range(3):
+        cache.put(f"k{n}", entry(n))
+    assert cache.get("k0") == entry(0)
+    cache.put("k3", entry(3))
+
+    assert disk_keys(tmp_path) == {"k0", "k2", "k3"}
+    stats = cache.stats()["disk"]
+    assert stats["entries"] == 3 and stats["evictions"] == 1
+    assert stats["bytes"] <= stats["max_bytes"]
+
+
+def test_disk_tier_order_and_cap_survive_restart(tmp_path):
+    cache = ExtractionCache(max_bytes=0, cache_dir=str(tmp_path))
+    for n in range(3):
+        cache.put(f"k{n}", entry(n))
+    # k0 is the most recently used
+    now = time.time()
+    for n, key in enumerate(["k1", "k2", "k0"]):
+        os.utime(cache._path(key), (now + n, now + n))
+
+    size = os.path.getsize(cache._path("k0"))
+    reopened = ExtractionCache(max_bytes=0, cache_dir=str(tmp_path), disk_max_bytes=2 * size)
+
+    assert disk_keys(tmp_path) == {"k2", "k0"}
+    assert reopened.get("k0") == entry(0)
+    assert reopened.stats()["disk"]["entries"] == 2
+
+
+def test_stale_temp_files_are_removed(tmp_path, monkeypatch):
+    shard = tmp_path / "ab"
+    shard.mkdir()
+    stale = shard / "orphan.tmp"
+    fresh = shard / "in-progress.tmp"
+    stale.write_text("{")
+    fresh.write_text("{")
+    old = time.time() - 3600
+    os.utime(stale, (old, old))
+
+    ExtractionCache(max_bytes=0, cache_dir=str(tmp_path))
+    assert not stale.exists() and fresh.exists()
+
+    # a write that fails midway removes its own temp file
+    cache = ExtractionCache(max_bytes=0, cache_dir=str(tmp_path))
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json, "dump", fail)
+    cache.put("abc", entry(0))
+    assert sorted(p.name for p in shard.iterdir()) == ["in-progress.tmp"]
+    assert cache.stats()["disk"]["writes"] == 0
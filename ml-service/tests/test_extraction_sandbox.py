@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.extraction_sandbox import ExtractionTimeout, SandboxBusy, SandboxPool
+
+
+class FakeConn:
+    def __init__(self, reply):
+        self.reply = reply
+
+    def send(self, task):
+        pass
+
+    def poll(self, timeout):
+        # no reply reads as a wall-clock timeout
+        return self.reply is not None
+
+    def recv(self):
+        return self.reply
+
+
+class FakeWorker:
+    def __init__(self):
+        self.conn = FakeConn(("ok", {"text": "", "sections": {}}))
+        self.process = SimpleNamespace(pid=0)
+        self.tasks = 0
+        self.killed = False
+
+    def stop(self):
+        pass
+
+    def kill(self):
+        self.killed = True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(SandboxPool, "_spawn", lambda self: FakeWorker())
+    return SandboxPool(size=1, max_tasks_per_worker=3, queue_timeout=0.05)
+
+
+def test_failed_task_is_counted_on_the_worker_that_ran_it(pool):
+    pool.run(b"%PDF-", "pdf")
+    failing = pool._idle.queue[0]
+    failing.conn.reply = None
+
+    with pytest.raises(ExtractionTimeout):
+        pool.run(b"%PDF-", "pdf")
+
+    replacement = pool._idle.queue[0]
+    assert failing.killed and failing.tasks == 2
+    assert replacement is not failing and replacement.tasks == 0
+    assert pool.respawns == 1 and pool.recycles == 0
+
+
+def test_waiting_for_a_worker_times_out(pool):
+    held = pool._idle.get()
+
+    with pytest.raises(SandboxBusy):
+        pool.run(b"%PDF-", "pdf")
+
+    assert pool.queue_timeouts == 1 and pool.busy == 0
+    pool._idle.put(held)
+    assert pool.run(b"%PDF-", "pdf")["text"] == ""
+
+
+def test_a_failed_respawn_keeps_the_slot(pool, monkeypatch):
+    pool._idle.queue[0].conn.reply = None
+
+    def fail_to_spawn(self):
+        raise OSError("fork failed")
+
+    monkeypatch.setattr(SandboxPool, "_spawn", fail_to_spawn)
+    with pytest.raises(ExtractionTimeout):
+        pool.run(b"%PDF-", "pdf")
+    assert pool._idle.qsize() == 1 and pool.spawn_failures == 1
+
+    # still failing: the request is turned away, the slot is kept
+    with pytest.raises(SandboxBusy):
+        pool.run(b"%PDF-", "pdf")
+    assert pool._idle.qsize() == 1
+
+    # spawning works again: the slot gets a worker on its next use
+    monkeypatch.setattr(SandboxPool, "_spawn", lambda self: FakeWorker())
+    assert pool.run(b"%PDF-", "pdf")["text"] == ""
+    assert pool._idle.queue[0] is not None and pool.respawns == 1
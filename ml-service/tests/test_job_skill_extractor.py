@@ -0,0 +1,49 @@
+import time
+
+import spacy
+from spacy.language import Language
+from spacy.util import minibatch
+
+from app.services import job_skill_extractor
+
+CHUNK_SECONDS = 0.05
+
+
+class SlowParse:
+    """Parses in minibatches, like spaCy's trained components."""
+
+    def __init__(self):
+        self.parsed = 0
+
+    def __call__(self, doc):
+        time.sleep(CHUNK_SECONDS)
+        self.parsed += 1
+        return doc
+
+    def pipe(self, docs, batch_size=128):
+        for batch in minibatch(docs, size=batch_size):
+            yield from [self(doc) for doc in batch]
+
+
+@Language.factory("test_slow_parse")
+def create_slow_parse(nlp, name):
+    return SlowParse()
+
+
+def test_chunked_extraction_stops_feeding_chunks_at_the_deadline(monkeypatch):
+    nlp = spacy.blank("en")
+    slow_parse = nlp.add_pipe("test_slow_parse")
+    monkeypatch.setattr(job_skill_extractor, "get_nlp", lambda: nlp)
+    monkeypatch.setattr(job_skill_extractor, "skills_from_doc", lambda doc: [])
+
+    # 50 one-paragraph chunks, each with a taxonomy skill so none are prefiltered
+    text = "\n\n".join(f"Experience with Python {i}" for i in range(50))
+    budget = 2 * CHUNK_SECONDS
+
+    started = time.perf_counter()
+    job_skill_extractor.extract_technical_skills_chunked(text, time_budget=budget, max_chars=30)
+    elapsed = time.perf_counter() - started
+
+    # only chunks fed before the deadline are parsed (at most 3), none after it
+    assert 1 <= slow_parse.parsed <= 3
+    assert elapsed < budget + 2 * CHUNK_SECONDS
@@ -0,0 +1,74 @@
+import pymupdf
+
+from app.services.incremental_analyzer import splice_sections
+from app.services.resume_analyzer import extract_raw_sections
+from app.services.resume_parser import extract_pdf_document
+from app.services.section_segmenter import segment
+
+RESUME = """Jane Doe
+
+WORK EXPERIENCE
+Backend Intern, Acme (2023)
+
+SKILLS
+Python, Docker
+
+INTERNSHIPS
+Research Intern, Lab (2022)
+"""
+
+
+def test_headers_mapping_to_one_key_keep_every_section():
+    spans = segment(RESUME)
+    assert [span.key for span in spans] == ["experience", "skills", "experience"]
+
+    raw = extract_raw_sections(RESUME)
+    assert "Backend Intern, Acme" in raw["experience"]
+    assert "Research Intern, Lab" in raw["experience"]
+    assert raw["skills"] == "Python, Docker"
+
+
+def test_splice_replaces_a_repeated_section_as_a_whole():
+    content = splice_sections(RESUME, {"experience": "SDE Intern, Beta"})
+
+    raw = extract_raw_sections(content)
+    assert raw["experience"] == "SDE Intern, Beta"
+    assert raw["skills"] == "Python, Docker"
+    assert "Acme" not in content and "Lab" not in content
+
+
+def test_pdf_sections_with_a_repeated_key_are_concatenated():
+    doc = pymupdf.open()
+    page = doc.new_page()
+    y = 72
+    for text, size in [
+        ("Work Experience", 16), ("Backend Intern, Acme", 11),
+        ("Skills", 16), ("Python, Docker", 11),
+        ("Internships", 16), ("Research Intern, Lab", 11),
+    ]:
+        page.insert_text((72, y), text, fontsize=size)
+        y += 40
+
+    sections = extract_pdf_document(doc.tobytes()).sections
+    assert "Backend Intern, Acme" in sections["experience"]
+    assert "Research Intern, Lab" in sections["experience"]
+    assert sections["skills"] == "Python, Docker"
+
+
+def test_styled_lines_that_only_contain_a_header_word_are_not_headers():
+    doc = pymupdf.open()
+    page = doc.new_page()
+    y = 72
+    for text, size, font in [
+        ("Projects", 16, "helv"), ("Education Portal", 11, "hebo"), ("Built with Django", 11, "helv"),
+        ("Experience", 16, "helv"), ("Skills Academy Inc.", 13, "helv"), ("Backend Intern", 11, "helv"),
+        ("Skills Summary", 11, "hebo"), ("Python, Docker", 11, "helv"),
+    ]:
+        page.insert_text((72, y), text, fontsize=size, fontname=font)
+        y += 40
+
+    sections = extract_pdf_document(doc.tobytes()).sections
+    assert "education" not in sections
+    assert "Education Portal" in sections["projects"] and "Built with Django" in sections["projects"]
+    assert "Skills Academy Inc." in sections["experience"] and "Backend Intern" in sections["experience"]
+    assert sections["skills"] == "Python, Docker"
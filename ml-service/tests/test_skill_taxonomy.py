@@ -0,0 +1,60 @@
+import pytest
+
+from app.services.job_skill_extractor import select_skill_text
+from app.services.resume_analyzer import get_analysis
+from app.services.skill_taxonomy import SkillTaxonomy, get_taxonomy
+
+
+@pytest.mark.parametrize("text", [
+    "I excel at teamwork",
+    "Spring 2023 intern",
+    "Wrote lambda functions in a functional programming course",
+    "Built node graphs for route planning",
+    "Express your ideas clearly",
+    "Swift delivery of features",
+])
+def test_plain_english_words_are_not_skills(text):
+    assert get_taxonomy().find_skills(text) == []
+
+
+def test_explicit_skill_names_still_match():
+    found = get_taxonomy().find_skills(
+        "Node.js, MS Excel, AWS Lambda, Spring Framework, Express.js, Apple Swift"
+    )
+    assert set(found) >= {"node.js", "excel", "aws lambda", "spring", "express", "swift"}
+
+
+def test_plain_word_names_count_in_a_skills_section():
+    analysis = get_analysis("Jane Doe\nI excel at teamwork.\n\nSKILLS\nReact, Express, Node.js, Excel\n")
+    assert {"react", "express", "node.js", "excel"} <= set(analysis["skills"])
+
+    analysis = get_analysis("Jane Doe\nSkills: React, Express\n")
+    assert {"react", "express"} <= set(analysis["skills"])
+
+    # outside a skills list the same words stay ordinary English
+    analysis = get_analysis("Jane Doe\nI excel at teamwork and express ideas clearly.\n")
+    assert analysis["skills"] == []
+
+
+def test_plain_word_names_count_in_job_requirements():
+    text, listed = select_skill_text("We ship fast.\n\nRequirements:\n- Swift\n- Excel\n")
+    assert listed
+    assert {"swift", "excel"} <= set(get_taxonomy().find_listed_skills(text))
+
+    text, listed = select_skill_text("Swift delivery and a will to excel.")
+    assert not listed
+
+
+def test_version_changes_with_content_even_if_label_does_not():
+    data = {
+        "version": "1",
+        "ats_categories": ["tools"],
+        "domains": ["devops"],
+        "skills": [{"name": "docker", "ats_category": "tools", "domain": "devops"}],
+    }
+    edited = {**data, "skills": data["skills"] + [{"name": "kubernetes", "aliases": ["k8s"]}]}
+    reordered = {key: data[key] for key in reversed(list(data))}
+
+    assert SkillTaxonomy(data).version.startswith("1-")
+    assert SkillTaxonomy(edited).version != SkillTaxonomy(data).version
+    assert SkillTaxonomy(reordered).version == SkillTaxonomy(data).version
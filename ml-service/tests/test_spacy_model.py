@@ -0,0 +1,15 @@
+from app.services import spacy_model
+
+
+def test_ready_without_warmup_until_a_load_fails(monkeypatch):
+    monkeypatch.setattr(spacy_model, "_nlp", None)
+    monkeypatch.setattr(spacy_model, "_state", "not_loaded")
+
+    monkeypatch.setattr(spacy_model, "SPACY_WARMUP", True)
+    assert not spacy_model.is_ready()
+
+    monkeypatch.setattr(spacy_model, "SPACY_WARMUP", False)
+    assert spacy_model.is_ready()
+
+    monkeypatch.setattr(spacy_model, "_state", "failed")
+    assert not spacy_model.is_ready()
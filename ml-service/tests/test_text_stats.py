@@ -0,0 +1,18 @@
+import pytest
+import textstat
+
+from app.services.text_stats import compute_text_stats
+
+TEXTS = [
+    "Built REST APIs in Python. Led a team of five engineers!",
+    "e.g. this is it. U.S.A. based role?",
+    "DON'T stop. We've shipped it's done; 'quoted' rock'n'roll O'Brien.",
+    "'SKILLS Python, Docker\n\nEXPERIENCE\nBackend Intern, Acme (2023) - well-known café",
+    "Σ and ΟΔΟΣ-Α in İstanbul. Naïve straße ﬁle test here.",
+    "!! ... ?",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_flesch_matches_textstat(text):
+    assert compute_text_stats(text).flesch_reading_ease == textstat.flesch_reading_ease(text)